@@ -0,0 +1,210 @@
+"""
+Benchmark for crawler content extractors.
+
+Compares the extractors Crawler can use (single-pass selector heuristics and the
+readability engine) against the previous BeautifulSoup selector chain and
+readabilipy on the saved HTML pages in ./corpus, reporting throughput (pages/s),
+peak memory per page and extraction quality.
+
+Quality is measured against the hand-written main-content reference next to each
+page (corpus/<page>.txt): recall is the share of reference words found in the
+extracted text, precision the share of extracted words that belong to the reference
+(boilerplate such as menus, bylines or related links lowers it).
+
+Usage:
+    python benchmarks/extractor_bench.py [--iterations 50] [--scale 1] [--with-node]
+
+--scale repeats each page body N times to simulate large pages.
+--with-node also runs readabilipy with Mozilla Readability.js (requires Node.js and
+readabilipy's node_modules; this is what src/crawler/readability_extractor.py uses).
+Without it readabilipy runs in its pure-Python mode. readabilipy rows are skipped
+when the package is not installed.
+"""
+import os
+import re
+import sys
+import time
+import argparse
+import tracemalloc
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from src.crawler.article import Article
+from src.crawler.html_extractor import extract_html
+from src.crawler.readability_engine import extract_readable
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+
+def legacy_extract(content: bytes) -> tuple[str, str]:
+    """The selector-chain extractor Crawler.crawl used before the single-pass extractor."""
+    soup = BeautifulSoup(content, 'html.parser')
+    for script in soup(["script", "style", "nav", "footer", "header"]):
+        script.decompose()
+    title = soup.title.string.strip() if soup.title and soup.title.string else "No Title"
+
+    content = ""
+    content_selectors = [
+        soup.find('article'),
+        soup.find('main'),
+        soup.find('div', class_='content'),
+        soup.find('div', class_='article'),
+        soup.find('div', class_='post'),
+        soup.find('div', id='content'),
+        soup.find('div', id='main'),
+        soup.body
+    ]
+    main_content = next((selector for selector in content_selectors if selector), None)
+
+    if main_content:
+        text_elements = []
+        for heading in main_content.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+            text = heading.get_text().strip()
+            if text:
+                text_elements.append(f"\n## {text}\n")
+        for p in main_content.find_all('p'):
+            text = p.get_text().strip()
+            if text and len(text) > 20:
+                text_elements.append(text)
+        for li in main_content.find_all('li'):
+            text = li.get_text().strip()
+            if text:
+                text_elements.append(f"- {text}")
+        content = '\n\n'.join(text_elements)
+
+    if not content or len(content) < 100:
+        content = soup.get_text(separator='\n', strip=True)
+        content = '\n'.join([line for line in content.split('\n') if line.strip()])
+    return title, content
+
+
+def readabilipy_python_extract(content: bytes) -> tuple[str, str]:
+    """readabilipy without Node.js (its own BeautifulSoup-based simplifier)."""
+    from readabilipy import simple_json_from_html_string
+
+    article = simple_json_from_html_string(content.decode("utf-8", errors="replace"), use_readability=False)
+    article = Article(title=article.get("title"), html_content=article.get("content"))
+    return article.title, article.text
+
+
+def readabilipy_node_extract(content: bytes) -> tuple[str, str]:
+    """readabilipy with Readability.js, exactly as ReadabilityExtractor runs it."""
+    from src.crawler.readability_extractor import ReadabilityExtractor
+
+    article = ReadabilityExtractor().extract_article(content.decode("utf-8", errors="replace"))
+    return article.title, article.text
+
+
+EXTRACTORS = {
+    "legacy (bs4 selector chain)": legacy_extract,
+    "single-pass (lxml target)": extract_html,
+    "readability engine": extract_readable,
+}
+
+
+def load_corpus(scale: int = 1) -> dict[str, bytes]:
+    pages = {}
+    for name in sorted(os.listdir(CORPUS_DIR)):
+        if not name.endswith(".html"):
+            continue
+        with open(os.path.join(CORPUS_DIR, name), "rb") as f:
+            html = f.read()
+        if scale > 1:
+            # Repeat the <body> contents to simulate a large page
+            match = re.search(rb"<body[^>]*>(.*)</body>", html, re.DOTALL)
+            if match:
+                html = html[:match.start(1)] + match.group(1) * scale + html[match.end(1):]
+        pages[name] = html
+    return pages
+
+
+def load_references() -> dict[str, str]:
+    references = {}
+    for name in sorted(os.listdir(CORPUS_DIR)):
+        if name.endswith(".txt"):
+            with open(os.path.join(CORPUS_DIR, name), encoding="utf-8") as f:
+                references[name[:-4] + ".html"] = f.read()
+    return references
+
+
+def _words(text: str) -> Counter:
+    return Counter(re.findall(r"\w+", text.lower()))
+
+
+def score_extraction(extracted: str, reference: str) -> tuple[float, float]:
+    """(recall, precision) of extracted words against the reference text, counting repeats."""
+    extracted_words, reference_words = _words(extracted), _words(reference)
+    overlap = sum((extracted_words & reference_words).values())
+    recall = overlap / max(sum(reference_words.values()), 1)
+    precision = overlap / max(sum(extracted_words.values()), 1)
+    return recall, precision
+
+
+def measure_quality(extract, pages: dict[str, bytes], references: dict[str, str]) -> dict[str, tuple[float, float]]:
+    return {name: score_extraction(extract(pages[name])[1], reference)
+            for name, reference in references.items() if name in pages}
+
+
+def measure_throughput(extract, pages: dict[str, bytes], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for html in pages.values():
+            extract(html)
+    elapsed = time.perf_counter() - start
+    return iterations * len(pages) / elapsed
+
+
+def measure_peak_memory(extract, pages: dict[str, bytes]) -> int:
+    peak = 0
+    for html in pages.values():
+        tracemalloc.start()
+        extract(html)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawler extractor benchmark")
+    parser.add_argument("--iterations", type=int, default=50, help="Passes over the corpus (default: 50)")
+    parser.add_argument("--scale", type=int, default=1, help="Repeat each page body N times (default: 1)")
+    parser.add_argument("--with-node", action="store_true", help="Also run readabilipy with Readability.js (Node.js)")
+    args = parser.parse_args()
+
+    extractors = dict(EXTRACTORS)
+    try:
+        import readabilipy  # noqa: F401
+        extractors["readabilipy (python)"] = readabilipy_python_extract
+        if args.with_node:
+            extractors["readabilipy (Readability.js)"] = readabilipy_node_extract
+    except ImportError:
+        print("readabilipy is not installed - skipping readabilipy rows\n")
+
+    pages = load_corpus(args.scale)
+    references = load_references()
+    originals = load_corpus() if args.scale > 1 else pages  # 품질은 원본 페이지 기준
+    total_kb = sum(len(html) for html in pages.values()) / 1024
+    print(f"Corpus: {len(pages)} pages, {total_kb:.1f} KB (scale x{args.scale}), {args.iterations} iterations\n")
+    print(f"{'extractor':<32} {'pages/s':>10} {'peak mem/page':>15} {'recall':>8} {'precision':>10}")
+    print("-" * 79)
+    quality = {}
+    for name, extract in extractors.items():
+        extract(next(iter(pages.values())))  # warm-up
+        pages_per_sec = measure_throughput(extract, pages, args.iterations)
+        peak = measure_peak_memory(extract, pages)
+        quality[name] = measure_quality(extract, originals, references)
+        scores = quality[name].values()
+        recall = sum(r for r, _ in scores) / max(len(scores), 1)
+        precision = sum(p for _, p in scores) / max(len(scores), 1)
+        print(f"{name:<32} {pages_per_sec:>10.1f} {peak / 1024:>12.1f} KB {recall:>8.1%} {precision:>10.1%}")
+
+    print(f"\nRecall / precision per page\n{'page':<20}" + "".join(f" {name[:22]:>23}" for name in quality))
+    for page in references:
+        row = "".join(f" {quality[name][page][0]:>11.0%} / {quality[name][page][1]:>4.0%}   " for name in quality)
+        print(f"{page[:-5]:<20}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@ from src.graph.builder import build_graph
 
 # Import event queue for unified event processing
 from src.utils.event_queue import clear_queue
+from src.utils.run_hooks import start_run, end_run
 
 def remove_artifact_folder(folder_path="./artifacts/"):
     """
@@ -113,6 +114,7 @@ async def graph_streaming_execution(payload):
 
     # Initialize execution environment (without artifact cleanup)
     clear_queue()
+    start_run()  # Reset per-run tool state (crawler cache counters, etc.)
     print("\n=== Starting Queue-Only Event Stream ===")
 
     # Get user query from payload
@@ -128,32 +130,35 @@ async def graph_streaming_execution(payload):
     # Track whether we've processed planner's response
     planner_processed = False
 
-    # Stream events from graph execution
-    async for event in graph.stream_async(
-        {
-            "request": user_query,
-            "request_prompt": f"Here is a user request: <user_request>{user_query}</user_request>",
-            "user_input": user_query.lower()  # Pass "part1" or "part2" to router_planner_node
-        }
-    ):
-        # After planner completes, check Part1/Part2 and conditionally cleanup artifacts
-        if not planner_processed:
-            # Check if this is a planner completion event or if planner has completed
-            from src.graph.nodes import _global_node_states
-            shared_state = _global_node_states.get('shared', {})
-
-            # If planner has set is_part1 flag, perform conditional cleanup
-            if 'is_part1' in shared_state:
-                is_part1 = shared_state.get('is_part1', True)
-                artifact_folder = conditional_artifact_cleanup(is_part1)
-
-                # Store artifact folder path in shared state for agents to use
-                shared_state['artifact_folder'] = artifact_folder
-                shared_state['part1_folder'] = './artifacts/part1'  # reference from Part2
-
-                planner_processed = True
-
-        yield event
+    try:
+        # Stream events from graph execution
+        async for event in graph.stream_async(
+            {
+                "request": user_query,
+                "request_prompt": f"Here is a user request: <user_request>{user_query}</user_request>",
+                "user_input": user_query.lower()  # Pass "part1" or "part2" to router_planner_node
+            }
+        ):
+            # After planner completes, check Part1/Part2 and conditionally cleanup artifacts
+            if not planner_processed:
+                # Check if this is a planner completion event or if planner has completed
+                from src.graph.nodes import _global_node_states
+                shared_state = _global_node_states.get('shared', {})
+
+                # If planner has set is_part1 flag, perform conditional cleanup
+                if 'is_part1' in shared_state:
+                    is_part1 = shared_state.get('is_part1', True)
+                    artifact_folder = conditional_artifact_cleanup(is_part1)
+
+                    # Store artifact folder path in shared state for agents to use
+                    shared_state['artifact_folder'] = artifact_folder
+                    shared_state['part1_folder'] = './artifacts/part1'  # reference from Part2
+
+                    planner_processed = True
+
+            yield event
+    finally:
+        end_run()  # Report per-run tool statistics
 
     #########################
     ## modification END    ##
@@ -166,9 +171,16 @@ if __name__ == "__main__":
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Strands Agent Demo')
     parser.add_argument('--user_query', type=str, help='User query for the agent')
+    parser.add_argument('--refresh_feeds', action='store_true', help='Refresh the monitored feeds (feeds.txt) into the local corpus and exit')
     
     args, unknown = parser.parse_known_args()
 
+    # 정기 실행(cron 등)용: 피드만 갱신하고 종료
+    if args.refresh_feeds:
+        from src.tools.crawl_tool import refresh_feeds
+        print(refresh_feeds() or "Feed monitoring is disabled or the feed list is empty")
+        raise SystemExit(0)
+
     #########################
     ## modification START  ##
     #########################
@@ -1,7 +1,25 @@
 from .article import Article
-from .crawler import Crawler
+from .crawler import Crawler, CrawlError
+from .async_crawler import AsyncCrawler
+from .prefetch import Prefetcher
+from .spider import Spider
+from .article_index import ArticleIndex
+from .feed_watcher import FeedWatcher
+from .http_cache import HttpCache
+from .extractors import register_extractor
+from .host_scheduler import HostScheduler, HostUnavailable
 
 __all__ = [
     "Article",
     "Crawler",
+    "CrawlError",
+    "AsyncCrawler",
+    "Prefetcher",
+    "Spider",
+    "ArticleIndex",
+    "FeedWatcher",
+    "HttpCache",
+    "register_extractor",
+    "HostScheduler",
+    "HostUnavailable",
 ]
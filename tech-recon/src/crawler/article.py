@@ -6,19 +6,44 @@ from markdownify import markdownify as md
 
 class Article:
     url: str
-
-    def __init__(self, title: str, html_content: str):
+    final_url: str | None = None  # 리다이렉트 후 실제 URL (페이지의 상대 링크 기준), 크롤러가 채움
+
+    def __init__(self, title: str, html_content: str, plain_text: bool = False):
+        """
+        Args:
+            title: Article title
+            html_content: Article body (HTML, or already-extracted text when plain_text is True)
+            plain_text: The body is plain text produced by the crawler's extractors
+        """
         self.title = title
         self.html_content = html_content
+        self.plain_text = plain_text
+        self.links: list[tuple[str, str]] = []  # HTML 페이지의 (href, 링크 텍스트), 크롤러가 채움
+        # 변환 결과는 처음 요청될 때 한 번만 계산해서 재사용
+        self._markdown: dict[bool, str] = {}
+        self._message: list[dict] | None = None
+
+    @property
+    def text(self) -> str:
+        """Body as plain text without the title; returned as-is (no conversion) for extracted text."""
+        if self.plain_text:
+            return self.html_content
+        return self.to_markdown(including_title=False)
 
     def to_markdown(self, including_title: bool = True) -> str:
-        markdown = ""
-        if including_title:
-            markdown += f"# {self.title}\n\n"
-        markdown += md(self.html_content)
-        return markdown
+        if including_title not in self._markdown:
+            markdown = ""
+            if including_title:
+                markdown += f"# {self.title}\n\n"
+            markdown += self.html_content if self.plain_text else md(self.html_content)
+            self._markdown[including_title] = markdown
+        return self._markdown[including_title]
 
     def to_message(self) -> list[dict]:
+        """Markdown split into text and image_url parts (cached; do not mutate the returned list)."""
+        if self._message is not None:
+            return self._message
+
         image_pattern = r"!\[.*?\]\((.*?)\)"
 
         content: list[dict[str, str]] = []
@@ -31,4 +56,5 @@ class Article:
             else:
                 content.append({"type": "text", "text": part.strip()})
 
+        self._message = content
         return content
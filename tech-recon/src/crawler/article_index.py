@@ -0,0 +1,211 @@
+import os
+import re
+import math
+import time
+import sqlite3
+import threading
+from urllib.parse import urlsplit
+
+from .article import Article
+
+# 크롤러 HTTP 캐시와 같은 위치 (분기마다 같은 도메인을 재조사할 때 재사용)
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".cache", "tech-recon", "index", "articles.db")
+
+MAX_INDEXED_CHARS = 200_000  # 페이지당 저장하는 본문 길이 상한
+MIN_TERM_COVERAGE = 0.75     # 검색어 중 이 비율 이상이 본문/제목에 있어야 결과로 인정
+EVICT_TO_SHARE = 0.9         # max_rows를 넘으면 이 비율까지 오래된 항목을 제거
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+_STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in", "into", "is", "it", "of",
+    "on", "or", "that", "the", "to", "what", "which", "who", "with", "vs", "about",
+}
+_TAXONOMY_LINE = re.compile(r"^\s*(\d+)(?:\.(\d+))?\.?\s+(.+?)\s*$")
+
+
+def load_taxonomy(path: str) -> dict[str, list[str]]:
+    """
+    Parse a numbered domain list ("1. Domain" / "   1.1 Sub-domain") into {domain: [keywords]}.
+
+    Keywords are the domain and sub-domain names plus abbreviations given in parentheses,
+    e.g. "Industrial IoT (IIoT)" yields "industrial iot" and "iiot".
+    """
+    taxonomy: dict[str, list[str]] = {}
+    domain = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            match = _TAXONOMY_LINE.match(line)
+            if not match:
+                continue
+            name = match.group(3)
+            if match.group(2) is None:
+                domain = re.sub(r"\s*\(.*?\)", "", name)
+                taxonomy[domain] = []
+            elif domain is None:
+                continue
+            keywords = [re.sub(r"\s*\(.*?\)", "", name).lower()]
+            keywords += [abbr.lower() for abbr in re.findall(r"\(([^)]+)\)", name) if len(abbr) >= 3]
+            taxonomy[domain].extend(keywords)
+    return taxonomy
+
+
+def tag_domains(title: str, content: str, taxonomy: dict[str, list[str]], min_mentions: int = 2) -> list[str]:
+    """Domains whose keywords appear in the title or at least `min_mentions` times in the content."""
+    title, content = title.lower(), content.lower()
+    tags = []
+    for domain, keywords in taxonomy.items():
+        for keyword in keywords:
+            pattern = re.compile(rf"(?<!\w){re.escape(keyword)}(?!\w)")
+            if pattern.search(title) or len(pattern.findall(content)) >= min_mentions:
+                tags.append(domain)
+                break
+    return tags
+
+
+class IndexedArticle:
+    """A local search hit."""
+
+    def __init__(self, url: str, title: str, content: str, domain: str, tags: list[str], fetched_at: float,
+                 rank: float):
+        self.url = url
+        self.title = title
+        self.content = content
+        self.domain = domain
+        self.tags = tags
+        self.fetched_at = fetched_at
+        self.rank = rank
+
+    @property
+    def age_days(self) -> float:
+        return (time.time() - self.fetched_at) / 86400
+
+
+class ArticleIndex:
+    """
+    Persistent SQLite FTS5 full-text index of extracted articles.
+
+    Each URL keeps its latest title and text, host domain, technology-domain tags and fetch
+    time (when its content last changed). search() ranks with BM25 (title and tags weighted
+    above the body) and returns only hits covering most of the query terms; older hits are
+    reported separately as stale. Articles older than `retention_days` are dropped when the
+    index is opened, and the oldest are evicted beyond `max_rows`.
+    """
+
+    def __init__(self, path: str | None = None, taxonomy: dict[str, list[str]] | None = None,
+                 max_rows: int = 20000, retention_days: float = 365):
+        """
+        Args:
+            path: SQLite database file (default: ~/.cache/tech-recon/index/articles.db)
+            taxonomy: {domain: [keywords]} used to tag articles (see load_taxonomy)
+            max_rows: Maximum number of indexed articles, oldest evicted first (default: 20000, 0 keeps all)
+            retention_days: Articles fetched longer ago are dropped (default: 365, 0 keeps all)
+        """
+        self.path = path or DEFAULT_INDEX_PATH
+        self.taxonomy = taxonomy or {}
+        self.max_rows = max_rows
+        self.retention_days = retention_days
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            """CREATE VIRTUAL TABLE IF NOT EXISTS articles USING fts5(
+                url UNINDEXED,
+                title,
+                content,
+                tags,
+                domain UNINDEXED,
+                fetched_at UNINDEXED,
+                tokenize = 'unicode61 remove_diacritics 2'
+            )"""
+        )
+        if self.retention_days > 0:
+            self._db.execute("DELETE FROM articles WHERE fetched_at < ?", (time.time() - self.retention_days * 86400,))
+        self._rows = self._db.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        self._evict()
+        self._db.commit()
+
+    def add(self, url: str, article: Article) -> list[str]:
+        """
+        Index (or re-index) the article fetched from `url`.
+
+        An unchanged article (e.g. served again from the HTTP cache) keeps its fetch time,
+        so old content does not look fresh.
+
+        Returns:
+            The domain tags assigned to the article
+        """
+        content = article.text[:MAX_INDEXED_CHARS]
+        title = article.title or ""
+        with self._lock:
+            row = self._db.execute("SELECT title, content, tags FROM articles WHERE url = ?", (url,)).fetchone()
+            if row is not None and row[:2] == (title, content):
+                return [tag for tag in row[2].split("; ") if tag]
+        tags = tag_domains(title, content, self.taxonomy)
+        with self._lock:
+            deleted = self._db.execute("DELETE FROM articles WHERE url = ?", (url,)).rowcount
+            self._db.execute(
+                "INSERT INTO articles (url, title, content, tags, domain, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (url, title, content, "; ".join(tags), urlsplit(url).netloc.lower(), time.time()),
+            )
+            self._rows += 1 - deleted
+            self._evict()
+            self._db.commit()
+        return tags
+
+    def _evict(self) -> None:
+        """Drop the least recently fetched articles once there are more than max_rows (lock held)."""
+        if self.max_rows <= 0 or self._rows <= self.max_rows:
+            return
+        # 추가할 때마다 전체를 정렬하지 않도록 상한의 90%까지 한꺼번에 비움
+        excess = self._rows - int(self.max_rows * EVICT_TO_SHARE)
+        self._db.execute(
+            "DELETE FROM articles WHERE rowid IN (SELECT rowid FROM articles ORDER BY fetched_at ASC LIMIT ?)", (excess,)
+        )
+        self._rows -= excess
+
+    @staticmethod
+    def _terms(query: str) -> list[str]:
+        terms = [term for term in _TERM.findall(query.lower()) if term not in _STOP_WORDS]
+        return list(dict.fromkeys(terms))
+
+    def search(self, query: str, max_age: float, limit: int = 5) -> tuple[list[IndexedArticle], list[IndexedArticle]]:
+        """
+        Full-text search of the index.
+
+        Args:
+            query: Free-text query
+            max_age: Maximum age in seconds for a hit to count as fresh
+            limit: Maximum number of fresh hits
+
+        Returns:
+            (fresh hits, stale hits), each ranked best first
+        """
+        terms = self._terms(query)
+        if not terms:
+            return [], []
+        match = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        required = math.ceil(len(terms) * MIN_TERM_COVERAGE)
+        with self._lock:
+            rows = self._db.execute(
+                """SELECT url, title, content, domain, tags, fetched_at, bm25(articles, 0, 10, 1, 5) AS rank
+                   FROM articles WHERE articles MATCH ? ORDER BY rank LIMIT ?""",
+                (match, limit * 10),
+            ).fetchall()
+
+        fresh, stale = [], []
+        cutoff = time.time() - max_age
+        for url, title, content, domain, tags, fetched_at, rank in rows:
+            text = f"{title}\n{tags}\n{content}".lower()
+            if sum(1 for term in terms if re.search(rf"(?<!\w){re.escape(term)}(?!\w)", text)) < required:
+                continue
+            hit = IndexedArticle(url, title, content, domain, [t for t in tags.split("; ") if t], float(fetched_at), rank)
+            if hit.fetched_at >= cutoff:
+                if len(fresh) < limit:
+                    fresh.append(hit)
+            else:
+                stale.append(hit)
+        return fresh, stale
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
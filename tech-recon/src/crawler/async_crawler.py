@@ -0,0 +1,160 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from .article import Article
+from .crawler import Crawler
+
+
+class AsyncCrawler:
+    """
+    Batch crawler that fetches many URLs in parallel on top of a shared, pooled Crawler.
+
+    Concurrency is bounded globally (max_concurrency) and per host (max_per_host) with
+    asyncio semaphores; the blocking fetch/parse runs in a dedicated thread pool that shares
+    the Crawler's requests Session, so TLS/keep-alive connections are reused across the batch.
+
+    All coroutines run on a private background event loop. Sync callers (e.g. Strands tools)
+    should use `crawl_many_sync()` / `submit()` rather than `asyncio.run()`.
+    """
+
+    def __init__(self, crawler: Crawler | None = None, timeout=30, max_concurrency: int = 8, max_per_host: int = 2):
+        """
+        Initialize AsyncCrawler.
+
+        Args:
+            crawler: Shared Crawler instance (default: a new Crawler sized to max_concurrency)
+            timeout: Request timeout in seconds when creating the Crawler (default: 30)
+            max_concurrency: Maximum number of in-flight requests overall (default: 8)
+            max_per_host: Maximum number of in-flight requests per host (default: 2)
+        """
+        self.crawler = crawler or Crawler(timeout=timeout, pool_maxsize=max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="crawler")
+        self._global_limit = asyncio.Semaphore(max_concurrency)
+        # 호스트별 세마포어와 사용 중인 요청 수 (사용이 끝난 호스트는 제거되어 장기 실행 시에도 늘어나지 않음)
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._host_users: dict[str, int] = {}
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+
+    @asynccontextmanager
+    async def _host_limit(self, url: str):
+        """Hold one of the host's max_per_host slots (runs on the crawler loop only, so no lock is needed)."""
+        host = urlsplit(url).netloc.lower()
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        self._host_users[host] = self._host_users.get(host, 0) + 1
+        try:
+            async with self._host_limits[host]:
+                yield
+        finally:
+            self._host_users[host] -= 1
+            if not self._host_users[host]:
+                del self._host_users[host]
+                del self._host_limits[host]
+
+    async def crawl(self, url: str) -> Article:
+        """Crawl a single URL within the global and per-host concurrency limits."""
+        async with self._global_limit, self._host_limit(url):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.crawler.crawl, url)
+
+    async def crawl_many(self, urls: list[str]) -> list[Article | Exception]:
+        """
+        Crawl a batch of URLs in parallel.
+
+        Args:
+            urls: URLs to crawl (duplicates are fetched once)
+
+        Returns:
+            One entry per input URL, in input order: the Article, or the Exception raised for it
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.crawl(url) for url in unique_urls), return_exceptions=True)
+        by_url = dict(zip(unique_urls, results))
+        return [by_url[url] for url in urls]
+
+    async def crawl_first(self, urls: list[str], n: int, hedge_delay: float = 2.0) -> list[tuple[str, Article | Exception | None]]:
+        """
+        Hedged crawl: return as soon as `n` of the ranked candidate `urls` have been crawled.
+
+        The top `n` candidates start immediately. The next candidate is started whenever a
+        crawl fails, or when `hedge_delay` seconds pass without any crawl finishing, so a
+        slow host is raced by an alternative source instead of stalling the batch. Once `n`
+        crawls succeed the stragglers are cancelled (a fetch already running in a worker
+        thread finishes in the background and still fills the cache).
+
+        Args:
+            urls: Candidate URLs, best first (duplicates are ignored)
+            n: Number of successful crawls wanted
+            hedge_delay: Seconds without progress before an extra candidate is started (default: 2.0)
+
+        Returns:
+            (url, result) for every candidate that was started, in rank order: the Article,
+            the Exception raised for it, or None for a straggler cancelled after the quota was met
+
+        Raises:
+            ValueError: `n` is less than 1
+        """
+        if n < 1:
+            raise ValueError(f"n must be at least 1 (got {n})")
+        candidates = list(dict.fromkeys(urls))
+        results: dict[str, Article | Exception | None] = {}
+        running: dict[asyncio.Future, str] = {}
+        next_index = 0
+
+        def start_next() -> None:
+            nonlocal next_index
+            if next_index < len(candidates):
+                url = candidates[next_index]
+                next_index += 1
+                running[asyncio.ensure_future(self.crawl(url))] = url
+
+        for _ in range(min(n, len(candidates))):
+            start_next()
+
+        succeeded = 0
+        while running and succeeded < n:
+            done, _ = await asyncio.wait(running, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                start_next()  # 진행이 없으면 다음 후보로 헤지
+                continue
+            for future in done:
+                url = running.pop(future)
+                error = future.exception()
+                results[url] = error if error is not None else future.result()
+                if error is None:
+                    succeeded += 1
+                else:
+                    start_next()  # 실패한 자리는 다음 후보로 채움
+
+        for future, url in running.items():
+            future.cancel()
+            results[url] = None
+        return [(url, results[url]) for url in candidates if url in results]
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=self._loop.run_forever, name="async-crawler-loop", daemon=True)
+                thread.start()
+            return self._loop
+
+    def submit(self, coro) -> Future:
+        """Schedule a coroutine on the crawler's background loop and return a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def crawl_many_sync(self, urls: list[str]) -> list[Article | Exception]:
+        """Blocking wrapper around `crawl_many()` for sync callers."""
+        return self.submit(self.crawl_many(urls)).result()
+
+    def crawl_first_sync(self, urls: list[str], n: int, hedge_delay: float = 2.0) -> list[tuple[str, Article | Exception | None]]:
+        """Blocking wrapper around `crawl_first()` for sync callers."""
+        return self.submit(self.crawl_first(urls, n, hedge_delay)).result()
@@ -1,115 +1,256 @@
 import sys
 import requests
-from bs4 import BeautifulSoup
+from contextlib import nullcontext
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from .article import Article
+from .http_cache import HttpCache, CacheEntry
+from .host_scheduler import HostScheduler
+from .html_extractor import HtmlExtractor
+from .readability_engine import ReadabilityEngine
+from . import extractors
+
+# 브라우저처럼 보이는 사용자 에이전트 설정
+# Accept-Encoding은 urllib3가 실제로 디코딩할 수 있는 값만 광고 (brotli 모듈이 없으면 br 제외)
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Referer': 'https://www.google.com/',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+def create_session(pool_maxsize: int = 10) -> requests.Session:
+    """
+    Create a requests Session with a connection pool shared across crawls.
+
+    Args:
+        pool_maxsize: Maximum number of pooled connections kept per host
+
+    Returns:
+        A Session with keep-alive/TLS reuse and the default browser headers
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+CHUNK_SIZE = 64 * 1024
+
+# HTML 본문 추출 방식 - selectors: 고정 컨테이너 우선순위, readability: 텍스트 밀도 점수
+HTML_EXTRACTORS = {
+    'selectors': HtmlExtractor,
+    'readability': ReadabilityEngine,
+}
+
+def parse_html(body: bytes, charset: str | None = None, html_extractor: str = 'selectors') -> tuple[str, str, list[tuple[str, str]]]:
+    """
+    Extract (title, content, links) from a complete HTML document.
+
+    Used for pages above the offload threshold, which are parsed in the extractor process
+    pool; only this compact result is sent back to the crawler process.
+    """
+    extractor = HTML_EXTRACTORS[html_extractor](encoding=charset)
+    extractor.feed(body)
+    title, content = extractor.close()
+    return title, content, extractor.links
+
+def _html_article(title: str, content: str, links: list[tuple[str, str]]) -> Article:
+    article = Article(title=title, html_content=content, plain_text=True)
+    article.links = links
+    return article
+
+def parse_content_type(header: str | None) -> tuple[str, str | None]:
+    """Split a Content-Type header into (mime type, charset or None)."""
+    if not header:
+        return '', None
+    mime, _, params = header.partition(';')
+    charset = None
+    for param in params.split(';'):
+        key, _, value = param.strip().partition('=')
+        if key.lower() == 'charset' and value:
+            charset = value.strip('"\' ').lower()
+    return mime.strip().lower(), charset
+
+class CrawlError(Exception):
+    """Crawl failure; `host_failure` marks errors that count against the host (timeouts, blocking, 5xx)."""
+
+    def __init__(self, message: str, host_failure: bool = False):
+        super().__init__(message)
+        self.host_failure = host_failure
+
+def _is_host_failure(error: BaseException) -> bool:
+    return getattr(error, 'host_failure', False)
 
 class Crawler:
-    def __init__(self, timeout=30):
+    def __init__(self, timeout=30, session: requests.Session | None = None, pool_maxsize: int = 10,
+                 cache: HttpCache | None = None, max_bytes: int = 2 * 1024 * 1024,
+                 scheduler: HostScheduler | None = None, html_extractor: str = 'selectors',
+                 html_offload_bytes: int = 256 * 1024):
         """
         Initialize Crawler with configurable timeout.
 
         Args:
             timeout: Request timeout in seconds (default: 30)
+            session: Shared requests Session (default: a new pooled session)
+            pool_maxsize: Connection pool size per host when creating the session (default: 10)
+            cache: Persistent HTTP cache consulted before the network (default: no cache)
+            max_bytes: Maximum decoded bytes read per page; the rest is not downloaded (default: 2 MB)
+            scheduler: Per-host rate limit / circuit breaker for network requests (default: none)
+            html_extractor: HTML content extraction strategy, one of HTML_EXTRACTORS (default: 'selectors')
+            html_offload_bytes: HTML pages larger than this are parsed in the extractor process pool
+                                instead of the crawling thread; 0 parses everything in-process (default: 256 KB)
         """
+        if html_extractor not in HTML_EXTRACTORS:
+            raise ValueError(f"Unknown html_extractor '{html_extractor}' (expected one of {', '.join(HTML_EXTRACTORS)})")
         self.timeout = timeout
+        self.session = session or create_session(pool_maxsize)
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self.scheduler = scheduler
+        self.html_extractor = html_extractor
+        self.html_offload_bytes = html_offload_bytes
 
-    def crawl(self, url: str) -> Article:
-        # 브라우저처럼 보이는 사용자 에이전트 설정
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Referer': 'https://www.google.com/',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-
-        print(f"🔍 Crawling URL: {url} (timeout: {self.timeout}s)")
+    def fetch(self, url: str, entry: CacheEntry | None = None) -> CacheEntry | requests.Response:
+        """
+        Open `url` on the network.
 
-        # requests를 사용하여 웹 페이지 가져오기 (타임아웃 설정 추가)
+        If a stale cache `entry` is given it is revalidated with a conditional GET and
+        returned on 304 Not Modified. Otherwise the streaming Response is returned unread,
+        after rejecting content types that no registered extractor handles.
+        """
+        # 공유 Session으로 웹 페이지 가져오기 (커넥션/TLS 재사용, 타임아웃 설정, 본문은 스트리밍)
         try:
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            headers = entry.conditional_headers() if entry is not None else {}
+            response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+            if entry is not None and response.status_code == 304:
+                response.close()
+                self.cache.refresh(entry, response.headers)
+                self.cache.record_hit(entry, revalidated=True)
+                print(f"💾 Not modified (304): {url} ({len(entry.body)} bytes)")
+                return entry
             response.raise_for_status()  # 오류 발생 시 예외 발생
-            print(f"✅ Response received: {response.status_code} ({len(response.content)} bytes)")
         except requests.Timeout:
-            raise Exception(f"Request timeout after {self.timeout} seconds")
+            raise CrawlError(f"Request timeout after {self.timeout} seconds", host_failure=True)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else 0
+            raise CrawlError(f"Request failed: {str(e)}", host_failure=status in (403, 429) or status >= 500)
         except requests.RequestException as e:
-            raise Exception(f"Request failed: {str(e)}")
-        
-        # BeautifulSoup을 사용하여 HTML 파싱
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-
-        # 주요 콘텐츠 추출 - 다양한 선택자 시도
-        title = soup.title.string.strip() if soup.title and soup.title.string else "No Title"
-
-        # 본문 추출 - 여러 선택자 시도 (우선순위 순)
-        content = ""
-        content_selectors = [
-            soup.find('article'),
-            soup.find('main'),
-            soup.find('div', class_='content'),
-            soup.find('div', class_='article'),
-            soup.find('div', class_='post'),
-            soup.find('div', id='content'),
-            soup.find('div', id='main'),
-            soup.body  # 최후의 수단
-        ]
-
-        main_content = None
-        for selector in content_selectors:
-            if selector:
-                main_content = selector
-                break
-
-        if main_content:
-            # Extract all text content with better formatting
-            # Get all paragraphs, headings, and list items
-            text_elements = []
-
-            # Headings
-            for heading in main_content.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                text = heading.get_text().strip()
-                if text:
-                    text_elements.append(f"\n## {text}\n")
-
-            # Paragraphs
-            for p in main_content.find_all('p'):
-                text = p.get_text().strip()
-                if text and len(text) > 20:  # Filter out very short paragraphs
-                    text_elements.append(text)
-
-            # List items
-            for li in main_content.find_all('li'):
-                text = li.get_text().strip()
-                if text:
-                    text_elements.append(f"- {text}")
-
-            content = '\n\n'.join(text_elements)
-
-        # Fallback: if content is still empty, get all text
-        if not content or len(content) < 100:
-            content = soup.get_text(separator='\n', strip=True)
-            # Clean up multiple newlines
-            content = '\n'.join([line for line in content.split('\n') if line.strip()])
-
-        print(f"📄 Extracted: title='{title[:50]}...', content={len(content)} chars")
-        
-        # Article 객체 생성 및 반환
-        article = Article(
-            title=title,
-            html_content=content
-        )
-        #article.url = url
-        #article.title = title
-        #article.html_content = content
-        #article.images = images
-        
+            raise CrawlError(f"Request failed: {str(e)}", host_failure=isinstance(e, requests.ConnectionError))
+
+        mime, _ = parse_content_type(response.headers.get('Content-Type'))
+        if extractors.resolve_kind(mime) is None:
+            response.close()
+            raise CrawlError(f"Unsupported content type: {mime}")
+        if self.cache:
+            self.cache.record_miss()
+        return response
+
+    def _read_stream(self, url: str, response: requests.Response) -> Article:
+        """
+        Read the response body chunk by chunk (up to max_bytes) and extract an Article.
+
+        HTML is fed to the incremental extractor as it arrives until it exceeds
+        html_offload_bytes; larger pages are buffered and parsed in the extractor process
+        pool, so they do not hold the GIL of the agent process. Other kinds (PDF, JSON,
+        plain text) are buffered and handed to the extractor registry.
+        """
+        mime, charset = parse_content_type(response.headers.get('Content-Type'))
+        kind, html_extractor, chunks = None, None, []
+        received, truncated, offload = 0, False, False
+        try:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if kind is None:
+                    # 첫 청크의 매직 바이트로 형식 확정 (잘못 표기된 바이너리는 여기서 중단)
+                    kind = extractors.resolve_kind(mime, chunk)
+                    if kind is None:
+                        raise CrawlError(f"Unsupported binary content (Content-Type: {mime or 'none'})")
+                    if kind == 'html':
+                        html_extractor = HTML_EXTRACTORS[self.html_extractor](encoding=charset)
+                if received + len(chunk) > self.max_bytes:
+                    chunk, truncated = chunk[:self.max_bytes - received], True
+                received += len(chunk)
+                if html_extractor is not None and self.html_offload_bytes and received > self.html_offload_bytes:
+                    html_extractor, offload = None, True  # 큰 페이지는 다 받은 뒤 프로세스 풀에서 파싱
+                if html_extractor is not None:
+                    html_extractor.feed(chunk)
+                if html_extractor is None or self.cache or self.html_offload_bytes:
+                    chunks.append(chunk)  # HTML은 캐시 저장 또는 오프로드에 필요할 때만 보관 (max_bytes 이내)
+                if truncated:
+                    break
+        except requests.RequestException as e:
+            raise CrawlError(f"Request failed while reading body: {str(e)}", host_failure=True)
+        finally:
+            response.close()
+
+        print(f"✅ Response received: {response.status_code} ({received} bytes{', truncated' if truncated else ''})")
+        if self.cache and not truncated:
+            self.cache.store(url, b''.join(chunks), response.headers, final_url=response.url)
+
+        if offload:
+            return _html_article(*extractors.run_in_pool(parse_html, b''.join(chunks), charset, self.html_extractor))
+        if html_extractor is not None:
+            title, content = html_extractor.close()
+            return _html_article(title, content, html_extractor.links)
+        if truncated and kind == 'pdf':
+            raise CrawlError(f"PDF larger than {self.max_bytes} bytes")
+        return extractors.extract(kind or 'text', b''.join(chunks), charset)
+
+    def extract_body(self, body: bytes, content_type: str | None) -> Article:
+        """
+        Extract an article from a complete response body with this crawler's extractors.
+
+        Args:
+            body: Response body
+            content_type: Content-Type header of the response (may be None)
+
+        Raises:
+            CrawlError: The content is binary and not supported
+        """
+        mime, charset = parse_content_type(content_type)
+        kind = extractors.resolve_kind(mime, body[:1024])
+        if kind is None:
+            raise CrawlError(f"Unsupported binary content (Content-Type: {mime or 'none'})")
+        if kind == 'html':
+            if self.html_offload_bytes and len(body) > self.html_offload_bytes:
+                return _html_article(*extractors.run_in_pool(parse_html, body, charset, self.html_extractor))
+            return _html_article(*parse_html(body, charset, self.html_extractor))
+        return extractors.extract(kind, body, charset)
+
+    def _extract_cached(self, entry: CacheEntry) -> Article:
+        return self.extract_body(entry.body, entry.content_type)
+
+    def crawl(self, url: str) -> Article:
+        print(f"🔍 Crawling URL: {url} (timeout: {self.timeout}s)")
+
+        # 신선한 캐시 항목은 네트워크(및 호스트 스케줄러)를 거치지 않음
+        entry = self.cache.get(url) if self.cache else None
+        if entry is not None and entry.is_fresh:
+            self.cache.record_hit(entry)
+            print(f"💾 Cache hit: {url} ({len(entry.body)} bytes)")
+            article = self._extract_cached(entry)
+            article.final_url = entry.final_url
+        else:
+            slot = self.scheduler.slot(url, _is_host_failure) if self.scheduler else nullcontext()
+            with slot:
+                source = self.fetch(url, entry)
+                # Content-Type/매직 바이트로 추출기 선택 - HTML은 다운로드와 동시에 점진적으로 파싱
+                if isinstance(source, CacheEntry):
+                    article = self._extract_cached(source)
+                    article.final_url = source.final_url
+                else:
+                    article = self._read_stream(url, source)
+                    article.final_url = source.url or url
+
+        print(f"📄 Extracted: title='{article.title[:50]}...', content={len(article.html_content)} chars")
+
+        article.url = url
+
         return article
 
 if __name__ == "__main__":
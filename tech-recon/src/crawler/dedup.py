@@ -0,0 +1,151 @@
+import os
+import re
+import time
+import hashlib
+import threading
+
+FINGERPRINT_BITS = 64
+BANDS = 8  # 64비트를 8비트 8개 밴드로 나눔 - 해밍 거리 7 이하면 최소 한 밴드가 일치
+BAND_BITS = FINGERPRINT_BITS // BANDS
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(tokens: list[str], shingle_size: int = 2) -> int:
+    """64-bit SimHash over word shingles."""
+    weights = [0] * FINGERPRINT_BITS
+    shingles = [" ".join(tokens[i:i + shingle_size]) for i in range(max(len(tokens) - shingle_size + 1, 1))]
+    for shingle in shingles:
+        h = _hash64(shingle)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateIndex:
+    """
+    SimHash index of extracted article text for spotting syndicated copies.
+
+    Fingerprints are bucketed by 8-bit bands, so a lookup only compares against
+    candidates sharing a band. Entries live for one run (reset()) unless `path` is
+    given, in which case they are also appended to that file and reloaded; entries
+    older than `max_age_days` are dropped and at most `max_entries` are kept.
+
+    Which page contents the current agent has received is tracked separately
+    (new_scope()), so a copy is only reported as already received when this agent
+    actually got the original.
+    """
+
+    def __init__(self, max_distance: int = 7, min_tokens: int = 50, path: str | None = None,
+                 max_age_days: float = 30, max_entries: int = 50000):
+        """
+        Args:
+            max_distance: Maximum Hamming distance to count as a duplicate, at most BANDS - 1 (default: 7)
+            min_tokens: Texts with fewer words are never indexed or flagged (default: 50)
+            path: Optional file to persist fingerprints across runs
+            max_age_days: Persisted fingerprints older than this are dropped (default: 30, 0 keeps all)
+            max_entries: Maximum number of persisted fingerprints, newest kept (default: 50000)
+        """
+        self.max_distance = min(max_distance, BANDS - 1)
+        self.min_tokens = min_tokens
+        self.path = path
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget this run's pages (persisted fingerprints are reloaded)."""
+        with self._lock:
+            self._buckets: dict[tuple[int, int], list[tuple[int, str]]] = {}
+            self._fingerprints: dict[str, int] = {}  # url -> fingerprint
+            self._received: dict[str, str] = {}  # 인덱스의 url -> 현재 에이전트가 그 내용을 받은 url
+            self.duplicates_found = 0
+            if self.path and os.path.exists(self.path):
+                for fingerprint, url in self._load():
+                    self._insert(fingerprint, url)
+
+    def new_scope(self) -> None:
+        """Start a new agent scope: no page content has been received by it yet."""
+        with self._lock:
+            self._received = {}
+
+    def _load(self) -> list[tuple[int, str]]:
+        """Read the persisted fingerprints, rewriting the file without expired or excess entries."""
+        now = time.time()
+        entries: dict[str, tuple[int, float]] = {}
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                fields = line.rstrip("\n").split(" ", 2)
+                if len(fields) == 2:
+                    fields = [fields[0], str(now), fields[1]]  # 시각이 없는 이전 형식
+                if len(fields) == 3 and fields[2]:
+                    entries[fields[2]] = (int(fields[0], 16), float(fields[1]))
+        kept = sorted(entries.items(), key=lambda item: item[1][1])
+        if self.max_age_days > 0:
+            kept = [item for item in kept if now - item[1][1] <= self.max_age_days * 86400]
+        kept = kept[-self.max_entries:] if self.max_entries > 0 else kept
+        if len(kept) < len(entries):
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.writelines(f"{fingerprint:016x} {added:.0f} {url}\n" for url, (fingerprint, added) in kept)
+        return [(fingerprint, url) for url, (fingerprint, _) in kept]
+
+    def _bands(self, fingerprint: int):
+        mask = (1 << BAND_BITS) - 1
+        for band in range(BANDS):
+            yield band, fingerprint >> (band * BAND_BITS) & mask
+
+    def _insert(self, fingerprint: int, url: str) -> None:
+        self._fingerprints[url] = fingerprint
+        for key in self._bands(fingerprint):
+            self._buckets.setdefault(key, []).append((fingerprint, url))
+
+    def _find(self, fingerprint: int, url: str) -> str | None:
+        """Closest earlier near-identical page, preferring one whose content this agent received."""
+        matches = []
+        for key in self._bands(fingerprint):
+            for candidate, candidate_url in self._buckets.get(key, []):
+                if candidate_url != url and hamming_distance(candidate, fingerprint) <= self.max_distance:
+                    matches.append(candidate_url)
+        return next((match for match in matches if match in self._received), matches[0] if matches else None)
+
+    def check_and_add(self, url: str, text: str) -> tuple[str | None, str | None]:
+        """
+        Look up an earlier near-identical page, indexing this page if there is none.
+
+        Returns:
+            (duplicate_of, received_as): the earlier page's URL (None if the page is new) and,
+            if the current agent already received that content, the URL it received it under
+        """
+        tokens = _WORD.findall(text.lower())
+        if len(tokens) < self.min_tokens:
+            return None, None
+        fingerprint = simhash(tokens)
+        with self._lock:
+            duplicate_of = self._find(fingerprint, url)
+            if duplicate_of:
+                received_as = self._received.get(duplicate_of)
+                if received_as == url:
+                    return None, None  # 같은 사본을 다시 크롤링한 경우
+                if received_as:
+                    self.duplicates_found += 1
+                else:
+                    self._received[duplicate_of] = url  # 이 에이전트는 지금 이 사본으로 내용을 받음
+                return duplicate_of, received_as
+            self._received[url] = url
+            if self._fingerprints.get(url) == fingerprint:
+                return None, None  # 같은 페이지를 다시 크롤링한 경우
+            self._insert(fingerprint, url)
+            if self.path:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(f"{fingerprint:016x} {time.time():.0f} {url}\n")
+        return None, None
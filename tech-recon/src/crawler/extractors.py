@@ -0,0 +1,207 @@
+import io
+import os
+import json
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable
+
+from .article import Article
+from .html_extractor import extract_html
+
+# Extractor = (body bytes, charset or None) -> Article
+Extractor = Callable[[bytes, str | None], Article]
+
+_REGISTRY: dict[str, tuple[Extractor, bool]] = {}   # kind -> (extractor, heavy)
+_MIME_KINDS: dict[str, str] = {}                    # mime type -> kind
+
+# 매직 바이트로 판별하는 형식 (Content-Type보다 우선)
+_MAGIC_KINDS = [(b'%PDF-', 'pdf')]
+# 지원하지 않는 바이너리 시그니처 (zip, png, gif, jpeg, gzip)
+_BINARY_SIGNATURES = (b'PK\x03\x04', b'\x89PNG', b'GIF8', b'\xff\xd8\xff', b'\x1f\x8b')
+
+_pool: ProcessPoolExecutor | None = None
+_pool_slots: threading.BoundedSemaphore | None = None  # 풀에 제출된 작업 수 상한 (bounded queue)
+_pool_lock = threading.Lock()
+
+
+def register_extractor(kind: str, extractor: Extractor, mime_types: list[str], heavy: bool = False) -> None:
+    """
+    Register an extractor for a content kind.
+
+    Args:
+        kind: Content kind name (e.g. "html", "pdf")
+        extractor: Module-level function (body, charset) -> Article (must be picklable when heavy)
+        mime_types: Content-Types dispatched to this kind
+        heavy: Run in the extractor process pool instead of the calling thread
+    """
+    _REGISTRY[kind] = (extractor, heavy)
+    for mime in mime_types:
+        _MIME_KINDS[mime] = kind
+
+
+def resolve_kind(mime: str, head: bytes = b'') -> str | None:
+    """
+    Pick the extractor kind for a response from its magic bytes and Content-Type.
+
+    Args:
+        mime: Content-Type without parameters ('' when missing)
+        head: First bytes of the body (may be empty before the body is read)
+
+    Returns:
+        The registered kind, or None if the content is not supported
+    """
+    for magic, kind in _MAGIC_KINDS:
+        if head.startswith(magic):
+            return kind
+    if head and (head.startswith(_BINARY_SIGNATURES) or b'\x00' in head[:1024]):
+        return None
+
+    if mime in _MIME_KINDS:
+        kind = _MIME_KINDS[mime]
+    elif mime.endswith('+json'):
+        kind = 'json'
+    elif mime.endswith('+xml'):
+        kind = 'html'
+    elif mime.startswith('text/'):
+        kind = 'text'
+    elif not mime:
+        kind = 'html'  # Content-Type 없음 - 본문으로 판별
+    else:
+        return None
+
+    # text/plain 또는 미지정으로 온 JSON 응답
+    if kind in ('text', 'html') and head.lstrip()[:1] in (b'{', b'[') and mime in ('', 'text/plain'):
+        kind = 'json'
+    return kind
+
+
+def _get_pool() -> tuple[ProcessPoolExecutor, threading.BoundedSemaphore]:
+    global _pool, _pool_slots
+    with _pool_lock:
+        if _pool is None:
+            workers = int(os.getenv("CRAWLER_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+            queue_size = int(os.getenv("CRAWLER_EXTRACT_QUEUE", str(workers * 2)))
+            # forkserver: 스레드가 많은 부모 프로세스(Flask-SocketIO, Strands)를 fork하지 않음
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+            _pool_slots = threading.BoundedSemaphore(max(queue_size, workers))
+        return _pool, _pool_slots
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next job starts a new one (unless another thread already did)."""
+    global _pool, _pool_slots
+    with _pool_lock:
+        if _pool is pool:
+            _pool = _pool_slots = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit_and_wait(pool: ProcessPoolExecutor, slots: threading.BoundedSemaphore, func: Callable, *args):
+    slots.acquire()
+    try:
+        future = pool.submit(func, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future.result()
+
+
+def run_in_pool(func: Callable, *args):
+    """
+    Run a module-level function in the extractor process pool and wait for its result.
+
+    At most CRAWLER_EXTRACT_QUEUE jobs (default: twice the workers) are queued or running;
+    further callers block until a slot frees up, so bursts of large pages queue in the
+    crawler threads instead of piling up bodies in the pool.
+
+    If a worker dies (e.g. killed for memory), the broken pool is replaced and the job is
+    retried once on the new pool; a second failure raises BrokenProcessPool.
+    """
+    for attempt in range(2):
+        pool, slots = _get_pool()
+        try:
+            return _submit_and_wait(pool, slots, func, *args)
+        except BrokenProcessPool:
+            # 워커가 죽으면 풀 전체가 사용 불가 - 새 풀로 교체하고 한 번만 재시도
+            _discard_pool(pool)
+            if attempt:
+                raise
+            print("⚠️ Extractor worker died; restarting the process pool and retrying")
+
+
+def extract(kind: str, body: bytes, charset: str | None = None) -> Article:
+    """Run the registered extractor for `kind`; heavy extractors run in the process pool."""
+    extractor, heavy = _REGISTRY[kind]
+    if heavy:
+        return run_in_pool(extractor, body, charset)
+    return extractor(body, charset)
+
+
+def _decode(body: bytes, charset: str | None) -> str:
+    try:
+        return body.decode(charset or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+
+def extract_html_article(body: bytes, charset: str | None = None) -> Article:
+    title, content = extract_html(body, encoding=charset)
+    return Article(title=title, html_content=content, plain_text=True)
+
+
+def extract_text_article(body: bytes, charset: str | None = None) -> Article:
+    text = _decode(body, charset).strip()
+    title = next((line.strip() for line in text.splitlines() if line.strip()), "No Title")
+    return Article(title=title[:200], html_content=text, plain_text=True)
+
+
+def _compact(value):
+    """Drop nulls and empty containers so the LLM only reads meaningful fields."""
+    if isinstance(value, dict):
+        items = ((k, _compact(v)) for k, v in value.items())
+        return {k: v for k, v in items if v not in (None, "", [], {})}
+    if isinstance(value, list):
+        items = (_compact(v) for v in value)
+        return [v for v in items if v not in (None, "", [], {})]
+    return value
+
+
+def extract_json_article(body: bytes, charset: str | None = None) -> Article:
+    text = _decode(body, charset)
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return extract_text_article(body, charset)
+    title = data.get("title") if isinstance(data, dict) and isinstance(data.get("title"), str) else "No Title"
+    content = json.dumps(_compact(data), ensure_ascii=False, indent=1, separators=(",", ": "))
+    return Article(title=title, html_content=content, plain_text=True)
+
+
+def extract_pdf_article(body: bytes, charset: str | None = None) -> Article:
+    from pypdf import PdfReader  # 무거운 import는 워커 프로세스에서만
+
+    reader = PdfReader(io.BytesIO(body))
+    pages = []
+    for page in reader.pages:
+        text = (page.extract_text() or "").strip()
+        if text:
+            pages.append(text)
+    content = "\n\n".join(pages)
+
+    title = None
+    if reader.metadata and reader.metadata.title:
+        title = str(reader.metadata.title).strip()
+    if not title:
+        title = next((line.strip() for line in content.splitlines() if line.strip()), "No Title")
+    return Article(title=title[:200], html_content=content, plain_text=True)
+
+
+register_extractor("html", extract_html_article, ["text/html", "application/xhtml+xml", "application/xml", "text/xml",
+                                                  "application/rss+xml", "application/atom+xml"])
+register_extractor("text", extract_text_article, ["text/plain", "text/markdown", "text/csv"])
+register_extractor("json", extract_json_article, ["application/json", "application/ld+json"])
+register_extractor("pdf", extract_pdf_article, ["application/pdf", "application/x-pdf"], heavy=True)
@@ -0,0 +1,295 @@
+import os
+import gzip
+import time
+import sqlite3
+import threading
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from lxml import etree
+
+from .async_crawler import AsyncCrawler
+from .article_index import ArticleIndex
+from .crawler import CrawlError
+
+# 크롤러 HTTP 캐시와 같은 위치 (실행 간 유지되는 마지막 확인 지점)
+DEFAULT_STATE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "tech-recon", "feeds", "state.db")
+
+MAX_SITEMAP_CHILDREN = 5          # 사이트맵 인덱스에서 한 번에 확인하는 하위 사이트맵 수
+MAX_FEED_BYTES = 16 * 1024 * 1024  # 피드/사이트맵 다운로드 상한 (압축 해제 전)
+
+
+def _timestamp(value: str | None) -> float | None:
+    """Epoch seconds from an RFC 822 (RSS) or ISO 8601 (Atom, sitemap) date, or None"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _local(tag) -> str:
+    return etree.QName(tag).localname.lower() if isinstance(tag, str) else ""
+
+
+def _child_text(element, *names: str) -> str | None:
+    for child in element:
+        if _local(child.tag) in names and child.text and child.text.strip():
+            return child.text.strip()
+    return None
+
+
+def parse_feed(body: bytes) -> tuple[str, list[tuple[str, float | None]]]:
+    """
+    Parse an RSS 2.0 / Atom feed or an XML sitemap (optionally gzipped).
+
+    Returns:
+        (kind, [(url, published timestamp or None)]) where kind is "feed", "sitemap" or
+        "sitemapindex" (whose urls are child sitemaps)
+    """
+    if body.startswith(b"\x1f\x8b"):
+        body = gzip.decompress(body)
+    root = etree.fromstring(body, etree.XMLParser(recover=True, resolve_entities=False, no_network=True, huge_tree=True))
+    if root is None:
+        raise ValueError("Empty or unparseable feed")
+
+    kind = {"urlset": "sitemap", "sitemapindex": "sitemapindex"}.get(_local(root.tag), "feed")
+    items = []
+    for element in root.iter():
+        name = _local(element.tag)
+        if kind != "feed" and name in ("url", "sitemap"):
+            url = _child_text(element, "loc")
+            date = _child_text(element, "lastmod")
+        elif kind == "feed" and name == "item":  # RSS
+            url = _child_text(element, "link")
+            date = _child_text(element, "pubdate", "date", "updated")
+        elif kind == "feed" and name == "entry":  # Atom
+            links = [child for child in element if _local(child.tag) == "link"]
+            alternate = [link for link in links if link.get("rel", "alternate") == "alternate"] or links
+            url = alternate[0].get("href") if alternate else None
+            date = _child_text(element, "published", "updated")
+        else:
+            continue
+        if url:
+            items.append((url.strip(), _timestamp(date)))
+    return kind, items
+
+
+class FeedWatcher:
+    """
+    Incremental monitor of RSS/Atom feeds and sitemaps.
+
+    Each poll revalidates every feed with a conditional GET (ETag / Last-Modified), so an
+    unchanged feed costs a 304. Only items newer than the feed's last-seen marker (the
+    newest item date seen so far; undated items are tracked by URL) are crawled, which
+    stores them in the crawler's HTTP cache, and added to the local article index. The
+    first poll of a feed takes at most `max_items` of its newest items instead of the
+    whole backlog. An item is recorded as seen only once it has been crawled, so failed
+    items are retried on the next poll, up to `max_attempts` times before they are given
+    up. Markers persist in SQLite across runs.
+    """
+
+    def __init__(self, async_crawler: AsyncCrawler, index: ArticleIndex | None = None, path: str | None = None,
+                 max_items: int = 20, max_attempts: int = 3):
+        """
+        Args:
+            async_crawler: Crawler used for feeds (conditional GETs) and new items
+            index: Local article index receiving new items (default: none)
+            path: SQLite state file (default: ~/.cache/tech-recon/feeds/state.db)
+            max_items: Maximum new items crawled per feed and poll (default: 20)
+            max_attempts: Polls that try to crawl a failing item before it is skipped (default: 3)
+        """
+        self.async_crawler = async_crawler
+        self.index = index
+        self.path = path or DEFAULT_STATE_PATH
+        self.max_items = max_items
+        self.max_attempts = max_attempts
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS feeds (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                last_seen REAL,
+                checked_at REAL
+            )"""
+        )
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS items (
+                url TEXT NOT NULL,
+                feed TEXT NOT NULL,
+                seen_at REAL NOT NULL,
+                PRIMARY KEY (feed, url)
+            )"""
+        )
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS failures (
+                url TEXT NOT NULL,
+                feed TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                PRIMARY KEY (feed, url)
+            )"""
+        )
+        self._db.commit()
+        self.stats = {"feeds": 0, "not_modified": 0, "failed": 0, "new_items": 0, "crawled": 0}
+        self._pending: dict[str, str] = {}  # 크롤링을 기다리는 새 항목 url -> 피드
+
+    def _state(self, feed_url: str) -> tuple[str | None, str | None, float | None]:
+        with self._lock:
+            row = self._db.execute("SELECT etag, last_modified, last_seen FROM feeds WHERE url = ?", (feed_url,)).fetchone()
+        return row or (None, None, None)
+
+    def _fetch(self, feed_url: str, etag: str | None, last_modified: str | None) -> tuple[bytes, dict] | None:
+        """Conditional GET of a feed: (body, headers), or None if it has not changed"""
+        crawler = self.async_crawler.crawler
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        slot = crawler.scheduler.slot(feed_url) if crawler.scheduler else nullcontext()
+        with slot:
+            response = crawler.session.get(feed_url, headers=headers, timeout=crawler.timeout, stream=True)
+            try:
+                if response.status_code == 304:
+                    return None
+                response.raise_for_status()
+                chunks, received = [], 0
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    received += len(chunk)
+                    if received > MAX_FEED_BYTES:
+                        raise CrawlError(f"Feed larger than {MAX_FEED_BYTES} bytes")
+                    chunks.append(chunk)
+            finally:
+                response.close()
+        return b"".join(chunks), response.headers
+
+    def _new_items(self, feed_url: str, items: list[tuple[str, float | None]], last_seen: float | None) -> list[str]:
+        """Items newer than the marker (dated) or never seen (undated), newest first"""
+        with self._lock:
+            seen = {row[0] for row in self._db.execute("SELECT url FROM items WHERE feed = ?", (feed_url,))}
+        new = [(url, published) for url, published in dict(items).items() if url not in seen and (
+            published is None or last_seen is None or published > last_seen)]
+        new.sort(key=lambda item: -(item[1] or 0))
+        return [url for url, _ in new]
+
+    def check(self, feed_url: str, depth: int = 0) -> list[str]:
+        """
+        Revalidate one feed and return the URLs of its new items (markers are updated).
+
+        A sitemap index is expanded into its most recently modified child sitemaps. All
+        current entries except the returned ones are marked as seen, so new items beyond
+        `max_items` are skipped rather than crawled on a later poll; the returned items are
+        recorded by poll() once crawled.
+        """
+        etag, last_modified, last_seen = self._state(feed_url)
+        fetched = self._fetch(feed_url, etag, last_modified)
+        if fetched is None:
+            self.stats["not_modified"] += 1
+            print(f"💾 Feed not modified (304): {feed_url}")
+            return []
+
+        body, headers = fetched
+        kind, items = parse_feed(body)
+        new_urls = self._new_items(feed_url, items, last_seen)
+        to_crawl = set(new_urls[:self.max_items]) if kind != "sitemapindex" else set()
+        dates = [published for url, published in items if published is not None and url not in to_crawl]
+        if last_seen is not None:
+            dates.append(last_seen)
+        marker = max(dates) if dates else None
+        # 크롤링할 항목이 다음 확인에서도 새 항목으로 남도록 마커는 그 항목들보다 이전으로 유지
+        pending_dates = [published for url, published in items if published is not None and url in to_crawl]
+        if marker is not None and pending_dates and marker >= min(pending_dates):
+            marker = min(pending_dates) - 1
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO feeds VALUES (?, ?, ?, ?, ?)",
+                (feed_url, headers.get("ETag"), headers.get("Last-Modified"), marker, now),
+            )
+            if kind != "sitemapindex":  # 하위 사이트맵은 갱신될 수 있으므로 본 것으로 기록하지 않음
+                self._db.executemany("INSERT OR IGNORE INTO items VALUES (?, ?, ?)",
+                                     [(url, feed_url, now) for url, _ in items if url not in to_crawl])
+            self._db.commit()
+        for url in to_crawl:
+            self._pending.setdefault(url, feed_url)
+        print(f"📰 Feed checked: {feed_url} ({len(items)} entries, {len(new_urls)} new)")
+
+        if kind == "sitemapindex":
+            children = new_urls[:MAX_SITEMAP_CHILDREN] if depth == 0 else []
+            return [url for child in children for url in self._check_quietly(child, depth + 1)]
+        return new_urls[:self.max_items]
+
+    def _check_quietly(self, feed_url: str, depth: int = 0) -> list[str]:
+        try:
+            return self.check(feed_url, depth)
+        except Exception as e:
+            self.stats["failed"] += 1
+            print(f"❌ Feed check failed: {feed_url} ({e!r})")
+            return []
+
+    def poll(self, feed_urls: list[str]) -> dict[str, int]:
+        """
+        Check every feed, crawl the new items into the HTTP cache and add them to the index.
+
+        Returns:
+            Counters: feeds, not_modified, failed, new_items, crawled, given_up
+        """
+        self.stats = {"feeds": len(feed_urls), "not_modified": 0, "failed": 0, "new_items": 0, "crawled": 0,
+                      "given_up": 0}
+        self._pending = {}
+        new_urls = list(dict.fromkeys(url for feed_url in feed_urls for url in self._check_quietly(feed_url)))
+        self.stats["new_items"] = len(new_urls)
+        if not new_urls:
+            return dict(self.stats)
+
+        done, failed = [], []
+        for url, article in zip(new_urls, self.async_crawler.crawl_many_sync(new_urls)):
+            if isinstance(article, Exception):
+                failed.append((url, self._pending[url]))
+                continue
+            self.stats["crawled"] += 1
+            done.append((url, self._pending[url], time.time()))
+            if self.index is not None:
+                self.index.add(url, article)
+        with self._lock:
+            retry_feeds = set()
+            for url, feed_url in failed:
+                self._db.execute("INSERT INTO failures VALUES (?, ?, 1) ON CONFLICT (feed, url) "
+                                 "DO UPDATE SET attempts = attempts + 1", (url, feed_url))
+                attempts = self._db.execute("SELECT attempts FROM failures WHERE feed = ? AND url = ?",
+                                            (feed_url, url)).fetchone()[0]
+                if attempts >= self.max_attempts:
+                    # 계속 실패하는 항목(404, 차단된 호스트)은 본 것으로 기록해 포기 - 다음 확인에서 마커가 넘어감
+                    self.stats["given_up"] += 1
+                    done.append((url, feed_url, time.time()))
+                else:
+                    retry_feeds.add(feed_url)
+            self._db.executemany("INSERT OR IGNORE INTO items VALUES (?, ?, ?)", done)
+            self._db.executemany("DELETE FROM failures WHERE feed = ? AND url = ?",
+                                 [(feed_url, url) for url, feed_url, _ in done])
+            # 재시도할 항목이 있는 피드는 다음 확인에서 304로 건너뛰지 않도록 검증자를 지움
+            self._db.executemany("UPDATE feeds SET etag = NULL, last_modified = NULL WHERE url = ?",
+                                 [(feed_url,) for feed_url in retry_feeds])
+            self._db.commit()
+        return dict(self.stats)
+
+
+def load_feed_list(path: str) -> list[str]:
+    """Feed URLs from a text file (one per line, blank lines and # comments ignored)"""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
@@ -0,0 +1,164 @@
+import time
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+class HostUnavailable(Exception):
+    """Raised without any network request while a host's circuit breaker is open."""
+
+
+class _HostState:
+    def __init__(self, max_concurrency: int):
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.next_start = 0.0            # 다음 요청을 시작할 수 있는 시각 (rate limit)
+        self.consecutive_failures = 0
+        self.open_until = 0.0            # circuit breaker가 열려 있는 시각
+        self.trial_in_flight = False     # half-open 상태의 시험 요청
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.requests = 0
+        self.failures = 0
+        self.skipped = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_error = None
+
+
+class HostScheduler:
+    """
+    Per-host politeness and circuit breaking for the crawler.
+
+    Each host gets a small concurrency window and a minimum interval between request
+    starts. After `failure_threshold` consecutive host failures (timeouts, connection
+    errors, 403/429/5xx) the breaker opens and requests to that host fail immediately for
+    `cooldown` seconds; then a single trial request decides whether it closes again.
+    Breaker state persists across runs, latency/failure statistics are reset per run.
+    """
+
+    def __init__(self, min_interval: float = 0.5, max_concurrency: int = 2,
+                 failure_threshold: int = 2, cooldown: float = 300):
+        """
+        Args:
+            min_interval: Minimum seconds between request starts to the same host (default: 0.5)
+            max_concurrency: Maximum in-flight requests per host (default: 2)
+            failure_threshold: Consecutive failures that open the breaker (default: 2)
+            cooldown: Seconds a host is fast-failed once the breaker opens (default: 300)
+        """
+        self.min_interval = min_interval
+        self.max_concurrency = max_concurrency
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._hosts: dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def _state(self, host: str) -> _HostState:
+        if host not in self._hosts:
+            self._hosts[host] = _HostState(self.max_concurrency)
+        return self._hosts[host]
+
+    def _admit(self, host: str) -> tuple[_HostState, bool]:
+        """Check the breaker (lock held by caller); returns the host state and whether this is the half-open trial."""
+        state = self._state(host)
+        now = time.monotonic()
+        if state.consecutive_failures >= self.failure_threshold:
+            if now < state.open_until or state.trial_in_flight:
+                state.skipped += 1
+                retry_in = max(state.open_until - now, 0)
+                raise HostUnavailable(
+                    f"Host {host} skipped after {state.consecutive_failures} consecutive failures "
+                    f"(last error: {state.last_error}); retry in {retry_in:.0f}s"
+                )
+            state.trial_in_flight = True  # half-open: 한 번만 시험 요청 허용
+            return state, True
+        return state, False
+
+    @contextmanager
+    def slot(self, url: str, is_host_failure=lambda e: True):
+        """
+        Hold a politeness slot for `url` for the duration of the request.
+
+        Args:
+            url: Request URL
+            is_host_failure: Predicate deciding whether an exception counts against the host
+
+        Raises:
+            HostUnavailable: The host's circuit breaker is open
+        """
+        host = self.host_of(url)
+        with self._lock:
+            state, trial = self._admit(host)
+        state.slots.acquire()
+        try:
+            with self._lock:
+                start = max(time.monotonic(), state.next_start)
+                state.next_start = start + self.min_interval
+            delay = start - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            started = time.monotonic()
+            try:
+                yield
+            except BaseException as e:
+                self._record(state, time.monotonic() - started, trial, e, is_host_failure(e))
+                raise
+            else:
+                self._record(state, time.monotonic() - started, trial)
+        finally:
+            state.slots.release()
+
+    def _record(self, state: _HostState, latency: float, trial: bool,
+                error: BaseException | None = None, host_failure: bool = False) -> None:
+        with self._lock:
+            state.requests += 1
+            state.total_latency += latency
+            state.max_latency = max(state.max_latency, latency)
+            if trial:
+                state.trial_in_flight = False
+            if error is None:
+                state.consecutive_failures = 0
+                return
+            if not host_failure:
+                return  # 404 등 호스트 문제가 아닌 오류는 breaker를 열지도 닫지도 않음
+            state.failures += 1
+            state.consecutive_failures += 1
+            state.last_error = str(error)[:200]
+            if state.consecutive_failures >= self.failure_threshold:
+                state.open_until = time.monotonic() + self.cooldown
+
+    def is_open(self, url: str) -> bool:
+        """True if requests to the url's host are currently being fast-failed."""
+        with self._lock:
+            state = self._hosts.get(self.host_of(url))
+            return bool(state and state.consecutive_failures >= self.failure_threshold
+                        and time.monotonic() < state.open_until)
+
+    def reset_stats(self) -> None:
+        """Reset per-run latency/failure statistics (breaker state is kept)."""
+        with self._lock:
+            for state in self._hosts.values():
+                state.reset_stats()
+
+    def stats(self) -> dict[str, dict]:
+        """Per-host request, failure, skip and latency statistics for this run."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: {
+                    "requests": state.requests,
+                    "failures": state.failures,
+                    "skipped": state.skipped,
+                    "avg_latency": state.total_latency / state.requests if state.requests else 0.0,
+                    "max_latency": state.max_latency,
+                    "breaker_open": state.consecutive_failures >= self.failure_threshold and now < state.open_until,
+                    "last_error": state.last_error,
+                }
+                for host, state in self._hosts.items()
+                if state.requests or state.skipped
+            }
@@ -0,0 +1,241 @@
+import re
+import codecs
+from lxml import etree
+
+# 본문으로 추출할 블록 요소와 통째로 제외할 요소
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+BLOCK_TAGS = HEADING_TAGS | {"p", "li"}
+SKIP_TAGS = {"script", "style", "nav", "footer", "header"}
+
+# 본문 컨테이너 후보 (우선순위 순) - (tag, attribute, value)
+CONTENT_SELECTORS = [
+    ("article", None, None),
+    ("main", None, None),
+    ("div", "class", "content"),
+    ("div", "class", "article"),
+    ("div", "class", "post"),
+    ("div", "id", "content"),
+    ("div", "id", "main"),
+    ("body", None, None),  # 최후의 수단
+]
+
+MIN_PARAGRAPH_CHARS = 20  # Filter out very short paragraphs
+MIN_CONTENT_CHARS = 100   # Below this, fall back to all page text
+
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+_BOMS = [(codecs.BOM_UTF8, "utf-8"), (codecs.BOM_UTF16_LE, "utf-16-le"), (codecs.BOM_UTF16_BE, "utf-16-be")]
+
+
+def sniff_encoding(head: bytes) -> str:
+    """Guess the document encoding from a BOM or <meta charset> in the first bytes (default: utf-8)."""
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    match = _META_CHARSET.search(head[:4096])
+    if match:
+        encoding = match.group(1).decode("ascii", "ignore").lower()
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def _matches(selector, tag: str, attrib) -> bool:
+    sel_tag, attr, value = selector
+    if tag != sel_tag:
+        return False
+    if attr is None:
+        return True
+    if attr == "class":
+        return value in (attrib.get("class") or "").split()
+    return attrib.get(attr) == value
+
+
+class _LinkCollector:
+    """Anchors (href, anchor text) outside skipped elements, in document order."""
+
+    def __init__(self):
+        self.links: list[tuple[str, str]] = []
+        self._href = None
+        self._text = []
+
+    def start(self, attrib):
+        self._href = (attrib.get("href") or "").strip() or None  # 중첩된 링크는 안쪽이 우선
+        self._text = []
+
+    def data(self, text):
+        if self._href is not None:
+            self._text.append(text)
+
+    def end(self):
+        if self._href is not None:
+            self.links.append((self._href, " ".join("".join(self._text).split())))
+            self._href = None
+
+
+class _ContentTarget:
+    """
+    lxml parser target that extracts headings, paragraphs and list items in one linear pass.
+
+    No tree is built: start/end/data callbacks keep only a stack of open elements, the text of
+    open blocks, and the finished blocks tagged with a bitmask of the content containers
+    (first match of each selector) they appear in. The best container is chosen at close().
+    """
+
+    def __init__(self):
+        self._stack = []             # (tag, container_bits, block_slot, is_skip)
+        self._skip_depth = 0
+        self._seen_selectors = 0     # selectors whose first match has already been seen
+        self._open_containers = 0    # containers currently open
+        self._block_buffers = []     # text of open blocks, innermost last
+        self._blocks = []            # (tag, text, container_mask) in document order (slot reserved at start)
+        self._text_node = []         # current text node (for the fallback)
+        self._text_nodes = []
+        self._title = None
+        self._title_buffer = None
+        self.anchors = _LinkCollector()
+
+    def _flush_text_node(self):
+        if self._text_node:
+            text = "".join(self._text_node).strip()
+            if text:
+                self._text_nodes.append(text)
+            self._text_node = []
+
+    def start(self, tag, attrib):
+        self._flush_text_node()
+        tag = tag.lower() if isinstance(tag, str) else ""
+        is_skip = tag in SKIP_TAGS
+        if self._skip_depth or is_skip:
+            self._skip_depth += is_skip
+            self._stack.append((tag, 0, None, is_skip))
+            return
+
+        bits = 0
+        for i, selector in enumerate(CONTENT_SELECTORS):
+            if not self._seen_selectors & (1 << i) and _matches(selector, tag, attrib):
+                bits |= 1 << i
+        self._seen_selectors |= bits
+        self._open_containers |= bits
+
+        block_slot = None
+        if tag in BLOCK_TAGS:
+            block_slot = len(self._blocks)
+            self._blocks.append(None)
+            self._block_buffers.append([])
+        if tag == "title" and self._title is None:
+            self._title_buffer = []
+        if tag == "a":
+            self.anchors.start(attrib)
+        self._stack.append((tag, bits, block_slot, False))
+
+    def end(self, tag):
+        self._flush_text_node()
+        if not self._stack:
+            return
+        tag, bits, block_slot, is_skip = self._stack.pop()
+        if is_skip:
+            self._skip_depth -= 1
+            return
+        if self._skip_depth:
+            return
+
+        if block_slot is not None:
+            text = "".join(self._block_buffers.pop()).strip()
+            if text:
+                self._blocks[block_slot] = (tag, text, self._open_containers)
+        if tag == "title" and self._title_buffer is not None:
+            self._title = "".join(self._title_buffer).strip()
+            self._title_buffer = None
+        if tag == "a":
+            self.anchors.end()
+        self._open_containers &= ~bits
+
+    def data(self, text):
+        if self._skip_depth:
+            return
+        self._text_node.append(text)
+        self.anchors.data(text)
+        if self._block_buffers:
+            self._block_buffers[-1].append(text)  # nested blocks keep their own text
+        if self._title_buffer is not None:
+            self._title_buffer.append(text)
+
+    def close(self):
+        self._flush_text_node()
+
+        content = ""
+        for i in range(len(CONTENT_SELECTORS)):
+            if self._seen_selectors & (1 << i):
+                text_elements = []
+                for block in self._blocks:
+                    if block is None or not block[2] & (1 << i):
+                        continue
+                    tag, text, _ = block
+                    if tag in HEADING_TAGS:
+                        text_elements.append(f"\n## {text}\n")
+                    elif tag == "p":
+                        if len(text) > MIN_PARAGRAPH_CHARS:
+                            text_elements.append(text)
+                    else:
+                        text_elements.append(f"- {text}")
+                content = "\n\n".join(text_elements)
+                break
+
+        # Fallback: if content is still empty, use all text nodes collected in the same pass
+        if not content or len(content) < MIN_CONTENT_CHARS:
+            content = "\n".join(self._text_nodes)
+
+        return self._title or "No Title", content
+
+
+class HtmlExtractor:
+    """
+    Incremental, single-pass HTML content extractor.
+
+    Feed the document in chunks as it is downloaded and call close() to get (title, content).
+    Headings, paragraphs and list items are emitted in document order from the highest
+    priority content container (article > main > div.content > ... > body). The page's
+    links (outside navigation and other skipped elements) are available as `links`.
+    """
+
+    target_class = _ContentTarget
+
+    def __init__(self, encoding: str | None = None):
+        """
+        Args:
+            encoding: Document encoding if known (e.g. from the Content-Type charset);
+                      otherwise sniffed from the first chunk
+        """
+        self.encoding = encoding
+        self._parser = None
+        self._target = None
+
+    def feed(self, data: bytes) -> None:
+        if self._parser is None:
+            if not data:
+                return
+            self.encoding = self.encoding or sniff_encoding(data)
+            self._target = self.target_class()
+            self._parser = etree.HTMLParser(
+                target=self._target, encoding=self.encoding, remove_comments=True, no_network=True,
+            )
+        self._parser.feed(data)
+
+    def close(self) -> tuple[str, str]:
+        if self._parser is None:
+            return "No Title", ""
+        return self._parser.close()
+
+    @property
+    def links(self) -> list[tuple[str, str]]:
+        """(href as written, anchor text) pairs in document order"""
+        return self._target.anchors.links if self._target is not None else []
+
+
+def extract_html(content: bytes, encoding: str | None = None) -> tuple[str, str]:
+    """Extract (title, content) from a complete HTML document."""
+    extractor = HtmlExtractor(encoding=encoding)
+    extractor.feed(content)
+    return extractor.close()
@@ -0,0 +1,209 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+from email.utils import parsedate_to_datetime
+
+# 캐시는 ./artifacts 밖에 두어 Part1/Part2 실행 사이의 artifacts 정리와 무관하게 유지
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tech-recon", "http")
+
+
+class CacheEntry:
+    """A cached response: body plus the validators needed for a conditional GET."""
+
+    def __init__(self, url: str, body: bytes, content_type: str, etag: str | None,
+                 last_modified: str | None, fetched_at: float, expires_at: float, final_url: str | None = None):
+        self.url = url
+        self.final_url = final_url or url  # 리다이렉트 후 URL
+        self.body = body
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+        self.expires_at = expires_at
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Validators to send so the origin can answer 304 Not Modified."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    Persistent, content-addressed HTTP cache for the crawler.
+
+    Bodies are stored once per SHA-256 digest under `objects/`, and a SQLite index maps
+    each URL to its body and validators (ETag / Last-Modified). Entries are fresh for the
+    response's `Cache-Control: max-age` (or `ttl` when absent), are revalidated with a
+    conditional GET once stale, and are evicted least-recently-used once the stored bodies
+    exceed `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: str | None = None, ttl: int = 86400, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize HttpCache.
+
+        Args:
+            cache_dir: Cache directory (default: ~/.cache/tech-recon/http)
+            ttl: Freshness lifetime in seconds when the response has no max-age (default: 1 day)
+            max_bytes: Size cap for stored bodies before LRU eviction (default: 512 MB)
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        os.makedirs(os.path.join(self.cache_dir, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(self.cache_dir, "index.db"), check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                body_hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                final_url TEXT
+            )"""
+        )
+        if "final_url" not in {row[1] for row in self._db.execute("PRAGMA table_info(entries)")}:
+            self._db.execute("ALTER TABLE entries ADD COLUMN final_url TEXT")  # 이전 버전에서 만든 캐시
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access)")
+        self._db.commit()
+        self.reset_stats()
+
+    def _object_path(self, body_hash: str) -> str:
+        return os.path.join(self.cache_dir, "objects", body_hash[:2], body_hash)
+
+    def reset_stats(self) -> None:
+        """Reset the per-run counters."""
+        with self._lock:
+            self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "stores": 0, "bytes_saved": 0}
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def record_hit(self, entry: CacheEntry, revalidated: bool = False) -> None:
+        """Count a response served from the cache (fresh hit, or 304 after revalidation)."""
+        with self._lock:
+            self._stats["revalidated" if revalidated else "hits"] += 1
+            self._stats["bytes_saved"] += len(entry.body)
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self._stats["misses"] += 1
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Return the cached entry for `url` (fresh or stale), or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body_hash, content_type, etag, last_modified, fetched_at, expires_at, final_url "
+                "FROM entries WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            body_hash, content_type, etag, last_modified, fetched_at, expires_at, final_url = row
+            try:
+                with open(self._object_path(body_hash), "rb") as f:
+                    body = f.read()
+            except FileNotFoundError:
+                self._db.execute("DELETE FROM entries WHERE url = ?", (url,))
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE entries SET last_access = ? WHERE url = ?", (time.time(), url))
+            self._db.commit()
+        return CacheEntry(url, body, content_type, etag, last_modified, fetched_at, expires_at, final_url)
+
+    def _expires_at(self, headers) -> float | None:
+        """Freshness deadline from response headers, or None if the response must not be stored."""
+        cache_control = (headers.get("Cache-Control") or "").lower()
+        if "no-store" in cache_control:
+            return None
+        now = time.time()
+        if "no-cache" in cache_control:
+            return now  # 저장하되 매번 재검증
+        match = re.search(r"max-age=(\d+)", cache_control)
+        if match:
+            return now + int(match.group(1))
+        if headers.get("Expires"):
+            try:
+                return parsedate_to_datetime(headers["Expires"]).timestamp()
+            except (TypeError, ValueError):
+                pass
+        return now + self.ttl
+
+    def store(self, url: str, body: bytes, headers, final_url: str | None = None) -> None:
+        """Store a 200 response body and its validators (`final_url`: URL after redirects)."""
+        expires_at = self._expires_at(headers)
+        if expires_at is None:
+            return
+        body_hash = hashlib.sha256(body).hexdigest()
+        path = self._object_path(body_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (url, body_hash, size, content_type, etag, last_modified, "
+                "fetched_at, expires_at, last_access, final_url) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body_hash, len(body), headers.get("Content-Type", ""), headers.get("ETag"),
+                 headers.get("Last-Modified"), now, expires_at, now, final_url if final_url != url else None),
+            )
+            self._db.commit()
+            self._stats["stores"] += 1
+            self._evict()
+
+    def refresh(self, entry: CacheEntry, headers) -> None:
+        """Extend a stale entry's freshness after a 304 Not Modified."""
+        expires_at = self._expires_at(headers) or time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE entries SET expires_at = ?, etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (expires_at, headers.get("ETag"), headers.get("Last-Modified"), entry.url),
+            )
+            self._db.commit()
+        entry.expires_at = expires_at
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the stored bodies fit in max_bytes (lock held)."""
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT body_hash, size FROM entries)"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, body_hash, size in self._db.execute(
+            "SELECT url, body_hash, size FROM entries ORDER BY last_access ASC"
+        ).fetchall():
+            self._db.execute("DELETE FROM entries WHERE url = ?", (url,))
+            still_referenced = self._db.execute(
+                "SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (body_hash,)
+            ).fetchone()
+            if not still_referenced:
+                try:
+                    os.remove(self._object_path(body_hash))
+                except FileNotFoundError:
+                    pass
+                total -= size
+            if total <= self.max_bytes:
+                break
+        self._db.commit()
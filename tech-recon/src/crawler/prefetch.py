@@ -0,0 +1,107 @@
+import asyncio
+import threading
+from concurrent.futures import Future, wait as wait_futures
+
+from .async_crawler import AsyncCrawler
+
+
+class Prefetcher:
+    """
+    Speculative background crawling of URLs the agent is likely to request next.
+
+    Prefetched pages land in the crawler's HTTP cache, so a later crawl of the same URL
+    is served from the cache without touching the network. Prefetches run on the
+    AsyncCrawler's background loop with their own small concurrency limit (on top of the
+    crawler's global and per-host limits), and everything still pending is cancelled by
+    cancel() at the end of a run.
+    """
+
+    def __init__(self, async_crawler: AsyncCrawler, max_concurrency: int = 2, max_urls: int = 30):
+        """
+        Args:
+            async_crawler: Crawler whose cache receives the prefetched pages (must have a cache)
+            max_concurrency: Maximum prefetches in flight (default: 2)
+            max_urls: Maximum URLs prefetched per run (default: 30)
+        """
+        self.async_crawler = async_crawler
+        self.max_concurrency = max_concurrency
+        self.max_urls = max_urls
+        self._limit: asyncio.Semaphore | None = None  # 백그라운드 루프에서 생성
+        self._futures: dict[str, Future] = {}
+        self._started: set[str] = set()  # 동시 실행 한도를 통과해 실제로 요청 중인(또는 끝난) url
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = {"scheduled": 0, "completed": 0, "failed": 0, "used": 0, "cancelled": 0}
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    async def _prefetch(self, url: str) -> None:
+        if self._limit is None:
+            self._limit = asyncio.Semaphore(self.max_concurrency)
+        async with self._limit:
+            with self._lock:
+                self._started.add(url)
+            await self.async_crawler.crawl(url)
+
+    def _done(self, future: Future) -> None:
+        if future.cancelled():
+            return
+        with self._lock:
+            self._stats["failed" if future.exception() else "completed"] += 1
+
+    def prefetch(self, urls: list[str]) -> int:
+        """
+        Start prefetching `urls` in the background (already scheduled URLs are skipped).
+
+        Returns:
+            Number of newly scheduled URLs
+        """
+        scheduler = self.async_crawler.crawler.scheduler
+        scheduled = 0
+        with self._lock:
+            for url in dict.fromkeys(urls):
+                if url in self._futures or len(self._futures) >= self.max_urls:
+                    continue
+                if scheduler is not None and scheduler.is_open(url):
+                    continue  # 차단된 호스트에는 추측성 요청을 보내지 않음
+                future = self.async_crawler.submit(self._prefetch(url))
+                future.add_done_callback(self._done)
+                self._futures[url] = future
+                self._stats["scheduled"] += 1
+                scheduled += 1
+        return scheduled
+
+    def wait(self, urls: list[str], timeout: float | None = None) -> int:
+        """
+        Let prefetches of `urls` that are already fetching finish so the caller's crawls hit the cache.
+
+        All urls share one `timeout`. Prefetches still queued behind the concurrency limit are
+        cancelled rather than waited for, so the caller crawls those URLs itself right away.
+
+        Returns:
+            Number of urls prefetched successfully (failures are left to the caller's crawl)
+        """
+        with self._lock:
+            futures = {url: self._futures[url] for url in dict.fromkeys(urls) if url in self._futures}
+            started = [future for url, future in futures.items() if url in self._started or future.done()]
+        cancelled = sum(future.cancel() for future in futures.values() if future not in started)
+        done, _ = wait_futures(started, timeout=timeout)
+        used = sum(1 for future in done if not future.cancelled() and future.exception() is None)
+        with self._lock:
+            self._stats["used"] += used
+            self._stats["cancelled"] += cancelled
+        return used
+
+    def cancel(self) -> None:
+        """Cancel prefetches that have not finished and forget this run's URLs."""
+        with self._lock:
+            futures, self._futures = self._futures, {}
+            self._started = set()
+        cancelled = sum(future.cancel() for future in futures.values())
+        with self._lock:
+            self._stats["cancelled"] += cancelled
@@ -0,0 +1,311 @@
+import re
+
+from .html_extractor import HtmlExtractor, HEADING_TAGS, MIN_PARAGRAPH_CHARS, MIN_CONTENT_CHARS, _LinkCollector
+
+# readability 계열 휴리스틱 (Arc90 / Mozilla Readability 점수 규칙을 단일 패스로 구현)
+SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "iframe", "nav", "footer", "header",
+             "aside", "form", "button", "select"}
+PARAGRAPH_TAGS = {"p", "pre"}             # 부모/조부모에게 점수를 주는 블록
+DIV_LIKE_TAGS = {"div", "section", "td"}  # 직접 포함한 텍스트가 충분하면 문단으로 취급
+BLOCK_TAGS = HEADING_TAGS | PARAGRAPH_TAGS | DIV_LIKE_TAGS | {"li", "tr"}
+CELL_TAGS = {"td", "th"}
+NEVER_UNLIKELY_TAGS = {"html", "body", "article", "main"}
+
+UNLIKELY_CANDIDATES = re.compile(
+    r"banner|breadcrumbs?|combx|comment|community|cover-wrap|disqus|extra|foot|header|legends|menu|related|"
+    r"remark|replies|rss|shoutbox|sidebar|skyscraper|social|sponsor|supplemental|ad-break|agegate|"
+    r"pagination|pager|popup|cookie|subscribe|share", re.IGNORECASE)
+MAYBE_CANDIDATE = re.compile(r"and|article|body|column|content|main|shadow", re.IGNORECASE)
+POSITIVE = re.compile(r"article|body|content|entry|hentry|h-entry|main|page|pagination|post|text|blog|story",
+                      re.IGNORECASE)
+NEGATIVE = re.compile(r"-ad-|hidden|^hid$| hid$| hid |^hid |banner|combx|comment|com-|contact|foot|footer|"
+                      r"footnote|gdpr|masthead|media|meta|outbrain|promo|related|scroll|share|shoutbox|"
+                      r"sidebar|skyscraper|sponsor|shopping|tags|tool|widget", re.IGNORECASE)
+TAG_WEIGHTS = {"div": 5, "pre": 3, "td": 3, "blockquote": 3,
+               "address": -3, "ol": -3, "ul": -3, "dl": -3, "dd": -3, "dt": -3, "li": -3, "form": -3,
+               "h1": -5, "h2": -5, "h3": -5, "h4": -5, "h5": -5, "h6": -5, "th": -5}
+
+MIN_SCORED_CHARS = 25          # 이보다 짧은 문단은 점수에 반영하지 않음
+MIN_TOP_CANDIDATES = 3         # 상위 후보가 이만큼 모이는 공통 조상을 본문으로 승격
+SIBLING_PARAGRAPH_CHARS = 80
+REPEATED_SECTION_TAGS = {"section", "article"}  # 허브 페이지: 본문 후보와 같은 태그의 형제 섹션(목록 위주)도 본문
+
+
+def _class_weight(attrib) -> int:
+    weight = 0
+    for name in (attrib.get("class"), attrib.get("id")):
+        if name:
+            if NEGATIVE.search(name):
+                weight -= 25
+            if POSITIVE.search(name):
+                weight += 25
+    return weight
+
+
+def _is_unlikely(tag: str, attrib) -> bool:
+    if tag in NEVER_UNLIKELY_TAGS:
+        return False
+    names = f"{attrib.get('class') or ''} {attrib.get('id') or ''}"
+    return bool(UNLIKELY_CANDIDATES.search(names)) and not MAYBE_CANDIDATE.search(names)
+
+
+class _Node:
+    """An element seen by the parser; candidates and their ancestors are kept until close()."""
+
+    __slots__ = ("tag", "parent", "weight", "score", "chars_start", "links_start",
+                 "block_start", "block_end", "link_density", "opens_block")
+
+    def __init__(self, tag, parent, weight, chars_start, links_start, block_start):
+        self.tag = tag
+        self.parent = parent
+        self.weight = weight
+        self.score = None             # None: 아직 후보가 아님
+        self.chars_start = chars_start
+        self.links_start = links_start
+        self.block_start = block_start
+        self.block_end = None
+        self.link_density = 0.0
+        self.opens_block = False
+
+    def add_score(self, score: float) -> None:
+        self.score = (self.score if self.score is not None else TAG_WEIGHTS.get(self.tag, 0) + self.weight) + score
+
+    def contains(self, other: "_Node") -> bool:
+        return self.block_start <= other.block_start and other.block_end <= self.block_end
+
+
+class _ReadabilityTarget:
+    """
+    lxml parser target that picks the main content by readability-style text density scoring.
+
+    Each paragraph scores 1 + commas + length/100 (max 3) and passes it to its parent (full)
+    and grandparent (half). Candidates are scaled by (1 - link density), where link and text
+    lengths come from running counters snapshotted at start/end, so the whole document is
+    scored in one linear pass without building a tree. At close() the best candidate is
+    promoted to a shared ancestor or parent when readability would, and qualifying siblings
+    (including repeated sibling sections of list-heavy hub pages) are merged in; blocks are
+    emitted in document order.
+    """
+
+    def __init__(self):
+        self._stack: list[_Node | None] = []   # None: 제외된 요소
+        self._skip_depth = 0
+        self._chars = 0                        # 지금까지 본 텍스트 길이
+        self._link_chars = 0                   # 그 중 링크 안의 텍스트 길이
+        self._link_depth = 0
+        self._block_buffers = []               # (slot, tag, parent, text, links_start), innermost last
+        self._blocks = []                      # (tag, text, parent, link_chars) in document order
+        self._candidates: list[_Node] = []
+        self._text_nodes = []                  # fallback
+        self._text_node = []
+        self._title = None
+        self._title_buffer = None
+        self.anchors = _LinkCollector()
+
+    def _flush_text_node(self):
+        if self._text_node:
+            text = "".join(self._text_node).strip()
+            if text:
+                self._text_nodes.append(text)
+            self._text_node = []
+
+    def start(self, tag, attrib):
+        self._flush_text_node()
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag == "title" and self._title is None:
+            self._title_buffer = []
+        if self._skip_depth or tag in SKIP_TAGS or _is_unlikely(tag, attrib):
+            self._skip_depth += 1
+            self._stack.append(None)
+            return
+
+        parent = self._stack[-1] if self._stack else None
+        node = _Node(tag, parent, _class_weight(attrib), self._chars, self._link_chars, len(self._blocks))
+        if tag == "a":
+            self._link_depth += 1
+            self.anchors.start(attrib)
+        in_row = bool(self._block_buffers) and self._block_buffers[-1][1] == "tr"
+        if tag in CELL_TAGS and in_row:
+            row = self._block_buffers[-1][3]
+            if row:
+                row.append(" | ")  # 표의 행은 셀을 구분자로 이어 한 블록으로
+        elif tag in BLOCK_TAGS:
+            node.opens_block = True
+            self._block_buffers.append((len(self._blocks), tag, parent, [], self._link_chars))
+            self._blocks.append(None)
+        self._stack.append(node)
+
+    def end(self, tag):
+        self._flush_text_node()
+        if not self._stack:
+            return
+        node = self._stack.pop()
+        if node is None:
+            self._skip_depth -= 1
+            if tag == "title" and self._title_buffer is not None:
+                self._close_title()
+            return
+        if node.tag == "title" and self._title_buffer is not None:
+            self._close_title()
+        if node.tag == "a":
+            self._link_depth -= 1
+            self.anchors.end()
+
+        if node.opens_block:
+            self._end_block()
+
+        node.block_end = len(self._blocks)
+        if node.score is not None:
+            chars = self._chars - node.chars_start
+            node.link_density = (self._link_chars - node.links_start) / chars if chars else 0.0
+            node.score *= 1 - node.link_density
+            self._candidates.append(node)
+
+    def _close_title(self):
+        self._title = "".join(self._title_buffer).strip()
+        self._title_buffer = None
+
+    def _end_block(self) -> None:
+        slot, tag, parent, buffer, links_start = self._block_buffers.pop()
+        text = "".join(buffer) if tag == "pre" else " ".join("".join(buffer).split())
+        text = text.strip()
+        if not text:
+            return
+        if tag in DIV_LIKE_TAGS:
+            if len(text) < MIN_SCORED_CHARS:
+                return
+            tag = "p"  # 블록 자식 없이 텍스트를 직접 담은 div
+        self._blocks[slot] = (tag, text, parent, self._link_chars - links_start)
+
+        if tag in PARAGRAPH_TAGS and len(text) >= MIN_SCORED_CHARS and parent is not None:
+            score = 1 + text.count(",") + min(len(text) // 100, 3)
+            parent.add_score(score)
+            if parent.parent is not None:
+                parent.parent.add_score(score / 2)
+
+    def data(self, text):
+        if self._title_buffer is not None:
+            self._title_buffer.append(text)
+        if self._skip_depth:
+            return
+        self._text_node.append(text)
+        self.anchors.data(text)
+        length = len(text.strip())
+        self._chars += length
+        if self._link_depth:
+            self._link_chars += length
+        if self._block_buffers:
+            self._block_buffers[-1][3].append(text)  # nested blocks keep their own text
+
+    def _top_candidate(self) -> _Node | None:
+        if not self._candidates:
+            return None
+        top = max(self._candidates, key=lambda n: n.score)
+
+        # 점수가 비슷한 후보 여럿이 공통 조상 아래 흩어져 있으면 그 조상이 본문
+        alternatives = [n for n in self._candidates if n is not top and n.score >= top.score * 0.75]
+        if len(alternatives) >= MIN_TOP_CANDIDATES:
+            ancestor = top.parent
+            while ancestor is not None and ancestor.tag != "body":
+                if ancestor.block_end is not None and sum(ancestor.contains(n) for n in alternatives) >= MIN_TOP_CANDIDATES:
+                    return ancestor
+                ancestor = ancestor.parent
+
+        # 부모 점수가 더 높아지는 동안 위로 이동
+        last_score = top.score
+        parent = top.parent
+        while parent is not None and parent.tag != "body":
+            if parent.score is None:
+                parent = parent.parent
+                continue
+            if parent.score < last_score / 3:
+                break
+            if parent.score > last_score:
+                return parent
+            last_score = parent.score
+            parent = parent.parent
+        return top
+
+    def _selected_ranges(self, top: _Node) -> list[tuple[int, int]]:
+        ranges = [(top.block_start, top.block_end)]
+        parent = top.parent
+        if parent is None or top.tag == "body":
+            return ranges
+
+        # 같은 부모 아래 충분히 점수가 높은 형제 후보
+        threshold = max(10, top.score * 0.2)
+        for node in self._candidates:
+            if node is not top and node.parent is parent and node.score >= threshold:
+                ranges.append((node.block_start, node.block_end))
+        # 형제로 바로 붙은 문단 (링크가 적고 충분히 길거나 문장으로 끝나는 경우)
+        for i in range(parent.block_start, parent.block_end):
+            block = self._blocks[i]
+            if block is None or block[2] is not parent or block[0] != "p":
+                continue
+            _, text, _, link_chars = block
+            density = link_chars / len(text)
+            if (len(text) >= SIBLING_PARAGRAPH_CHARS and density < 0.25) or (
+                    density == 0 and text.endswith((".", "!", "?", '"'))):
+                ranges.append((i, i + 1))
+        # 같은 태그로 반복되는 형제 섹션 (목록/카드 위주라 문단 점수를 받지 못하는 허브 페이지의 섹션)
+        if top.tag in REPEATED_SECTION_TAGS:
+            for i in range(parent.block_start, parent.block_end):
+                block = self._blocks[i]
+                if block is None or top.block_start <= i < top.block_end:
+                    continue
+                section = block[2]
+                while section is not None and section.parent is not parent:
+                    section = section.parent
+                if section is not None and section.tag == top.tag:
+                    ranges.append((i, i + 1))
+        return ranges
+
+    def close(self):
+        self._flush_text_node()
+
+        content = ""
+        top = self._top_candidate()
+        if top is not None:
+            selected = [False] * len(self._blocks)
+            for start, end in self._selected_ranges(top):
+                selected[start:end] = [True] * (end - start)
+            text_elements = []
+            for i, block in enumerate(self._blocks):
+                if block is None or not selected[i]:
+                    continue
+                tag, text, _, _ = block
+                if tag in HEADING_TAGS:
+                    text_elements.append(f"\n## {text}\n")
+                elif tag == "p":
+                    if len(text) > MIN_PARAGRAPH_CHARS:
+                        text_elements.append(text)
+                elif tag == "li":
+                    text_elements.append(f"- {text}")
+                else:  # pre, tr
+                    text_elements.append(text)
+            content = "\n\n".join(text_elements)
+
+        # Fallback: no scorable paragraphs - use all text nodes collected in the same pass
+        if not content or len(content) < MIN_CONTENT_CHARS:
+            content = "\n".join(self._text_nodes)
+
+        return self._title or "No Title", content
+
+
+class ReadabilityEngine(HtmlExtractor):
+    """
+    Incremental, single-pass readability extractor (pure Python on the lxml parser).
+
+    Same interface as HtmlExtractor, but the main content is chosen by text density and
+    link density scoring instead of fixed container selectors, which copes better with
+    pages that do not use <article>/<main> or that wrap the body in generic divs.
+    """
+
+    target_class = _ReadabilityTarget
+
+
+def extract_readable(content: bytes, encoding: str | None = None) -> tuple[str, str]:
+    """Extract (title, content) from a complete HTML document with the readability engine."""
+    extractor = ReadabilityEngine(encoding=encoding)
+    extractor.feed(content)
+    return extractor.close()
@@ -0,0 +1,127 @@
+import re
+
+CHARS_PER_TOKEN = 4  # 대략적인 토큰 추정치 (영문 기준)
+ELISION_MARKER = "[...]"
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_chunks(text: str, max_chars: int = 1200) -> list[str]:
+    """
+    Split text into chunks of at most ~max_chars, packing whole paragraphs together.
+
+    Paragraphs longer than max_chars are split on sentence boundaries (or hard-split).
+    """
+    pieces = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        sentence_buffer = ""
+        for sentence in re.split(r"(?<=[.!?。])\s+", paragraph):
+            while len(sentence) > max_chars:
+                pieces.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]
+            if sentence_buffer and len(sentence_buffer) + len(sentence) + 1 > max_chars:
+                pieces.append(sentence_buffer)
+                sentence_buffer = ""
+            sentence_buffer = f"{sentence_buffer} {sentence}".strip()
+        if sentence_buffer:
+            pieces.append(sentence_buffer)
+
+    chunks, buffer = [], ""
+    for piece in pieces:
+        if buffer and len(buffer) + len(piece) + 2 > max_chars:
+            chunks.append(buffer)
+            buffer = ""
+        buffer = f"{buffer}\n\n{piece}" if buffer else piece
+    if buffer:
+        chunks.append(buffer)
+    return chunks
+
+
+class ChunkSelection:
+    """Result of query-focused chunk selection over a page."""
+
+    def __init__(self, text: str, total_chunks: int, selected_chunks: int, total_tokens: int, selected_tokens: int):
+        self.text = text
+        self.total_chunks = total_chunks
+        self.selected_chunks = selected_chunks
+        self.total_tokens = total_tokens
+        self.selected_tokens = selected_tokens
+
+    @property
+    def elided(self) -> bool:
+        return self.selected_chunks < self.total_chunks
+
+    def summary(self) -> str:
+        if not self.elided:
+            return f"Full content (~{self.total_tokens} tokens)"
+        elided_pct = 100 * (self.total_tokens - self.selected_tokens) / max(self.total_tokens, 1)
+        return (f"Showing {self.selected_chunks} of {self.total_chunks} chunks most relevant to the query "
+                f"(~{self.selected_tokens} of ~{self.total_tokens} tokens, {elided_pct:.0f}% elided)")
+
+
+def rank_chunks(chunks: list[str], query: str) -> list[float]:
+    """Score chunks against the query with TF-IDF cosine similarity (local, no network)."""
+    from sklearn.feature_extraction.text import TfidfVectorizer  # 무거운 import는 사용할 때만
+
+    vectorizer = TfidfVectorizer(sublinear_tf=True, ngram_range=(1, 2), stop_words="english")
+    try:
+        matrix = vectorizer.fit_transform(chunks)
+    except ValueError:  # 어휘가 비어 있음 (불용어/기호만 있는 경우)
+        return [0.0] * len(chunks)
+    query_vector = vectorizer.transform([query])
+    return (matrix @ query_vector.T).toarray().ravel().tolist()
+
+
+def select_relevant_chunks(text: str, query: str, token_budget: int = 3000, top_k: int = 8,
+                           chunk_chars: int = 1200) -> ChunkSelection:
+    """
+    Keep only the chunks of `text` most relevant to `query`, within a token budget.
+
+    Args:
+        text: Page text
+        query: Focus query
+        token_budget: Maximum estimated tokens to return (default: 3000)
+        top_k: Maximum number of chunks to return (default: 8)
+        chunk_chars: Target chunk size in characters (default: 1200)
+
+    Returns:
+        ChunkSelection whose text holds the selected chunks in document order,
+        with an elision marker wherever chunks were dropped
+    """
+    total_tokens = estimate_tokens(text)
+    chunks = split_chunks(text, chunk_chars)
+    if total_tokens <= token_budget or len(chunks) <= 1:
+        return ChunkSelection(text, len(chunks), len(chunks), total_tokens, total_tokens)
+
+    scores = rank_chunks(chunks, query)
+    # 점수 내림차순, 동점이면 문서 앞쪽 우선 (쿼리와 겹치는 단어가 없으면 앞부분이 선택됨)
+    ranked = sorted(range(len(chunks)), key=lambda i: (-scores[i], i))
+
+    selected, used_tokens = [], 0
+    for i in ranked:
+        if len(selected) >= top_k:
+            break
+        chunk_tokens = estimate_tokens(chunks[i])
+        if used_tokens + chunk_tokens > token_budget:
+            continue
+        selected.append(i)
+        used_tokens += chunk_tokens
+
+    parts, previous = [], -1
+    for i in sorted(selected):
+        if i != previous + 1:
+            parts.append(ELISION_MARKER)
+        parts.append(chunks[i])
+        previous = i
+    if previous != len(chunks) - 1:
+        parts.append(ELISION_MARKER)
+
+    return ChunkSelection("\n\n".join(parts), len(chunks), len(selected), total_tokens, used_tokens)
@@ -0,0 +1,146 @@
+import re
+import heapq
+import asyncio
+from urllib.parse import urljoin, urldefrag, urlsplit
+
+from .article import Article
+from .async_crawler import AsyncCrawler
+from .relevance import rank_chunks
+
+# 본문이 아닌 링크 (로그인, 약관, 공유 버튼 등)와 크롤링할 수 없는 파일
+# URL은 경로 세그먼트 전체, 링크 텍스트는 텍스트 전체가 일치할 때만 제외 (/contact-center-ai 등은 유지)
+_SKIP_WORDS = (r"log-?in|sign-?in|sign-?up|register|subscribe|privacy(?:-policy)?|terms(?:-of-(?:use|service))?|"
+               r"cookies?(?:-policy)?|careers|contact(?:-us)?|share")
+SKIP_PATH_PATTERN = re.compile(rf"(?:^|/)(?:{_SKIP_WORDS})(?:\.\w+)?(?=/|$)", re.IGNORECASE)
+SKIP_QUERY_PATTERN = re.compile(r"(?:^|&)share=", re.IGNORECASE)
+SKIP_ANCHOR_PATTERN = re.compile(rf"^(?:{_SKIP_WORDS.replace('-', '[ -]')})(?: on \w+)?$", re.IGNORECASE)
+SKIP_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp", ".zip", ".gz", ".mp3", ".mp4", ".css", ".js", ".ico")
+
+
+def _site(url: str) -> str:
+    host = urlsplit(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _skip_link(url: str, anchor: str) -> bool:
+    parts = urlsplit(url)
+    return bool(SKIP_PATH_PATTERN.search(parts.path) or SKIP_QUERY_PATTERN.search(parts.query)
+                or SKIP_ANCHOR_PATTERN.match(anchor.strip())) or parts.path.lower().endswith(SKIP_EXTENSIONS)
+
+
+def _link_words(url: str) -> str:
+    """Words in a URL path ("/reports/edge-ai-2025" -> "reports edge ai 2025")"""
+    return " ".join(re.split(r"[\W_]+", urlsplit(url).path))
+
+
+class SpiderPage:
+    """A page visited by the spider."""
+
+    def __init__(self, url: str, depth: int, anchor: str, article: Article | None = None,
+                 error: Exception | None = None):
+        self.url = url
+        self.depth = depth
+        self.anchor = anchor
+        self.article = article
+        self.error = error
+        self.score = 0.0
+
+
+class Spider:
+    """
+    Bounded, best-first same-site crawler for hub pages (report indexes, agendas).
+
+    Starting from a seed URL it follows links on the same site (ignoring "www.") up to
+    `max_depth` hops. Discovered links wait in a priority frontier ranked by the TF-IDF
+    relevance of their anchor text and URL path to the task, so the page budget is spent
+    on the most promising links first. Pages are fetched through an AsyncCrawler (cache,
+    host scheduler and per-host limits apply) with at most `max_concurrency` in flight.
+    """
+
+    def __init__(self, async_crawler: AsyncCrawler, max_depth: int = 2, max_pages: int = 20, max_concurrency: int = 4):
+        """
+        Args:
+            async_crawler: Crawler used to fetch pages
+            max_depth: Maximum link hops from the seed page (default: 2)
+            max_pages: Maximum pages fetched per crawl, including the seed (default: 20)
+            max_concurrency: Maximum pages fetched at once (default: 4)
+        """
+        self.async_crawler = async_crawler
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.max_concurrency = max_concurrency
+
+    def _links(self, page: SpiderPage, site: str, seen: set[str]) -> list[tuple[str, str]]:
+        """New same-site (url, anchor text) pairs found on a page"""
+        links = []
+        base = page.article.final_url or page.url  # 상대 링크는 리다이렉트 후 URL 기준
+        for href, anchor in page.article.links:
+            url = urldefrag(urljoin(base, href)).url
+            if urlsplit(url).scheme not in ("http", "https") or _site(url) != site or url in seen:
+                continue
+            if _skip_link(url, anchor):
+                continue
+            seen.add(url)
+            links.append((url, anchor))
+        return links
+
+    async def crawl(self, seed_url: str, task: str) -> list[SpiderPage]:
+        """
+        Crawl from `seed_url`, following the links most relevant to `task` first.
+
+        Returns:
+            Visited pages (successful or failed) in visiting order; the seed page comes first
+        """
+        site = _site(seed_url)
+        seen = {urldefrag(seed_url).url}
+        frontier: list[tuple[float, int, int, str, str]] = []  # (-priority, depth, order, url, anchor)
+        order = 0
+        heapq.heappush(frontier, (0.0, 0, order, seed_url, ""))
+
+        pages: list[SpiderPage] = []
+        pending: dict[asyncio.Task, SpiderPage] = {}
+        while frontier or pending:
+            while frontier and len(pending) < self.max_concurrency and len(pages) + len(pending) < self.max_pages:
+                _, depth, _, url, anchor = heapq.heappop(frontier)
+                page = SpiderPage(url, depth, anchor)
+                pending[asyncio.ensure_future(self.async_crawler.crawl(url))] = page
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task_done in done:
+                page = pending.pop(task_done)
+                pages.append(page)
+                if task_done.exception() is not None:
+                    page.error = task_done.exception()
+                    continue
+                page.article = task_done.result()
+                if page.article.final_url:
+                    seen.add(urldefrag(page.article.final_url).url)  # 리다이렉트 후 URL로 같은 페이지를 다시 방문하지 않음
+                    if page.depth == 0:
+                        site = _site(page.article.final_url)  # 시작 페이지가 다른 호스트로 리다이렉트된 경우
+                if page.depth >= self.max_depth:
+                    continue
+                links = self._links(page, site, seen)
+                if not links:
+                    continue
+                scores = rank_chunks([f"{anchor} {_link_words(url)}" for url, anchor in links], task)
+                for (url, anchor), score in zip(links, scores):
+                    order += 1
+                    heapq.heappush(frontier, (-score, page.depth + 1, order, url, anchor))
+        return pages
+
+    def crawl_sync(self, seed_url: str, task: str) -> list[SpiderPage]:
+        """Blocking wrapper around `crawl()` for sync callers."""
+        return self.async_crawler.submit(self.crawl(seed_url, task)).result()
+
+
+def rank_pages(pages: list[SpiderPage], task: str) -> list[SpiderPage]:
+    """Successful pages ordered by relevance of their title and text to `task` (sets page.score)"""
+    fetched = [page for page in pages if page.article is not None and page.article.text.strip()]
+    if not fetched:
+        return []
+    scores = rank_chunks([f"{page.article.title}\n{page.article.text}" for page in fetched], task)
+    for page, score in zip(fetched, scores):
+        page.score = score
+    return sorted(fetched, key=lambda page: -page.score)
@@ -1,8 +1,9 @@
 import logging
-import subprocess
 from typing import Any, Annotated
 from strands.types.tools import ToolResult, ToolUse
 from src.tools.decorators import log_io
+from src.utils.tool_progress import track_execution, stream_process
+from src.utils.exec_policy import limit_output, limit_command
 
 
 # Simple logger setup
@@ -32,26 +33,37 @@ class Colors:
     END = '\033[0m'
 
 @log_io
-def handle_bash_tool(cmd: Annotated[str, "The bash command to be executed."]):
+def handle_bash_tool(cmd: Annotated[str, "The bash command to be executed."],
+                     agent_name: Annotated[str | None, "Agent that called the tool."] = None,
+                     tool_id: Annotated[str | None, "toolUseId of the call, attached to progress events."] = None):
     """Use this to execute bash command and do necessary operations."""
 
     print()  # Add newline before log
     logger.info(f"\n{Colors.GREEN}Executing Bash: {cmd}{Colors.END}")
     try:
-        # Execute the command and capture output
-        result = subprocess.run(
-            cmd, shell=True, check=True, text=True, capture_output=True
-        )
+        # Execute the command, streaming its output as tool_progress events (the UI/watchdog can abort it)
+        with track_execution("bash_tool", cmd, agent_name=agent_name, tool_id=tool_id) as execution:
+            result = stream_process(limit_command(cmd), execution, shell=True)
+
+        # 토큰 예산을 넘는 출력은 앞/뒷부분만 반환하고 전체는 artifacts 폴더에 저장 (stdout과 stderr 합산)
+        failed = result.aborted or result.returncode != 0
+        output = limit_output(f"Stdout: {result.stdout}\nStderr: {result.stderr}" if failed else result.stdout, "bash_tool")
+
+        if result.aborted:
+            error_message = f"Command failed: execution aborted ({result.aborted}).\n{output}"
+            logger.error(f"{Colors.RED}Command aborted: {result.aborted}{Colors.END}")
+            return error_message
+
+        if result.returncode != 0:
+            # If command fails, return error information
+            error_message = f"Command failed with exit code {result.returncode}.\n{output}"
+            logger.error(f"{Colors.RED}Command failed: {result.returncode}{Colors.END}")
+            return error_message
+
         # Return stdout as the result
-        results = "||".join([cmd, result.stdout])
+        results = "||".join([cmd, output])
         return results + "\n"
 
-    except subprocess.CalledProcessError as e:
-        # If command fails, return error information
-        error_message = f"Command failed with exit code {e.returncode}.\nStdout: {e.stdout}\nStderr: {e.stderr}"
-        logger.error(f"{Colors.RED}Command failed: {e.returncode}{Colors.END}")
-        return error_message
-
     except Exception as e:
         # Catch any other exceptions
         error_message = f"Error executing command: {str(e)}"
@@ -62,9 +74,10 @@ def handle_bash_tool(cmd: Annotated[str, "The bash command to be executed."]):
 def bash_tool(tool: ToolUse, **_kwargs: Any) -> ToolResult:
     tool_use_id = tool["toolUseId"]
     cmd = tool["input"]["cmd"]
+    agent_name = getattr(_kwargs.get("agent"), "name", None)
     
     # Use the existing handle_bash_tool function
-    result = handle_bash_tool(cmd)
+    result = handle_bash_tool(cmd, agent_name=agent_name, tool_id=tool_use_id)
     
     # Check if execution was successful based on the result string
     if "Command failed" in result or "Error executing command" in result:
@@ -1,8 +1,73 @@
+import os
 import logging
+import threading
 from typing import Any, Annotated
 from strands.types.tools import ToolResult, ToolUse
 from src.tools.decorators import log_io
-from src.crawler import Crawler
+from src.crawler import Article, Crawler, AsyncCrawler, HttpCache, HostScheduler, Prefetcher, FeedWatcher
+from src.crawler.relevance import select_relevant_chunks
+from src.crawler.dedup import NearDuplicateIndex
+from src.crawler.article_index import ArticleIndex, load_taxonomy
+from src.crawler.feed_watcher import load_feed_list
+from src.utils.run_hooks import on_run_start, on_run_end, on_agent_start
+from src.utils.seen_urls import seen_urls
+
+# Batch crawl concurrency limits (global / per host)
+CRAWLER_MAX_CONCURRENCY = int(os.getenv("CRAWLER_MAX_CONCURRENCY", "8"))
+CRAWLER_MAX_PER_HOST = int(os.getenv("CRAWLER_MAX_PER_HOST", "2"))
+
+# Per-host politeness and circuit breaker (fast-fail hosts that keep timing out or blocking)
+CRAWLER_HOST_MIN_INTERVAL = float(os.getenv("CRAWLER_HOST_MIN_INTERVAL", "0.5"))
+CRAWLER_HOST_FAILURE_THRESHOLD = int(os.getenv("CRAWLER_HOST_FAILURE_THRESHOLD", "2"))
+CRAWLER_HOST_COOLDOWN = float(os.getenv("CRAWLER_HOST_COOLDOWN", "300"))
+
+# Maximum decoded bytes downloaded per page (larger pages are cut off and parsed up to this point)
+CRAWLER_MAX_BYTES = int(os.getenv("CRAWLER_MAX_BYTES", str(2 * 1024 * 1024)))
+
+# HTML pages larger than this are parsed in the extractor process pool (0 parses every page in-process)
+CRAWLER_HTML_OFFLOAD_BYTES = int(os.getenv("CRAWLER_HTML_OFFLOAD_BYTES", str(256 * 1024)))
+
+# HTML content extraction: "selectors" (container priority list) or "readability" (text density scoring)
+CRAWLER_HTML_EXTRACTOR = os.getenv("CRAWLER_HTML_EXTRACTOR", "selectors")
+
+# Query-focused excerpting: per-page token budget and maximum number of chunks returned
+CRAWL_TOKEN_BUDGET = int(os.getenv("CRAWL_TOKEN_BUDGET", "3000"))
+CRAWL_TOP_K = int(os.getenv("CRAWL_TOP_K", "8"))
+
+# Near-duplicate (syndicated copy) detection; optionally persisted across runs
+CRAWL_DEDUP_ENABLED = os.getenv("CRAWL_DEDUP_ENABLED", "true").lower() == "true"
+CRAWL_DEDUP_MAX_DISTANCE = int(os.getenv("CRAWL_DEDUP_MAX_DISTANCE", "7"))
+CRAWL_DEDUP_PATH = os.getenv("CRAWL_DEDUP_PATH") or None
+CRAWL_DEDUP_MAX_AGE_DAYS = float(os.getenv("CRAWL_DEDUP_MAX_AGE_DAYS", "30"))
+CRAWL_DEDUP_MAX_ENTRIES = int(os.getenv("CRAWL_DEDUP_MAX_ENTRIES", "50000"))
+
+# Persistent HTTP cache (kept outside ./artifacts so it survives between runs)
+CRAWLER_CACHE_ENABLED = os.getenv("CRAWLER_CACHE_ENABLED", "true").lower() == "true"
+CRAWLER_CACHE_DIR = os.getenv("CRAWLER_CACHE_DIR") or None
+CRAWLER_CACHE_TTL = int(os.getenv("CRAWLER_CACHE_TTL", "86400"))
+CRAWLER_CACHE_MAX_MB = int(os.getenv("CRAWLER_CACHE_MAX_MB", "512"))
+
+# Speculative prefetch of search result URLs into the cache (requires the HTTP cache)
+CRAWLER_PREFETCH_CONCURRENCY = int(os.getenv("CRAWLER_PREFETCH_CONCURRENCY", "2"))
+CRAWLER_PREFETCH_MAX_URLS = int(os.getenv("CRAWLER_PREFETCH_MAX_URLS", "30"))
+
+# Hedged crawl (`first_n`): seconds without any finished crawl before the next candidate url is started
+CRAWL_HEDGE_DELAY = float(os.getenv("CRAWL_HEDGE_DELAY", "2.0"))
+
+# Persistent full-text index of every crawled article (searched by local_search_tool before the web)
+LOCAL_INDEX_ENABLED = os.getenv("LOCAL_INDEX_ENABLED", "true").lower() == "true"
+LOCAL_INDEX_PATH = os.getenv("LOCAL_INDEX_PATH") or None
+LOCAL_INDEX_MAX_ROWS = int(os.getenv("LOCAL_INDEX_MAX_ROWS", "20000"))
+LOCAL_INDEX_RETENTION_DAYS = float(os.getenv("LOCAL_INDEX_RETENTION_DAYS", "365"))
+
+# Monitored RSS/Atom feeds and sitemaps: new items are crawled into the cache and the local index
+FEED_WATCH_ENABLED = os.getenv("FEED_WATCH_ENABLED", "true").lower() == "true"
+FEED_LIST_PATH = os.getenv("FEED_LIST_PATH", "./feeds.txt")
+FEED_STATE_PATH = os.getenv("FEED_STATE_PATH") or None
+FEED_MAX_ITEMS = int(os.getenv("FEED_MAX_ITEMS", "20"))
+FEED_CRAWL_CONCURRENCY = int(os.getenv("FEED_CRAWL_CONCURRENCY", "2"))
+FEED_MAX_ATTEMPTS = int(os.getenv("FEED_MAX_ATTEMPTS", "3"))
+FEED_REFRESH_ON_RUN_START = os.getenv("FEED_REFRESH_ON_RUN_START", "false").lower() == "true"
 
 # 새 핸들러와 포맷터 설정
 logger = logging.getLogger(__name__)
@@ -18,7 +83,7 @@ logger.setLevel(logging.INFO)  # 기본 레벨은 INFO로 설정
 
 TOOL_SPEC = {
     "name": "crawl_tool",
-    "description": "Use this to crawl a url and get a readable content in markdown format.",
+    "description": "Use this to crawl a url and get a readable content in markdown format. To crawl several sources at once, pass them together in `urls`; they are fetched in parallel in a single call. When you only need a few of several equivalent sources, add `first_n` to get the fastest N without waiting for slow sites.",
     "inputSchema": {
         "json": {
             "type": "object",
@@ -26,9 +91,22 @@ TOOL_SPEC = {
                 "url": {
                     "type": "string",
                     "description": "The url to crawl."
+                },
+                "urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "A list of urls to crawl in parallel. Use this instead of `url` when crawling multiple sources."
+                },
+                "query": {
+                    "type": "string",
+                    "description": "Optional focus query. When given, only the passages of each page most relevant to it are returned instead of the full page."
+                },
+                "first_n": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Optional. With `urls` given as ranked, interchangeable candidate sources (e.g. search results), return only the first N pages crawled successfully; slow or failing sources are replaced by the next candidates and the rest are cancelled."
                 }
-            },
-            "required": ["url"]
+            }
         }
     }
 }
@@ -43,51 +121,291 @@ class Colors:
     END = '\033[0m'
 
 # Initialize crawler instance with 30 second timeout
-crawler = Crawler(timeout=30)
+# The batch crawler shares its pooled session so single and batch crawls reuse the same connections
+http_cache = HttpCache(
+    cache_dir=CRAWLER_CACHE_DIR,
+    ttl=CRAWLER_CACHE_TTL,
+    max_bytes=CRAWLER_CACHE_MAX_MB * 1024 * 1024,
+) if CRAWLER_CACHE_ENABLED else None
+host_scheduler = HostScheduler(
+    min_interval=CRAWLER_HOST_MIN_INTERVAL,
+    max_concurrency=CRAWLER_MAX_PER_HOST,
+    failure_threshold=CRAWLER_HOST_FAILURE_THRESHOLD,
+    cooldown=CRAWLER_HOST_COOLDOWN,
+)
+crawler = Crawler(timeout=30, pool_maxsize=CRAWLER_MAX_CONCURRENCY, cache=http_cache, max_bytes=CRAWLER_MAX_BYTES,
+                  scheduler=host_scheduler, html_extractor=CRAWLER_HTML_EXTRACTOR,
+                  html_offload_bytes=CRAWLER_HTML_OFFLOAD_BYTES)
+async_crawler = AsyncCrawler(crawler=crawler, max_concurrency=CRAWLER_MAX_CONCURRENCY, max_per_host=CRAWLER_MAX_PER_HOST)
+
+on_run_start(host_scheduler.reset_stats)
+
+@on_run_end
+def _log_host_stats():
+    stats = host_scheduler.stats()
+    if not stats:
+        return
+    lines = [
+        f"  {host}: {s['requests']} req, {s['failures']} failed, {s['skipped']} skipped, "
+        f"avg {s['avg_latency']:.1f}s / max {s['max_latency']:.1f}s{' [breaker open]' if s['breaker_open'] else ''}"
+        for host, s in sorted(stats.items(), key=lambda item: (-item[1]['failures'], -item[1]['max_latency']))
+    ]
+    logger.info(f"{Colors.BLUE}===== Crawler host stats ====={Colors.END}\n" + "\n".join(lines))
+
+if http_cache:
+    on_run_start(http_cache.reset_stats)
+
+    @on_run_end
+    def _log_cache_stats():
+        stats = http_cache.stats()
+        logger.info(
+            f"{Colors.BLUE}===== Crawler cache: {stats['hits']} hits, {stats['revalidated']} revalidated (304), "
+            f"{stats['misses']} misses, {stats['bytes_saved'] / 1024:.1f} KB saved ====={Colors.END}"
+        )
+
+prefetcher = Prefetcher(
+    async_crawler,
+    max_concurrency=CRAWLER_PREFETCH_CONCURRENCY,
+    max_urls=CRAWLER_PREFETCH_MAX_URLS,
+) if http_cache and CRAWLER_PREFETCH_CONCURRENCY > 0 else None
+
+if prefetcher:
+    on_run_start(prefetcher.reset_stats)
+
+    @on_run_end
+    def _cancel_prefetch():
+        prefetcher.cancel()
+        stats = prefetcher.stats()
+        if stats["scheduled"]:
+            logger.info(
+                f"{Colors.BLUE}===== Prefetch: {stats['scheduled']} scheduled, {stats['used']} used, "
+                f"{stats['failed']} failed, {stats['cancelled']} cancelled at run end ====={Colors.END}"
+            )
+
+def _wait_for_prefetch(urls: list[str]) -> None:
+    """Let in-flight prefetches of these urls finish so the crawl is served from the cache (queued ones are cancelled)."""
+    if prefetcher:
+        prefetcher.wait(urls, timeout=crawler.timeout)
+
+dedup_index = NearDuplicateIndex(
+    max_distance=CRAWL_DEDUP_MAX_DISTANCE,
+    path=CRAWL_DEDUP_PATH,
+    max_age_days=CRAWL_DEDUP_MAX_AGE_DAYS,
+    max_entries=CRAWL_DEDUP_MAX_ENTRIES,
+) if CRAWL_DEDUP_ENABLED else None
+
+if dedup_index:
+    on_run_start(dedup_index.reset)
+    # 리서치 단계마다 새 에이전트가 만들어지므로, 이전 에이전트가 받은 페이지는 중복 생략 대상이 아님
+    on_agent_start(dedup_index.new_scope)
+
+    @on_run_end
+    def _log_dedup_stats():
+        logger.info(f"{Colors.BLUE}===== Near-duplicate pages skipped: {dedup_index.duplicates_found} ====={Colors.END}")
+
+# 기술 도메인 태그는 프롬프트의 도메인 분류표 기준
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "prompts", "Emerging-Tech-Domains-and-sub-domains.md")
+
+article_index = ArticleIndex(
+    path=LOCAL_INDEX_PATH,
+    taxonomy=load_taxonomy(TAXONOMY_PATH),
+    max_rows=LOCAL_INDEX_MAX_ROWS,
+    retention_days=LOCAL_INDEX_RETENTION_DAYS,
+) if LOCAL_INDEX_ENABLED else None
+
+# 피드 항목은 별도의 저동시성 배치 크롤러로 가져와 리서처의 크롤링 슬롯을 차지하지 않음 (세션/캐시/호스트 스케줄러는 공유)
+feed_watcher = FeedWatcher(
+    AsyncCrawler(crawler=crawler, max_concurrency=FEED_CRAWL_CONCURRENCY, max_per_host=1),
+    index=article_index,
+    path=FEED_STATE_PATH,
+    max_items=FEED_MAX_ITEMS,
+    max_attempts=FEED_MAX_ATTEMPTS,
+) if FEED_WATCH_ENABLED else None
+_feed_refresh_lock = threading.Lock()
+
+def refresh_feeds() -> dict[str, int] | None:
+    """Poll the monitored feeds once (skipped if a refresh is already running)."""
+    feeds = load_feed_list(FEED_LIST_PATH)
+    if feed_watcher is None or not feeds or not _feed_refresh_lock.acquire(blocking=False):
+        return None
+    try:
+        stats = feed_watcher.poll(feeds)
+    except Exception as e:
+        logger.warning(f"{Colors.YELLOW}Feed refresh failed: {repr(e)}{Colors.END}")
+        return None
+    finally:
+        _feed_refresh_lock.release()
+    logger.info(
+        f"{Colors.BLUE}===== Feeds: {stats['feeds']} checked, {stats['not_modified']} not modified, "
+        f"{stats['failed']} failed, {stats['crawled']}/{stats['new_items']} new items crawled, "
+        f"{stats['given_up']} given up ====={Colors.END}"
+    )
+    return stats
+
+if feed_watcher and FEED_REFRESH_ON_RUN_START:
+    @on_run_start
+    def _refresh_feeds_in_background():
+        # 플래너가 계획을 세우는 동안 백그라운드에서 코퍼스를 갱신
+        threading.Thread(target=refresh_feeds, name="feed-refresh", daemon=True).start()
+
+def index_article(url, article) -> None:
+    """Add a crawled article to the local full-text index (failures never fail the crawl)."""
+    if article_index is None:
+        return
+    try:
+        article_index.add(url, article)
+    except Exception as e:
+        logger.warning(f"{Colors.YELLOW}Indexing failed for {url}: {repr(e)}{Colors.END}")
+
+def _duplicate_stub(url, article) -> str | None:
+    """Short stub for a near-identical copy of a page the current agent already received, or None."""
+    if dedup_index is None:
+        return None
+    duplicate_of, received_as = dedup_index.check_and_add(url, article.text)
+    if received_as is None:
+        return None
+    logger.info(f"{Colors.YELLOW}===== {url} is a near-duplicate of {duplicate_of} ====={Colors.END}")
+    return f"""Successfully crawled URL: {url}
+
+Title: {article.title if hasattr(article, 'title') else 'N/A'}
+Duplicate of: {received_as}
+
+Content omitted: this page is a near-identical copy (e.g. syndicated press release) of {received_as}, whose content you already received. Use that content instead."""
+
+def _format_article(url, article, query=None) -> str:
+    # Extracted text is used as-is (no markdown/message conversion)
+    content = article.text
+    if query:
+        # Keep only the chunks most relevant to the focus query within the token budget
+        selection = select_relevant_chunks(content, query, token_budget=CRAWL_TOKEN_BUDGET, top_k=CRAWL_TOP_K)
+        if selection.elided:
+            logger.info(f"{Colors.YELLOW}===== {selection.summary()} ====={Colors.END}")
+        return f"""Successfully crawled URL: {url}
+
+Title: {article.title if hasattr(article, 'title') else 'N/A'}
+Content length: {len(content)} characters
+Excerpt: {selection.summary()}
+
+Content:
+{selection.text}"""
+
+    return f"""Successfully crawled URL: {url}
+
+Title: {article.title if hasattr(article, 'title') else 'N/A'}
+Content length: {len(content)} characters
+
+Content:
+{content}"""
+
+def _format_error(url, e) -> str:
+    return f"Failed to crawl URL: {url}\nError: {repr(e)}\n\nTip: The URL might be blocking automated requests, timing out, or have parsing issues. Try a different URL or skip this source."
 
 @log_io
-def handle_crawl_tool(url: Annotated[str, "The url to crawl."]) -> str:
+def handle_crawl_tool(url: Annotated[str, "The url to crawl."], query: Annotated[str | None, "Optional focus query."] = None) -> str:
     """
     Use this to crawl a url and get a readable content in markdown format.
     """
     logger.info(f"{Colors.BLUE}===== Crawling URL: {url} ====={Colors.END}")
     try:
         # Crawl the URL
+        _wait_for_prefetch([url])
         article = crawler.crawl(url)
 
-        # Get the message content
-        content = article.to_message()[-1]["text"]
+        # Return with more informative message (or a stub if the page duplicates one already crawled)
+        seen_urls.mark(url, "crawled")
+        index_article(url, article)
+        result = _duplicate_stub(url, article) or _format_article(url, article, query)
+        logger.info(f"{Colors.GREEN}===== Crawling successful ({len(result)} chars) ====={Colors.END}")
 
-        # Log success with content length
-        content_length = len(content)
-        logger.info(f"{Colors.GREEN}===== Crawling successful ({content_length} chars) ====={Colors.END}")
+        return result
 
-        # Return with more informative message
-        result = f"""Successfully crawled URL: {url}
+    except Exception as e:
+        logger.error(f"{Colors.RED}Crawling failed: {repr(e)}{Colors.END}")
+        return _format_error(url, e)
 
-Title: {article.title if hasattr(article, 'title') else 'N/A'}
-Content length: {content_length} characters
+@log_io
+def handle_batch_crawl_tool(urls: Annotated[list[str], "A list of urls to crawl in parallel."], query: Annotated[str | None, "Optional focus query."] = None) -> str:
+    """
+    Crawl several urls in parallel and return their readable contents in one result.
+    """
+    logger.info(f"{Colors.BLUE}===== Crawling {len(urls)} URLs in parallel ====={Colors.END}")
+    try:
+        _wait_for_prefetch(urls)
+        articles = async_crawler.crawl_many_sync(urls)
+    except Exception as e:
+        logger.error(f"{Colors.RED}Batch crawling failed: {repr(e)}{Colors.END}")
+        return f"Failed to crawl all {len(urls)} URLs\nError: {repr(e)}"
 
-Content:
-{content}"""
+    sections, succeeded = [], 0
+    for url, article in zip(urls, articles):
+        if isinstance(article, Exception):
+            logger.error(f"{Colors.RED}Crawling failed for {url}: {repr(article)}{Colors.END}")
+            sections.append(_format_error(url, article))
+        else:
+            succeeded += 1
+            seen_urls.mark(url, "crawled")
+            index_article(url, article)
+            sections.append(_duplicate_stub(url, article) or _format_article(url, article, query))
 
-        return result
+    logger.info(f"{Colors.GREEN}===== Batch crawling finished ({succeeded}/{len(urls)} succeeded) ====={Colors.END}")
+    if succeeded == 0:
+        return f"Failed to crawl all {len(urls)} URLs\n\n" + "\n\n---\n\n".join(sections)
+    return f"Crawled {succeeded}/{len(urls)} URLs\n\n" + "\n\n---\n\n".join(sections)
 
+@log_io
+def handle_hedged_crawl_tool(urls: Annotated[list[str], "Ranked candidate urls."], first_n: Annotated[int, "Number of pages wanted."],
+                             query: Annotated[str | None, "Optional focus query."] = None) -> str:
+    """
+    Crawl ranked candidate urls in parallel and return the first `first_n` pages that succeed.
+    """
+    logger.info(f"{Colors.BLUE}===== Hedged crawl: first {first_n} of {len(urls)} candidate URLs ====={Colors.END}")
+    try:
+        # 프리페치를 기다리지 않고 바로 경쟁시킴 (느린 호스트의 프리페치 결과는 어차피 캐시에 저장됨)
+        results = async_crawler.crawl_first_sync(urls, first_n, hedge_delay=CRAWL_HEDGE_DELAY)
     except Exception as e:
-        error_msg = f"Failed to crawl URL: {url}\nError: {repr(e)}\n\nTip: The URL might be blocking automated requests, timing out, or have parsing issues. Try a different URL or skip this source."
-        logger.error(f"{Colors.RED}Crawling failed: {repr(e)}{Colors.END}")
-        return error_msg
+        logger.error(f"{Colors.RED}Hedged crawling failed: {repr(e)}{Colors.END}")
+        return f"Failed to crawl all {len(urls)} URLs\nError: {repr(e)}"
+
+    crawled = [(url, article) for url, article in results if isinstance(article, Article)][:first_n]
+    failed = [(url, error) for url, error in results if isinstance(error, Exception)]
+    skipped = [url for url in urls if url not in {url for url, _ in crawled} | {url for url, _ in failed}]
+
+    sections = []
+    for url, article in crawled:
+        seen_urls.mark(url, "crawled")
+        index_article(url, article)
+        sections.append(_duplicate_stub(url, article) or _format_article(url, article, query))
+    sections += [_format_error(url, error) for url, error in failed]
+
+    logger.info(f"{Colors.GREEN}===== Hedged crawl finished ({len(crawled)}/{first_n} pages, "
+                f"{len(failed)} failed, {len(skipped)} not needed) ====={Colors.END}")
+    if not crawled:
+        return f"Failed to crawl all {len(urls)} URLs\n\n" + "\n\n---\n\n".join(sections)
+    header = f"Crawled the first {len(crawled)} of {len(urls)} candidate URLs to respond ({len(failed)} failed)"
+    if skipped:
+        header += "\nNot crawled (quota met; slow or lower-ranked): " + ", ".join(skipped)
+    return header + "\n\n" + "\n\n---\n\n".join(sections)
 
 # Function name must match tool name
 def crawl_tool(tool: ToolUse, **kwargs: Any) -> ToolResult:
     tool_use_id = tool["toolUseId"]
-    url = tool["input"]["url"]
-    
-    # Use the existing handle_crawl_tool function
-    result = handle_crawl_tool(url)
-    
+    url, urls = tool["input"].get("url"), tool["input"].get("urls")
+    query = tool["input"].get("query")
+    first_n = tool["input"].get("first_n")
+    first_n = max(1, int(first_n)) if first_n is not None else None  # 0 이하는 1개로 취급
+
+    # Batch input is crawled in parallel, a single url uses the existing handle_crawl_tool function
+    if urls and first_n and first_n < len(urls):
+        result = handle_hedged_crawl_tool(list(urls) + ([url] if url and url not in urls else []), first_n, query)
+    elif urls:
+        result = handle_batch_crawl_tool(list(urls) + ([url] if url and url not in urls else []), query)
+    elif url:
+        result = handle_crawl_tool(url, query)
+    else:
+        result = "Failed to crawl: either `url` or `urls` is required."
+
     # Check if crawling was successful based on the result string
-    if "Failed to crawl" in result:
+    if result.startswith("Failed to crawl"):
         return {
             "toolUseId": tool_use_id,
             "status": "error",
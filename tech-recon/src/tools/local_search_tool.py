@@ -0,0 +1,154 @@
+import os
+import time
+import logging
+import threading
+from typing import Any, Annotated
+from strands.types.tools import ToolResult, ToolUse
+from src.tools.decorators import log_io
+from src.tools.crawl_tool import article_index
+from src.crawler.relevance import select_relevant_chunks
+from src.utils.run_hooks import on_run_start, on_run_end
+from src.utils.seen_urls import seen_urls
+
+# Pages crawled within this many days count as fresh; older matches are reported as stale
+LOCAL_INDEX_MAX_AGE_DAYS = float(os.getenv("LOCAL_INDEX_MAX_AGE_DAYS", "30"))
+
+# Maximum hits returned and the per-hit excerpt size
+LOCAL_SEARCH_MAX_RESULTS = int(os.getenv("LOCAL_SEARCH_MAX_RESULTS", "5"))
+LOCAL_SEARCH_TOKEN_BUDGET = int(os.getenv("LOCAL_SEARCH_TOKEN_BUDGET", "600"))
+LOCAL_SEARCH_TOP_K = int(os.getenv("LOCAL_SEARCH_TOP_K", "3"))
+
+# 새 핸들러와 포맷터 설정
+logger = logging.getLogger(__name__)
+logger.propagate = False  # 상위 로거로 메시지 전파 중지
+for handler in logger.handlers[:]:
+    logger.removeHandler(handler)
+handler = logging.StreamHandler()
+formatter = logging.Formatter('\n%(levelname)s [%(name)s] %(message)s')  # 로그 레벨이 동적으로 표시되도록 변경
+handler.setFormatter(formatter)
+logger.addHandler(handler)
+# DEBUG와 INFO 중 원하는 레벨로 설정
+logger.setLevel(logging.INFO)  # 기본 레벨은 INFO로 설정
+
+TOOL_SPEC = {
+    "name": "local_search_tool",
+    "description": "Search the local full-text index of every page crawled so far (this and earlier runs). Instant and free: try it before tavily_tool. Returns the most relevant passages of fresh matching pages; if it reports no fresh results, search the web with tavily_tool.",
+    "inputSchema": {
+        "json": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The search query to look up in the local index."
+                },
+                "max_age_days": {
+                    "type": "number",
+                    "description": f"Only return pages crawled within this many days (default: {LOCAL_INDEX_MAX_AGE_DAYS:g})."
+                }
+            },
+            "required": ["query"]
+        }
+    }
+}
+
+class Colors:
+    BLUE = '\033[94m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BOLD = '\033[1m'
+    UNDERLINE = '\033[4m'
+    END = '\033[0m'
+
+# 실행별 적중/미스 집계
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "stale": 0, "misses": 0}
+
+@on_run_start
+def _reset_stats():
+    with _stats_lock:
+        _stats.update(hits=0, stale=0, misses=0)
+
+@on_run_end
+def _log_stats():
+    with _stats_lock:
+        stats = dict(_stats)
+    if any(stats.values()):
+        logger.info(
+            f"{Colors.BLUE}===== Local search: {stats['hits']} hits, {stats['stale']} stale, "
+            f"{stats['misses']} misses ====={Colors.END}"
+        )
+
+def _count(outcome: str) -> None:
+    with _stats_lock:
+        _stats[outcome] += 1
+
+def _format_hit(i, hit, query) -> str:
+    fetched = time.strftime("%Y-%m-%d", time.localtime(hit.fetched_at))
+    header = f"[{i}] {hit.title or hit.url}\n{hit.url}\nCrawled: {fetched}"
+    if hit.tags:
+        header += f" | Domains: {', '.join(hit.tags)}"
+    previous = seen_urls.check_and_mark(hit.url, "search")
+    if previous:
+        return f"{header}\n(already {'crawled' if previous == 'crawled' else 'returned'} for this task; content omitted)"
+    selection = select_relevant_chunks(hit.content, query, token_budget=LOCAL_SEARCH_TOKEN_BUDGET, top_k=LOCAL_SEARCH_TOP_K)
+    return f"{header}\nExcerpt: {selection.summary()}\n{selection.text}"
+
+@log_io
+def handle_local_search_tool(query: Annotated[str, "The search query to look up in the local index."],
+                             max_age_days: Annotated[float | None, "Maximum page age in days."] = None) -> str:
+    """
+    Search the local full-text index of crawled pages.
+    """
+    if article_index is None:
+        return "Failed to search locally: the local index is disabled (LOCAL_INDEX_ENABLED=false). Use tavily_tool."
+
+    max_age_days = LOCAL_INDEX_MAX_AGE_DAYS if max_age_days is None else max_age_days
+    logger.info(f"{Colors.BLUE}===== Searching local index: {query} ====={Colors.END}")
+    try:
+        fresh, stale = article_index.search(query, max_age=max_age_days * 86400, limit=LOCAL_SEARCH_MAX_RESULTS)
+    except Exception as e:
+        logger.error(f"{Colors.RED}Local search failed: {repr(e)}{Colors.END}")
+        return f"Failed to search locally: {repr(e)}. Use tavily_tool."
+
+    if not fresh:
+        _count("stale" if stale else "misses")
+        if stale:
+            newest = min(hit.age_days for hit in stale)
+            logger.info(f"{Colors.YELLOW}===== Local index: only stale matches ({len(stale)}) ====={Colors.END}")
+            return (f"No fresh local results for '{query}': {len(stale)} matching page(s) are older than "
+                    f"{max_age_days:g} days (newest crawled {newest:.0f} days ago). Search the web with tavily_tool.")
+        logger.info(f"{Colors.YELLOW}===== Local index: no matches ====={Colors.END}")
+        return f"No local results for '{query}'. Search the web with tavily_tool."
+
+    _count("hits")
+    sections = [_format_hit(i, hit, query) for i, hit in enumerate(fresh, 1)]
+    logger.info(f"{Colors.GREEN}===== Local index: {len(fresh)} fresh results ====={Colors.END}")
+    return (f"Local results for '{query}' ({len(fresh)} pages crawled within {max_age_days:g} days; "
+            f"use crawl_tool for a full page, or tavily_tool if these do not answer the query):\n\n"
+            + "\n\n".join(sections))
+
+# Function name must match tool name
+def local_search_tool(tool: ToolUse, **kwargs: Any) -> ToolResult:
+    tool_use_id = tool["toolUseId"]
+    query = tool["input"].get("query")
+    max_age_days = tool["input"].get("max_age_days")
+
+    if query:
+        result = handle_local_search_tool(query, float(max_age_days) if max_age_days is not None else None)
+    else:
+        result = "Failed to search locally: `query` is required."
+
+    # A miss is a normal outcome (the researcher falls back to tavily_tool), only failures are errors
+    if result.startswith("Failed to search locally"):
+        return {
+            "toolUseId": tool_use_id,
+            "status": "error",
+            "content": [{"text": result}]
+        }
+    else:
+        return {
+            "toolUseId": tool_use_id,
+            "status": "success",
+            "content": [{"text": result}]
+        }
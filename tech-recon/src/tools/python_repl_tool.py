@@ -1,9 +1,33 @@
+import os
 import sys
+import signal
 import logging
+import weakref
+import threading
 import subprocess
 from typing import Any, Annotated
 from strands.types.tools import ToolResult, ToolUse
 from src.tools.decorators import log_io
+from src.utils.python_kernel import KernelSessions, KernelPool
+from src.utils.run_hooks import on_run_start, on_run_end
+from src.utils.tool_progress import track_execution, stream_process
+from src.utils.exec_policy import limit_output, limit_command, CODE_EXEC_MAX_MEMORY_MB, CODE_EXEC_MAX_CPU_SECONDS
+
+# kernel: 에이전트 세션별 상주 커널 (호출 간 변수 유지)
+# fork: 라이브러리를 미리 import한 템플릿에서 호출마다 fork (호출 간 변수 유지 없음)
+# subprocess: 호출마다 새 프로세스
+PYTHON_REPL_MODE = os.getenv("PYTHON_REPL_MODE", "kernel").lower()
+
+# Per-call timeout in seconds
+PYTHON_REPL_TIMEOUT = float(os.getenv("PYTHON_REPL_TIMEOUT", "600"))
+
+# fork mode: warm template processes and the modules they import once
+# (koreanize_matplotlib registers the Korean font with matplotlib)
+PYTHON_REPL_POOL_SIZE = int(os.getenv("PYTHON_REPL_POOL_SIZE", "2"))
+PYTHON_REPL_PRELOAD = [name.strip() for name in os.getenv(
+    "PYTHON_REPL_PRELOAD",
+    "numpy,pandas,matplotlib,matplotlib.pyplot,koreanize_matplotlib,docx,plotly,plotly.graph_objects,plotly.express",
+).split(",") if name.strip()]
 
 
 # Simple logger setup
@@ -12,7 +36,10 @@ logger.setLevel(logging.INFO)
 
 TOOL_SPEC = {
     "name": "python_repl_tool",
-    "description": "Use this to execute python code and do data analysis or calculation. If you want to see the output of a value, you should print it out with `print(...)`. This is visible to the user.",
+    "description": "Use this to execute python code and do data analysis or calculation. If you want to see the output of a value, you should print it out with `print(...)`. This is visible to the user." + (
+        " Imports, variables and functions persist between your calls, so define helpers and load data once and reuse them; if the result says the kernel was restarted, they are gone and must be redefined."
+        if PYTHON_REPL_MODE == "kernel" else " Every call starts from a clean interpreter: nothing persists between calls."
+    ),
     "inputSchema": {
         "json": {
             "type": "object",
@@ -20,6 +47,10 @@ TOOL_SPEC = {
                 "code": {
                     "type": "string",
                     "description": "The python code to execute to do further analysis or calculation."
+                },
+                "reset": {
+                    "type": "boolean",
+                    "description": "Discard all variables and imports from earlier calls before running `code` (default: false)."
                 }
             },
             "required": ["code"]
@@ -27,6 +58,24 @@ TOOL_SPEC = {
     }
 }
 
+# 리포터 프롬프트의 core utilities 안내 - 호출 간 정의가 유지되는 kernel 모드에서만 한 번 선언하도록 함
+if PYTHON_REPL_MODE == "kernel":
+    PROMPT_CONTEXT = {
+        "REPL_UTILITIES_PURPOSE": "python_repl keeps imports, variables and functions between your calls, so **declare them once in your first python_repl call** and reuse them in later calls. They're safe to redeclare.",
+        "REPL_UTILITIES_WHEN": "In your first python_repl call, and again only if a python_repl result says the kernel was restarted (earlier definitions are then gone)",
+        "REPL_UTILITIES_HEADER": "Declare once in the first python_repl call",
+        "REPL_UTILITIES_PLACEHOLDER": "Core utilities are already defined by the first call; redeclare them only after a kernel restart",
+        "REPL_STATE_NOTE": "Variables and functions persist between python_repl calls, but the document itself lives in report_draft.docx (always load, append, save)",
+    }
+else:
+    PROMPT_CONTEXT = {
+        "REPL_UTILITIES_PURPOSE": "You can **copy-paste them into any python_repl call** where needed. They're safe to redeclare.",
+        "REPL_UTILITIES_WHEN": "Include these in EVERY python_repl call (nothing persists between calls)",
+        "REPL_UTILITIES_HEADER": "Copy into every python_repl call",
+        "REPL_UTILITIES_PLACEHOLDER": "Copy core utilities here",
+        "REPL_STATE_NOTE": "No variables persist between python_repl calls (by design)",
+    }
+
 class Colors:
     BLUE = '\033[94m'
     GREEN = '\033[92m'
@@ -37,43 +86,144 @@ class Colors:
     END = '\033[0m'
 
 class PythonREPL:
-    def __init__(self):
-        pass
+    def __init__(self, mode: str = "kernel", timeout: float = 600, pool_size: int = 2, preload: list[str] | None = None):
+        self.mode = mode
+        self.timeout = timeout
+        # 실행별 메모리/CPU 시간 제한 (커널과 포크된 자식 프로세스는 호출마다 적용)
+        limits = {"memory_mb": CODE_EXEC_MAX_MEMORY_MB, "cpu_seconds": CODE_EXEC_MAX_CPU_SECONDS}
+        self.kernels = KernelSessions(timeout=timeout, limits=limits)
+        self.pool = KernelPool(pool_size, preload or [], timeout=timeout, limits=limits) if mode == "fork" else None
 
-    def run(self, command):
+    def _run_subprocess(self, command, monitor=None):
         try:
-            # 입력된 명령어 실행
-            result = subprocess.run(
-                [sys.executable, "-c", command],
-                capture_output=True,
-                text=True,
-                timeout=600  # 타임아웃 설정
-            )
+            if monitor is not None:
+                # 출력을 줄 단위로 전달하며 실행 (-u: 버퍼링 없이 출력)
+                result = stream_process(limit_command([sys.executable, "-u", "-c", command]), monitor,
+                                        timeout=self.timeout)
+                if result.aborted or result.timed_out:
+                    reason = f"aborted ({result.aborted})" if result.aborted else f"timed out after {self.timeout:g} seconds"
+                    return self._stopped(result.stdout, f"{result.stderr}\nExecution {reason}".lstrip("\n"))
+            else:
+                # 입력된 명령어 실행
+                result = subprocess.run(
+                    limit_command([sys.executable, "-c", command]),  # 메모리/CPU 시간 제한
+                    capture_output=True,
+                    text=True,
+                    timeout=self.timeout  # 타임아웃 설정
+                )
             # 결과 반환
             if result.returncode == 0:
                 return result.stdout
+            elif result.returncode < 0:
+                # 시그널로 종료된 경우 (CPU 시간 제한 초과 시 SIGXCPU)
+                return f"Error: {result.stderr}Process killed by {signal.Signals(-result.returncode).name}" + (
+                    " (CPU time limit of this execution exceeded)" if -result.returncode == signal.SIGXCPU else "")
             else:
                 return f"Error: {result.stderr}"
         except Exception as e:
             return f"Exception: {str(e)}"
 
-repl = PythonREPL()
+    @staticmethod
+    def _stopped(stdout, error):
+        # 중단/타임아웃된 실행은 그때까지의 출력도 함께 반환
+        return f"Output before the execution stopped:\n{stdout}\nError: {error}" if stdout.strip() else f"Error: {error}"
+
+    def run(self, command, session: str = "default", reset: bool = False, monitor=None):
+        if self.pool is not None:
+            result = self.pool.execute(command, monitor=monitor)
+            if result.aborted or result.timed_out:
+                return self._stopped(result.stdout, result.stderr)
+            return result.stdout if result.ok else f"Error: {result.stderr}"
+        if self.mode != "kernel":
+            return self._run_subprocess(command, monitor)
+
+        if reset:
+            self.kernels.reset(session)
+        result = self.kernels.get(session).execute(command, monitor=monitor)
+        notice = ""
+        if result.restarted:
+            notice = "[Kernel restarted: variables, imports and functions from earlier calls are gone]\n"
+        # 결과 반환 (새 프로세스 방식과 같은 형식)
+        if result.aborted or result.timed_out:
+            return notice + self._stopped(result.stdout, result.stderr)
+        if result.ok:
+            return notice + result.stdout
+        else:
+            return f"{notice}Error: {result.stderr}"
+
+repl = PythonREPL(mode=PYTHON_REPL_MODE, timeout=PYTHON_REPL_TIMEOUT, pool_size=PYTHON_REPL_POOL_SIZE,
+                  preload=PYTHON_REPL_PRELOAD)
+
+@on_run_start
+def _warm_pool():
+    # 템플릿은 실행 간 유지되며, 첫 호출 전에 라이브러리 import를 마치도록 미리 시작
+    if repl.pool is not None:
+        repl.pool.start()
+        repl.pool.reset_stats()
+
+@on_run_end
+def _shutdown_kernels():
+    # 실행이 끝나면 커널 종료 (다음 실행은 빈 네임스페이스에서 시작)
+    repl.kernels.shutdown_all()
+    if repl.pool is not None:
+        stats = repl.pool.stats()
+        if stats["executions"]:
+            logger.info(
+                f"{Colors.BLUE}===== Python worker pool: {stats['executions']} executions, "
+                f"utilization {stats['utilization']:.0%} (peak {stats['peak_busy']}/{repl.pool.size} busy), "
+                f"queue wait {stats['avg_wait_ms']:.0f} ms, fork latency avg {stats['avg_fork_ms']:.1f} ms / "
+                f"max {stats['max_fork_ms']:.1f} ms ====={Colors.END}"
+            )
+
+_agent_sessions: dict[int, str] = {}  # id(agent) -> 커널 세션
+_agent_sessions_lock = threading.Lock()
+
+def _release_session(agent_id: int) -> None:
+    with _agent_sessions_lock:
+        session = _agent_sessions.pop(agent_id, None)
+    if session is not None:
+        repl.kernels.release(session)
+
+def _agent_session(agent) -> str:
+    """Kernel session of one agent instance (same-named agents built later get their own namespace)"""
+    if agent is None:
+        return "default"
+    with _agent_sessions_lock:
+        session = _agent_sessions.get(id(agent))
+        if session is None:
+            session = _agent_sessions[id(agent)] = f"{getattr(agent, 'name', None) or 'agent'}-{id(agent):x}"
+            try:
+                # 에이전트가 사라지면 커널도 종료 (같은 id가 재사용되어도 이전 네임스페이스를 물려받지 않음)
+                weakref.finalize(agent, _release_session, id(agent))
+            except TypeError:
+                pass
+    return session
 
 @log_io
-def handle_python_repl_tool(code: Annotated[str, "The python code to execute to do further analysis or calculation."]):
+def handle_python_repl_tool(code: Annotated[str, "The python code to execute to do further analysis or calculation."],
+                            session: Annotated[str, "Kernel session (one per agent)."] = "default",
+                            reset: Annotated[bool, "Discard the session's variables before running."] = False,
+                            agent_name: Annotated[str | None, "Agent that called the tool."] = None,
+                            tool_id: Annotated[str | None, "toolUseId of the call, attached to progress events."] = None):
     """
     Use this to execute python code and do data analysis or calculation. If you want to see the output of a value,
     you should print it out with `print(...)`. This is visible to the user.
     """
     print()  # Add newline before log
     logger.info(f"{Colors.GREEN}===== Executing Python code ====={Colors.END}")
+    label = next((line.strip() for line in code.splitlines() if line.strip()), "")
     try:
-        result = repl.run(code)
+        # 실행 중 출력은 tool_progress 이벤트로 실시간 전달, UI/워치독에서 중단 가능
+        with track_execution("python_repl_tool", label, agent_name=agent_name or session, tool_id=tool_id) as execution:
+            result = repl.run(code, session=session, reset=reset, monitor=execution)
     except BaseException as e:
         error_msg = f"Failed to execute. Error: {repr(e)}"
         logger.debug(f"{Colors.RED}Failed to execute. Error: {repr(e)}{Colors.END}")
         return error_msg
 
+    # 토큰 예산을 넘는 출력은 앞/뒷부분만 반환하고 전체는 artifacts 폴더에 저장
+    result = limit_output(result, "python_repl_tool")
+
     # Truncate code to first 7 lines for context efficiency
     code_lines = code.split('\n')
     if len(code_lines) > 7:
@@ -90,9 +240,15 @@ def handle_python_repl_tool(code: Annotated[str, "The python code to execute to
 def python_repl_tool(tool: ToolUse, **kwargs: Any) -> ToolResult:
     tool_use_id = tool["toolUseId"]
     code = tool["input"]["code"]
+    reset = bool(tool["input"].get("reset", False))
+
+    # 에이전트 인스턴스별로 커널 세션 분리 (Strands는 호출한 에이전트를 kwargs["agent"]로 전달)
+    agent = kwargs.get("agent")
+    session = _agent_session(agent)
 
     # Use the existing handle_python_repl_tool function
-    result = handle_python_repl_tool(code)
+    result = handle_python_repl_tool(code, session=session, reset=reset, agent_name=getattr(agent, "name", None),
+                                     tool_id=tool_use_id)
 
     # Check if execution was successful based on the result string
     if "Failed to execute" in result:
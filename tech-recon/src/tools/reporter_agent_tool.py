@@ -96,7 +96,8 @@ def handle_reporter_agent_tool(_task: Annotated[str, "The reporting task or inst
                     "USER_REQUEST": request_prompt,
                     "FULL_PLAN": full_plan,
                     "ARTIFACT_FOLDER": artifact_folder,
-                    "PART1_FOLDER": part1_folder
+                    "PART1_FOLDER": part1_folder,
+                    **python_repl_tool.PROMPT_CONTEXT
                 }
             ),
             agent_type="claude-sonnet-4-5", # claude-sonnet-3-5-v-2, claude-sonnet-3-7
@@ -4,8 +4,9 @@ from typing import Any, Annotated
 from strands.types.tools import ToolResult, ToolUse
 from src.utils.strands_sdk_utils import strands_utils
 from src.prompts.template import apply_prompt_template
+from src.utils.run_hooks import start_agent
 from src.utils.common_utils import get_message_from_string, start_periodic_status, stop_periodic_status
-from src.tools import python_repl_tool, bash_tool, tavily_tool, crawl_tool
+from src.tools import python_repl_tool, bash_tool, tavily_tool, crawl_tool, local_search_tool, spider_tool
 
 
 # Simple logger setup
@@ -75,6 +76,9 @@ def handle_researcher_agent_tool(task: Annotated[str, "The research task or ques
         artifact_folder = shared_state.get("artifact_folder", "./artifacts/")  # Get part-specific folder
         part1_folder = shared_state.get("part1_folder", "./artifacts/part1")  # For Part2 reference
 
+        # The new agent has not seen any tool results yet (resets the per-agent "already returned" state)
+        start_agent()
+
         # Create researcher agent with specialized tools using consistent pattern
         researcher_agent = strands_utils.get_agent(
             agent_name="researcher",
@@ -90,7 +94,7 @@ def handle_researcher_agent_tool(task: Annotated[str, "The research task or ques
             agent_type="claude-sonnet-4-5", #claude-sonnet-3-7, claude-sonnet-4
             enable_reasoning=False,
             prompt_cache_info=(True, "default"),  # reasoning agent uses prompt caching
-            tools=[tavily_tool, python_repl_tool, bash_tool, crawl_tool],
+            tools=[local_search_tool, tavily_tool, python_repl_tool, bash_tool, crawl_tool, spider_tool],
             streaming=True  # Enable streaming for consistency
         )
 
@@ -0,0 +1,158 @@
+import os
+import logging
+from typing import Any, Annotated
+from strands.types.tools import ToolResult, ToolUse
+from src.tools.decorators import log_io
+from src.tools.crawl_tool import async_crawler, dedup_index, index_article
+from src.crawler import Spider
+from src.crawler.spider import rank_pages
+from src.crawler.relevance import select_relevant_chunks
+from src.utils.seen_urls import seen_urls
+
+# Link-following limits: hops from the start page, pages fetched per call, pages fetched at once
+SPIDER_MAX_DEPTH = int(os.getenv("SPIDER_MAX_DEPTH", "2"))
+SPIDER_MAX_PAGES = int(os.getenv("SPIDER_MAX_PAGES", "15"))
+SPIDER_MAX_CONCURRENCY = int(os.getenv("SPIDER_MAX_CONCURRENCY", "4"))
+
+# Digest size: pages returned with excerpts and the per-page excerpt token budget
+SPIDER_DIGEST_PAGES = int(os.getenv("SPIDER_DIGEST_PAGES", "6"))
+SPIDER_PAGE_TOKENS = int(os.getenv("SPIDER_PAGE_TOKENS", "600"))
+
+# 새 핸들러와 포맷터 설정
+logger = logging.getLogger(__name__)
+logger.propagate = False  # 상위 로거로 메시지 전파 중지
+for handler in logger.handlers[:]:
+    logger.removeHandler(handler)
+handler = logging.StreamHandler()
+formatter = logging.Formatter('\n%(levelname)s [%(name)s] %(message)s')  # 로그 레벨이 동적으로 표시되도록 변경
+handler.setFormatter(formatter)
+logger.addHandler(handler)
+# DEBUG와 INFO 중 원하는 레벨로 설정
+logger.setLevel(logging.INFO)  # 기본 레벨은 INFO로 설정
+
+TOOL_SPEC = {
+    "name": "spider_tool",
+    "description": "Use this on index or hub pages (analyst report listings, conference agendas, newsrooms) whose value is in the linked articles. Starting from `url`, it follows the same-site links most relevant to `task` within a depth and page budget, and returns a digest of the most relevant pages with excerpts, in one call.",
+    "inputSchema": {
+        "json": {
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "The hub page to start from."
+                },
+                "task": {
+                    "type": "string",
+                    "description": "What you are looking for; links and pages are ranked by relevance to it."
+                },
+                "max_pages": {
+                    "type": "integer",
+                    "description": f"Maximum pages to fetch, including the start page (default and upper limit: {SPIDER_MAX_PAGES})."
+                },
+                "max_depth": {
+                    "type": "integer",
+                    "description": f"Maximum link hops from the start page (default and upper limit: {SPIDER_MAX_DEPTH})."
+                }
+            },
+            "required": ["url", "task"]
+        }
+    }
+}
+
+class Colors:
+    BLUE = '\033[94m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BOLD = '\033[1m'
+    UNDERLINE = '\033[4m'
+    END = '\033[0m'
+
+def _format_page(i, page, task) -> str:
+    header = f"[{i}] {page.article.title} (relevance {page.score:.2f}, depth {page.depth}"
+    header += f', via "{page.anchor}")' if page.anchor else ")"
+    header += f"\n{page.url}"
+    if seen_urls.check_and_mark(page.url, "crawled") == "crawled":
+        return f"{header}\n(already crawled for this task; content omitted)"
+    seen_urls.mark(page.url, "crawled")  # 검색 결과로만 보였던 URL은 이제 크롤링된 것으로 표시
+    selection = select_relevant_chunks(page.article.text, task, token_budget=SPIDER_PAGE_TOKENS, top_k=3)
+    return f"{header}\nExcerpt: {selection.summary()}\n{selection.text}"
+
+@log_io
+def handle_spider_tool(url: Annotated[str, "The hub page to start from."],
+                       task: Annotated[str, "What you are looking for."],
+                       max_pages: Annotated[int | None, "Maximum pages to fetch."] = None,
+                       max_depth: Annotated[int | None, "Maximum link hops from the start page."] = None) -> str:
+    """
+    Follow the most relevant same-site links from a hub page and return a ranked digest.
+    """
+    spider = Spider(
+        async_crawler,
+        # 에이전트는 한도를 줄일 수만 있음
+        max_depth=max(0, min(SPIDER_MAX_DEPTH if max_depth is None else max_depth, SPIDER_MAX_DEPTH)),
+        max_pages=max(1, min(SPIDER_MAX_PAGES if max_pages is None else max_pages, SPIDER_MAX_PAGES)),
+        max_concurrency=SPIDER_MAX_CONCURRENCY,
+    )
+    logger.info(f"{Colors.BLUE}===== Spidering {url} (depth {spider.max_depth}, {spider.max_pages} pages) ====={Colors.END}")
+    try:
+        pages = spider.crawl_sync(url, task)
+    except Exception as e:
+        logger.error(f"{Colors.RED}Spidering failed: {repr(e)}{Colors.END}")
+        return f"Failed to spider URL: {url}\nError: {repr(e)}"
+
+    failed = [page for page in pages if page.error is not None]
+    if not pages or pages[0].error is not None:
+        error = pages[0].error if pages else "no pages fetched"
+        logger.error(f"{Colors.RED}Spidering failed: {error!r}{Colors.END}")
+        return f"Failed to spider URL: {url}\nError: {error!r}\n\nTip: The start page could not be crawled. Try a different URL."
+
+    # 모든 페이지는 로컬 색인에 저장하고, 다이제스트에서는 복제 페이지를 제외
+    ranked, duplicates = [], []
+    for page in rank_pages(pages, task):
+        index_article(page.url, page.article)
+        # 현재 에이전트가 이미 받은 페이지의 복제본만 제외
+        _, received_as = dedup_index.check_and_add(page.url, page.article.text) if dedup_index else (None, None)
+        if received_as is None:
+            ranked.append(page)
+        else:
+            duplicates.append((page, received_as))
+
+    digest, others = ranked[:SPIDER_DIGEST_PAGES], ranked[SPIDER_DIGEST_PAGES:]
+    sections = [_format_page(i, page, task) for i, page in enumerate(digest, 1)]
+    if others:
+        sections.append("Other pages visited (lower relevance; use crawl_tool to read one):\n"
+                        + "\n".join(f"- {page.article.title} (relevance {page.score:.2f}): {page.url}" for page in others))
+    if duplicates:
+        sections.append("Near-duplicate pages skipped:\n"
+                        + "\n".join(f"- {page.url} (copy of {duplicate_of})" for page, duplicate_of in duplicates))
+    if failed:
+        sections.append("Pages that failed:\n" + "\n".join(f"- {page.url}: {page.error!r}" for page in failed))
+
+    logger.info(f"{Colors.GREEN}===== Spidering finished ({len(pages) - len(failed)}/{len(pages)} pages crawled) ====={Colors.END}")
+    return (f"Spidered {url}: {len(pages)} pages visited ({len(failed)} failed); "
+            f"top {len(digest)} by relevance to '{task}':\n\n" + "\n\n".join(sections))
+
+# Function name must match tool name
+def spider_tool(tool: ToolUse, **kwargs: Any) -> ToolResult:
+    tool_use_id = tool["toolUseId"]
+    url, task = tool["input"].get("url"), tool["input"].get("task")
+    max_pages, max_depth = tool["input"].get("max_pages"), tool["input"].get("max_depth")
+
+    if url and task:
+        result = handle_spider_tool(url, task, max_pages, max_depth)
+    else:
+        result = "Failed to spider: both `url` and `task` are required."
+
+    # Check if spidering was successful based on the result string
+    if result.startswith("Failed to spider"):
+        return {
+            "toolUseId": tool_use_id,
+            "status": "error",
+            "content": [{"text": result}]
+        }
+    else:
+        return {
+            "toolUseId": tool_use_id,
+            "status": "success",
+            "content": [{"text": result}]
+        }
@@ -1,13 +1,47 @@
 import json
+import asyncio
 import logging
 import os
 from typing import Any, Annotated
 from strands.types.tools import ToolResult, ToolUse
 from langchain_community.tools.tavily_search import TavilySearchResults
+from tavily import AsyncTavilyClient
 from src.tools.decorators import log_io, create_logged_tool
+from src.utils.run_hooks import on_run_start, on_run_end, on_agent_start
+from src.utils.search_cache import SearchCache, normalize_query
+from src.utils.seen_urls import seen_urls, normalize_url
+from src.utils.query_dedup import SimilarQueryIndex
+from src.tools.crawl_tool import prefetcher, crawler
+from src.crawler.crawler import CrawlError
+from src.crawler.relevance import select_relevant_chunks
 
 # Load TAVILY_MAX_RESULTS from environment variable, default to 5
 TAVILY_MAX_RESULTS = int(os.getenv("TAVILY_MAX_RESULTS", "5"))
+TAVILY_SEARCH_DEPTH = os.getenv("TAVILY_SEARCH_DEPTH", "advanced")  # "basic" 또는 "advanced"
+
+# Persistent search result cache (shared across researcher calls, Part1/Part2 and runs)
+TAVILY_CACHE_ENABLED = os.getenv("TAVILY_CACHE_ENABLED", "true").lower() == "true"
+TAVILY_CACHE_PATH = os.getenv("TAVILY_CACHE_PATH") or None
+TAVILY_CACHE_TTL = int(os.getenv("TAVILY_CACHE_TTL", "86400"))
+
+# Raw-content mode: the search also returns page text, reduced to the passages most relevant to the query
+TAVILY_INCLUDE_RAW_CONTENT = os.getenv("TAVILY_INCLUDE_RAW_CONTENT", "false").lower() == "true"
+TAVILY_RAW_CONTENT_TOKENS = int(os.getenv("TAVILY_RAW_CONTENT_TOKENS", "800"))
+TAVILY_RAW_CONTENT_TOP_K = int(os.getenv("TAVILY_RAW_CONTENT_TOP_K", "3"))
+
+# Reuse the results of a very similar earlier query of the same researcher (TF-IDF character n-gram similarity)
+TAVILY_QUERY_DEDUP_ENABLED = os.getenv("TAVILY_QUERY_DEDUP_ENABLED", "true").lower() == "true"
+TAVILY_QUERY_SIMILARITY = float(os.getenv("TAVILY_QUERY_SIMILARITY", "0.75"))
+
+# Result encoding fed back to the researcher: "compact" (plain text blocks) or "json"; snippet length cap
+TAVILY_RESULT_FORMAT = os.getenv("TAVILY_RESULT_FORMAT", "compact").lower()
+TAVILY_SNIPPET_CHARS = int(os.getenv("TAVILY_SNIPPET_CHARS", "500"))
+
+# Maximum concurrent requests for multi-query (`queries`) searches
+TAVILY_BATCH_CONCURRENCY = int(os.getenv("TAVILY_BATCH_CONCURRENCY", "4"))
+
+# Top result URLs crawled into the crawler cache in the background right after a search (0 disables)
+TAVILY_PREFETCH_TOP_N = int(os.getenv("TAVILY_PREFETCH_TOP_N", "3"))
 
 # 새 핸들러와 포맷터 설정
 logger = logging.getLogger(__name__)
@@ -23,7 +57,7 @@ logger.setLevel(logging.INFO)  # 기본 레벨은 INFO로 설정
 
 TOOL_SPEC = {
     "name": "tavily_tool",
-    "description": "Use this tool to search the internet for real-time information, current events, or specific data. Provides relevant search results from Tavily's search engine API.",
+    "description": "Use this tool to search the internet for real-time information, current events, or specific data. Provides relevant search results from Tavily's search engine API. To run several searches at once, pass them together in `queries`; they run in parallel and the results are merged without duplicate URLs.",
     "inputSchema": {
         "json": {
             "type": "object",
@@ -31,9 +65,17 @@ TOOL_SPEC = {
                 "query": {
                     "type": "string",
                     "description": "The search query to look up on the internet."
+                },
+                "queries": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "A list of search queries to run in parallel. Use this instead of `query` when searching several topics."
+                },
+                "force_search": {
+                    "type": "boolean",
+                    "description": "Search even if you already searched a very similar query for this task (by default its earlier results are reused)."
                 }
-            },
-            "required": ["query"]
+            }
         }
     }
 }
@@ -53,23 +95,200 @@ tavily_search_instance = LoggedTavilySearch(
     name="tavily_search",
     max_results=TAVILY_MAX_RESULTS,
     include_answer=False,
-    include_raw_content=False,
+    include_raw_content=TAVILY_INCLUDE_RAW_CONTENT,
     include_images=False,
     include_image_descriptions=False,
-    search_depth="advanced",  # "basic" 또는 "advanced" 설정 가능
+    search_depth=TAVILY_SEARCH_DEPTH,
 )
 
+# 검색 결과를 바꾸는 파라미터는 모두 캐시 키에 포함
+SEARCH_PARAMS = {"max_results": TAVILY_MAX_RESULTS, "search_depth": TAVILY_SEARCH_DEPTH,
+                 "include_raw_content": TAVILY_INCLUDE_RAW_CONTENT}
+search_cache = SearchCache(path=TAVILY_CACHE_PATH, ttl=TAVILY_CACHE_TTL) if TAVILY_CACHE_ENABLED else None
+
+if search_cache:
+    on_run_start(search_cache.reset_stats)
+
+    @on_run_end
+    def _log_search_cache_stats():
+        stats = search_cache.stats()
+        logger.info(
+            f"{Colors.BLUE}===== Search cache: {stats['hits']} hits, {stats['coalesced']} coalesced, "
+            f"{stats['misses']} misses, hit rate {stats['hit_rate']:.0%} ====={Colors.END}"
+        )
+
+query_index = SimilarQueryIndex(threshold=TAVILY_QUERY_SIMILARITY) if TAVILY_QUERY_DEDUP_ENABLED else None
+
+if query_index:
+    on_run_start(query_index.reset)
+    on_agent_start(query_index.new_scope)
+
+    @on_run_end
+    def _log_searches_saved():
+        logger.info(f"{Colors.BLUE}===== Searches saved by similar-query reuse: {query_index.searches_saved} ====={Colors.END}")
+
+def _find_similar(query: str, force_search: bool) -> tuple[str, list, float] | None:
+    if query_index is None or force_search:
+        return None
+    similar = query_index.find(query)
+    if similar:
+        logger.info(f"{Colors.YELLOW}===== Reusing results of similar query '{similar[0]}' "
+                    f"(similarity {similar[2]:.2f}) for: {query} ====={Colors.END}")
+    return similar
+
+def _reuse_note(query: str, similar: tuple[str, list, float]) -> str:
+    return (f'"{query}" is very similar to the earlier query "{similar[0]}" (similarity {similar[2]:.2f}); '
+            f"its results are reused. Set force_search to true to search it anyway.")
+
+@on_run_end
+def _log_seen_urls():
+    if seen_urls.repeats:
+        logger.info(f"{Colors.BLUE}===== Repeated search results sent as 'already seen': {seen_urls.repeats} ====={Colors.END}")
+
+def _search(query: str) -> list:
+    searched_content = tavily_search_instance.invoke({"query": query})
+    if not isinstance(searched_content, list):
+        # langchain 래퍼는 API 오류를 예외 대신 문자열로 반환 - 캐시되지 않도록 예외로 변환
+        raise RuntimeError(searched_content)
+    return searched_content
+
+async def _asearch(client: AsyncTavilyClient, query: str) -> list:
+    response = await client.search(query, **SEARCH_PARAMS, include_answer=False, include_images=False)
+    return response.get("results", [])
+
+async def _search_many(queries: list[str]) -> list[list | Exception]:
+    """Run the queries concurrently (bounded), sharing the result cache and in-flight requests"""
+    client = AsyncTavilyClient()  # TAVILY_API_KEY 환경 변수 사용
+    semaphore = asyncio.Semaphore(TAVILY_BATCH_CONCURRENCY)
+
+    async def search_one(query: str) -> list:
+        async with semaphore:
+            logger.info(f"{Colors.BLUE}===== Searching for: {query} ====={Colors.END}")
+            if search_cache:
+                return await search_cache.aget_or_fetch(query, SEARCH_PARAMS, lambda: _asearch(client, query))
+            return await _asearch(client, query)
+
+    try:
+        return await asyncio.gather(*(search_one(query) for query in queries), return_exceptions=True)
+    finally:
+        if hasattr(client, "close"):  # 연결 풀 해제 (asyncio.run마다 새 이벤트 루프)
+            await client.close()
+
+def _prefetch(results: list[dict]) -> None:
+    """Start crawling the top result URLs so a following crawl_tool call hits the cache"""
+    if prefetcher is None or TAVILY_PREFETCH_TOP_N <= 0:
+        return
+    # raw content가 이미 있는 결과는 크롤링할 필요 없음 (빈 raw content는 없는 것으로 취급)
+    urls = [elem['url'] for elem in results[:TAVILY_PREFETCH_TOP_N] if not elem.get('raw_content')]
+    scheduled = prefetcher.prefetch(urls)
+    if scheduled:
+        logger.debug(f"Prefetching {scheduled} result URLs")
+
+def _excerpt_raw_content(raw_content: str, query: str) -> str:
+    """Run page text returned by the search through the crawler's extraction and chunk ranking"""
+    mime = "text/html" if raw_content.lstrip().startswith("<") else "text/plain"
+    try:
+        # crawl_tool과 같은 HTML 추출 방식(CRAWLER_HTML_EXTRACTOR) 사용
+        article = crawler.extract_body(raw_content.encode("utf-8"), f"{mime}; charset=utf-8")
+    except CrawlError:
+        return ""
+    selection = select_relevant_chunks(article.text, query, token_budget=TAVILY_RAW_CONTENT_TOKENS,
+                                       top_k=TAVILY_RAW_CONTENT_TOP_K)
+    return selection.text
+
+# 현재 에이전트에게 이미 보낸 URL은 내용 없이 표시만
+SEEN_NOTES = {"search": "already returned by an earlier search", "crawled": "already crawled"}
+
+def _truncate(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars].rsplit(" ", 1)[0] + " …"
+
+def _format_result(elem: dict, query: str, reused: bool = False) -> dict:
+    # 재사용된 결과는 이미 본 URL이어도 내용을 그대로 반환 (재사용 시 검색을 생략하는 대신 내용은 유지)
+    seen = None if reused else seen_urls.check_and_mark(elem['url'], "search")
+    if seen:
+        return {'title': elem['title'], 'url': elem['url'], 'seen': SEEN_NOTES[seen]}
+    # 본문을 가져오지 못한 결과(빈 raw content)는 snippet으로 대체
+    excerpt = _excerpt_raw_content(elem['raw_content'], query) if elem.get('raw_content') else ""
+    if excerpt.strip():
+        return {'title': elem['title'], 'url': elem['url'], 'raw_content': excerpt}
+    return {'title': elem['title'], 'url': elem['url'], 'content': _truncate(elem['content'] or "", TAVILY_SNIPPET_CHARS)}
+
+def _encode_results(results: list[dict]) -> str:
+    """Serialize results as JSON or as compact plain-text blocks (no escaping, non-ASCII kept as is)"""
+    if TAVILY_RESULT_FORMAT == "json":
+        return json.dumps(results, ensure_ascii=False)
+    blocks = []
+    for i, elem in enumerate(results, 1):
+        title = f"[{i}] {elem['title']}"
+        if 'queries' in elem:
+            title += f" (queries {', '.join(map(str, elem['queries']))})"
+        if 'seen' in elem:
+            body = f"({elem['seen']} for this task; content omitted)"
+        elif 'raw_content' in elem:
+            body = f"Page excerpt:\n{elem['raw_content']}"
+        else:
+            body = f"Snippet: {elem['content']}"
+        blocks.append(f"{title}\n{elem['url']}\n{body}")
+    return "\n\n".join(blocks)
+
+def _results_header() -> str:
+    header = "\n\n# Relative Search Results\n\n"
+    if TAVILY_INCLUDE_RAW_CONTENT:
+        header += ("Results with a page excerpt (`raw_content`) already hold the passages most relevant to the query; "
+                   "use crawl_tool only for results with just a snippet (`content`).\n\n")
+    return header
+
+def merge_results(results_per_query: list[list], queries: list[str], reused: set[int] | None = None) -> list[dict]:
+    """
+    Interleave per-query results by rank and drop repeated URLs.
+
+    Args:
+        results_per_query: Search results of each query, best first
+        queries: The queries, in the same order (used to excerpt raw content)
+        reused: Indices of the queries whose results were reused from a similar earlier query
+            (returned with their content even if already seen)
+
+    Returns:
+        Merged results; each keeps the indices of the queries that returned it in `queries`
+    """
+    merged, by_url = [], {}
+    for rank in range(max((len(results) for results in results_per_query), default=0)):
+        for query_index, results in enumerate(results_per_query):
+            if rank >= len(results):
+                continue
+            elem = results[rank]
+            key = normalize_url(elem['url'])
+            if key in by_url:
+                by_url[key]['queries'].append(query_index + 1)
+                continue
+            by_url[key] = {**_format_result(elem, queries[query_index], query_index in (reused or ())),
+                           'queries': [query_index + 1]}
+            merged.append(by_url[key])
+    return merged
+
 @log_io
-def handle_tavily_tool(query: Annotated[str, "The search query to look up on the internet."]) -> str:
+def handle_tavily_tool(query: Annotated[str, "The search query to look up on the internet."], force_search: Annotated[bool, "Search even if a similar query was already searched."] = False) -> str:
     """
     Use this tool to search the internet for real-time information, current events, or specific data. 
     Provides relevant search results from Tavily's search engine API.
     """
     logger.info(f"{Colors.BLUE}===== Searching for: {query} ====={Colors.END}")
     try:
-        searched_content = tavily_search_instance.invoke({"query": query})
+        similar = _find_similar(query, force_search)
+        if similar:
+            searched_content = similar[1]
+        elif search_cache:
+            searched_content = search_cache.get_or_fetch(query, SEARCH_PARAMS, lambda: _search(query))
+        else:
+            searched_content = _search(query)
+        if query_index and not similar:
+            query_index.add(query, searched_content)
         
-        results = f"\n\n# Relative Search Results\n\n{json.dumps([{'title': elem['title'], 'url': elem['url'], **(({'raw_content': elem['raw_content']} if 'raw_content' in elem and elem['raw_content'] is not None else {'content': elem['content']}))} for elem in searched_content], ensure_ascii=False)}"
+        _prefetch(searched_content)
+        note = f"{_reuse_note(query, similar)}\n\n" if similar else ""
+        results = f"{_results_header()}{note}{_encode_results([_format_result(elem, query, reused=bool(similar)) for elem in searched_content])}"
         
         logger.info(f"{Colors.GREEN}===== Search successful ====={Colors.END}")
         logger.debug(f'Search Results: {results}')
@@ -80,13 +299,65 @@ def handle_tavily_tool(query: Annotated[str, "The search query to look up on the
         logger.debug(f"{Colors.RED}Failed to search. Error: {repr(e)}{Colors.END}")
         return error_msg
 
+@log_io
+def handle_batch_tavily_tool(queries: Annotated[list[str], "A list of search queries to run in parallel."], force_search: Annotated[bool, "Search even if similar queries were already searched."] = False) -> str:
+    """
+    Run several searches concurrently and return the merged, URL-deduplicated results in one result.
+    """
+    # 표기만 다른 중복 쿼리는 한 번만 검색
+    unique_queries, normalized = [], set()
+    for query in queries:
+        if normalize_query(query) not in normalized:
+            normalized.add(normalize_query(query))
+            unique_queries.append(query)
+    # 이번 실행의 이전 검색과 거의 같은 쿼리는 이전 결과를 재사용
+    reused = {query: similar for query in unique_queries if (similar := _find_similar(query, force_search))}
+    to_search = [query for query in unique_queries if query not in reused]
+    logger.info(f"{Colors.BLUE}===== Searching {len(to_search)} queries in parallel ====={Colors.END}")
+    try:
+        searched = dict(zip(to_search, asyncio.run(_search_many(to_search)))) if to_search else {}
+    except Exception as e:
+        logger.debug(f"{Colors.RED}Failed to search. Error: {repr(e)}{Colors.END}")
+        return f"Failed to search. Error: {repr(e)}"
+    if query_index:
+        for query, outcome in searched.items():
+            if not isinstance(outcome, Exception):
+                query_index.add(query, outcome)
+    outcomes = [reused[query][1] if query in reused else searched[query] for query in unique_queries]
+
+    succeeded = [results if not isinstance(results, Exception) else [] for results in outcomes]
+    failures = [(query, outcome) for query, outcome in zip(unique_queries, outcomes) if isinstance(outcome, Exception)]
+    if len(failures) == len(unique_queries):
+        return "Failed to search. Errors:\n" + "\n".join(f"- {query}: {repr(error)}" for query, error in failures)
+
+    merged = merge_results(succeeded, unique_queries, {i for i, query in enumerate(unique_queries) if query in reused})
+    _prefetch(merged)
+    header = "\n".join(f"{i}. {query}" for i, query in enumerate(unique_queries, 1))
+    results = (f"{_results_header()}Queries (referenced by `queries` in each result):\n{header}\n\n"
+               f"{_encode_results(merged)}")
+    if reused:
+        results += "\n\n" + "\n".join(_reuse_note(query, similar) for query, similar in reused.items())
+    if failures:
+        results += "\n\nQueries that failed:\n" + "\n".join(f"- {query}: {repr(error)}" for query, error in failures)
+
+    logger.info(f"{Colors.GREEN}===== Search successful ({len(merged)} unique results, "
+                f"{len(unique_queries) - len(failures)}/{len(unique_queries)} queries) ====={Colors.END}")
+    logger.debug(f'Search Results: {results}')
+    return results
+
 # Function name must match tool name
 def tavily_tool(tool: ToolUse, **kwargs: Any) -> ToolResult:
     tool_use_id = tool["toolUseId"]
-    query = tool["input"]["query"]
-    
-    # Use the existing handle_tavily_tool function
-    result = handle_tavily_tool(query)
+    query, queries = tool["input"].get("query"), tool["input"].get("queries")
+    force_search = bool(tool["input"].get("force_search", False))
+
+    # Several queries run concurrently, a single query uses the existing handle_tavily_tool function
+    if queries:
+        result = handle_batch_tavily_tool(list(queries) + ([query] if query and query not in queries else []), force_search)
+    elif query:
+        result = handle_tavily_tool(query, force_search)
+    else:
+        result = "Failed to search: either `query` or `queries` is required."
     
     # Check if search was successful based on the result string
     if "Failed to search" in result:
@@ -0,0 +1,139 @@
+"""
+Output and resource policy for the code execution tools (python_repl_tool, bash_tool).
+Output beyond a token budget is cut to its head and tail before it reaches the agent,
+with the full text spilled to a file in the artifact folder, and child processes run
+under memory and CPU time limits so concurrent runs cannot exhaust the host.
+"""
+
+import os
+import uuid
+import resource
+import logging
+from datetime import datetime
+from typing import Optional, Union
+
+from src.crawler.relevance import estimate_tokens, CHARS_PER_TOKEN
+
+logger = logging.getLogger(__name__)
+
+# Tokens of tool output returned to the agent; longer output is truncated and spilled to a file (0 disables)
+TOOL_OUTPUT_TOKEN_BUDGET = int(os.getenv("TOOL_OUTPUT_TOKEN_BUDGET", "4000"))
+
+# 넘친 출력의 저장 위치 (기본: 현재 작업의 artifacts 폴더 아래 tool_outputs)
+TOOL_OUTPUT_SPILL_DIR = os.getenv("TOOL_OUTPUT_SPILL_DIR", "")
+
+# Memory (MB of heap/data) and CPU seconds per execution for code run by the tools (0 disables a limit)
+CODE_EXEC_MAX_MEMORY_MB = int(os.getenv("CODE_EXEC_MAX_MEMORY_MB", "4096"))
+CODE_EXEC_MAX_CPU_SECONDS = int(os.getenv("CODE_EXEC_MAX_CPU_SECONDS", "600"))
+
+HEAD_SHARE = 0.5  # 잘라낸 출력에서 앞부분이 차지하는 비율 (나머지는 뒷부분)
+
+
+def _spill_dir() -> str:
+    if TOOL_OUTPUT_SPILL_DIR:
+        return TOOL_OUTPUT_SPILL_DIR
+    try:
+        from src.graph.nodes import _global_node_states
+        artifact_folder = (_global_node_states.get("shared") or {}).get("artifact_folder", "./artifacts/")
+    except Exception:
+        artifact_folder = "./artifacts/"
+    return os.path.join(artifact_folder, "tool_outputs")
+
+
+def spill_output(text: str, tool_name: str) -> str:
+    """Write `text` to a new file in the spill folder and return its path"""
+    folder = _spill_dir()
+    os.makedirs(folder, exist_ok=True)
+    name = f"{tool_name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}.txt"
+    path = os.path.join(folder, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def _head(text: str, max_chars: int) -> str:
+    """Whole lines from the start of `text` within max_chars (at least part of the first line)"""
+    cut = text.rfind("\n", 0, max_chars + 1)
+    return text[:cut + 1] if cut > 0 else text[:max_chars]
+
+
+def _tail(text: str, max_chars: int) -> str:
+    """Whole lines from the end of `text` within max_chars (at least part of the last line)"""
+    start = len(text) - max_chars
+    if start <= 0:
+        return text
+    cut = text.find("\n", start)
+    return text[cut + 1:] if 0 <= cut < len(text) - 1 else text[start:]
+
+
+def limit_output(text: str, tool_name: str, token_budget: Optional[int] = None) -> str:
+    """
+    Keep tool output within a token budget.
+
+    Output over the budget is replaced by its first and last lines around a marker that
+    points to a file holding the full output.
+
+    Args:
+        text: Output of the execution
+        tool_name: Tool name, used in the spill file name
+        token_budget: Token budget (default: TOOL_OUTPUT_TOKEN_BUDGET; 0 disables)
+
+    Returns:
+        `text` itself, or the truncated output with the spill file path
+    """
+    budget = TOOL_OUTPUT_TOKEN_BUDGET if token_budget is None else token_budget
+    total_tokens = estimate_tokens(text)
+    if budget <= 0 or total_tokens <= budget:
+        return text
+
+    max_chars = budget * CHARS_PER_TOKEN
+    head = _head(text, int(max_chars * HEAD_SHARE))
+    tail = _tail(text[len(head):], max_chars - len(head))
+    omitted = text[len(head):len(text) - len(tail)]
+    try:
+        path = spill_output(text, tool_name)
+        location = f"the full output is saved in {path}; inspect it with targeted commands (grep, head, tail, " \
+                   f"pandas filters) instead of printing it whole"
+    except OSError as e:
+        logger.warning(f"Could not save the full {tool_name} output: {e}")
+        location = "the full output could not be saved; print a narrower selection"
+    marker = (f"[... output truncated: {omitted.count(chr(10))} lines (~{estimate_tokens(omitted)} tokens) omitted "
+              f"of {text.count(chr(10)) + 1} lines (~{total_tokens} tokens); {location} ...]")
+    return f"{head.rstrip(chr(10))}\n\n{marker}\n\n{tail}"
+
+
+def _soft_limit(limit: int, value: int) -> int:
+    """`value` capped at the current hard limit, which a child cannot raise"""
+    _, hard = resource.getrlimit(limit)
+    return value if hard == resource.RLIM_INFINITY else min(value, hard)
+
+
+def limit_command(args: Union[str, list[str]], memory_mb: Optional[int] = None,
+                  cpu_seconds: Optional[int] = None) -> Union[str, list[str]]:
+    """
+    Wrap a command so it runs under the memory (RLIMIT_DATA) and CPU time (RLIMIT_CPU) limits.
+
+    The limits are set with `ulimit` by /bin/sh before the command starts, so everything it
+    runs inherits them; no `preexec_fn` runs in the (threaded) parent after fork.
+
+    Args:
+        args: Argument list, or a command string for shell=True
+        memory_mb: Memory limit in MB (default: CODE_EXEC_MAX_MEMORY_MB; 0 disables)
+        cpu_seconds: CPU time limit in seconds (default: CODE_EXEC_MAX_CPU_SECONDS; 0 disables)
+
+    Returns:
+        The wrapped command, of the same kind as `args` (unchanged if both limits are disabled)
+    """
+    memory_mb = CODE_EXEC_MAX_MEMORY_MB if memory_mb is None else memory_mb
+    cpu_seconds = CODE_EXEC_MAX_CPU_SECONDS if cpu_seconds is None else cpu_seconds
+    limits = []
+    if memory_mb > 0:
+        limits.append(f"ulimit -S -d {_soft_limit(resource.RLIMIT_DATA, memory_mb * 1024 * 1024) // 1024}")  # KB 단위
+    if cpu_seconds > 0:
+        limits.append(f"ulimit -S -t {_soft_limit(resource.RLIMIT_CPU, cpu_seconds)}")
+    if not limits:
+        return args
+    # 제한을 걸지 못하면 명령을 실행하지 않음
+    if isinstance(args, str):
+        return f"{' && '.join(limits)} || exit 126\n{args}"
+    return ["/bin/sh", "-c", f'{" && ".join(limits)} && exec "$0" "$@"', *args]
@@ -0,0 +1,676 @@
+"""
+Persistent Python kernels for python_repl_tool.
+A kernel is a long-lived child interpreter that keeps its namespace between executions,
+so imports, loaded DataFrames and helper functions survive across the calls of one agent
+session. A forking kernel instead preloads heavy libraries once and runs every execution
+in a fresh fork of itself (KernelPool keeps several of them warm). With a monitor, output
+is streamed while the code runs and the execution can be aborted. This file is also the
+kernel's entry point (run as a script), so it only uses the standard library.
+"""
+
+import os
+import sys
+import json
+import time
+import codecs
+import queue
+import signal
+import select
+import tempfile
+import threading
+import subprocess
+
+INTERRUPT_GRACE = 5.0  # 타임아웃 시 SIGINT 후 커널을 강제 종료하기까지 기다리는 시간(초)
+POLL_INTERVAL = 0.2    # 모니터 사용 시 출력 전달/중단 요청 확인 간격(초)
+
+
+class KernelResult:
+    """Outcome of one kernel execution."""
+
+    def __init__(self, ok: bool, stdout: str = "", stderr: str = "", restarted: bool = False,
+                 timed_out: bool = False, elapsed: float = 0.0, fork_ms: float | None = None,
+                 aborted: str | None = None):
+        self.ok = ok
+        self.stdout = stdout
+        self.stderr = stderr
+        self.restarted = restarted  # 이전 커널이 죽어서 이번 실행 전에 새로 시작됨 (네임스페이스 유실)
+        self.timed_out = timed_out
+        self.elapsed = elapsed
+        self.fork_ms = fork_ms  # 포크 방식: fork() 호출부터 자식 프로세스 시작까지 걸린 시간(ms)
+        self.aborted = aborted  # 모니터가 요청한 중단 사유
+
+
+class _Spool:
+    """
+    Files receiving an execution's stdout/stderr, tailed by the parent while it runs.
+
+    A monitor is any object with `on_output(stream, text)` (complete lines) and `poll()`
+    (returns an abort reason or None), such as src.utils.tool_progress.Execution.
+    """
+
+    def __init__(self, monitor):
+        self.monitor = monitor
+        self.paths, self._files, self._decoders, self._partial, self.text = {}, {}, {}, {}, {}
+        for stream in ("stdout", "stderr"):
+            fd, path = tempfile.mkstemp(prefix=f"repl-{stream}-")
+            self.paths[f"{stream}_path"] = path
+            self._files[stream] = os.fdopen(fd, "rb")
+            self._decoders[stream] = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            self._partial[stream] = ""
+            self.text[stream] = []
+
+    def drain(self, final: bool = False) -> None:
+        for stream, f in self._files.items():
+            data = self._partial[stream] + self._decoders[stream].decode(f.read(), final=final)
+            complete, _, rest = data.rpartition("\n") if not final else (data, "", "")
+            if complete:
+                self.text[stream].append(complete + ("\n" if not final else ""))
+                self.monitor.on_output(stream, complete)
+            self._partial[stream] = rest
+
+    def output(self, stream: str) -> str:
+        return "".join(self.text[stream])
+
+    def close(self) -> None:
+        self.drain(final=True)
+        for stream, f in self._files.items():
+            f.close()
+            try:
+                os.unlink(self.paths[f"{stream}_path"])
+            except OSError:
+                pass
+
+
+class PythonKernel:
+    """
+    A long-lived Python child process executing code in one persistent namespace.
+
+    Requests and replies are JSON lines on private copies of the child's stdin/stdout;
+    during an execution the child's file descriptors 1 and 2 point at temporary files, so
+    output of C extensions and subprocesses is captured too. A call that exceeds its
+    timeout is interrupted with SIGINT (the namespace survives); if the kernel does not
+    answer within INTERRUPT_GRACE seconds its process group is killed and the next call
+    starts a fresh kernel, as does any call after the kernel crashed.
+    """
+
+    def __init__(self, timeout: float = 600, cwd: str | None = None, limits: dict | None = None):
+        """
+        Args:
+            timeout: Default per-call timeout in seconds (default: 600)
+            cwd: Working directory of the kernel (default: current directory)
+            limits: Per-execution resource limits {"memory_mb": ..., "cpu_seconds": ...} (0 or missing: none)
+        """
+        self.timeout = timeout
+        self.cwd = cwd
+        self.limits = limits or {}
+        self.executions = 0
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+        self._started_once = False
+        self._buffer = b""
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _command(self) -> list[str]:
+        return [sys.executable, "-u", os.path.abspath(__file__)]
+
+    def _start(self) -> None:
+        self._proc = subprocess.Popen(
+            self._command(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.cwd,
+            start_new_session=True,  # 터미널 Ctrl+C 분리, 타임아웃 시 하위 프로세스까지 종료
+        )
+        self.executions = 0
+        self._started_once = True
+        self._buffer = b""
+
+    def _kill(self) -> None:
+        if self._proc is None:
+            return
+        try:
+            os.killpg(self._proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        for stream in (self._proc.stdin, self._proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        self._proc.wait()
+        self._proc = None
+
+    def _read_message(self, timeout: float) -> dict | None:
+        """The next JSON line from the kernel, or None if none arrives within `timeout`"""
+        deadline = time.monotonic() + timeout
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([self._proc.stdout], [], [], remaining)
+            if not ready:
+                return None
+            chunk = os.read(self._proc.stdout.fileno(), 1 << 20)
+            if not chunk:
+                raise EOFError(f"kernel exited with code {self._proc.wait()}")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def _read_reply(self, deadline: float, spool: _Spool | None = None) -> tuple[dict | None, str | None]:
+        """
+        Wait for the execution's reply, streaming output to the monitor meanwhile.
+
+        Returns:
+            (reply, None), (None, None) if the deadline passed, or (None, abort reason)
+        """
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None, None
+            message = self._read_message(min(remaining, POLL_INTERVAL) if spool else remaining)
+            if spool:
+                spool.drain()
+            if message is not None and "ok" not in message:
+                self._on_message(message)
+            elif message is not None:
+                return message, None
+            elif spool:
+                reason = spool.monitor.poll()
+                if reason:
+                    return None, reason
+
+    def _on_message(self, message: dict) -> None:
+        """Non-reply messages sent during an execution (see ForkingKernel)"""
+
+    def _request(self, code: str, timeout: float, spool: _Spool | None) -> None:
+        request = {"code": code, "timeout": timeout, "limits": self.limits, **(spool.paths if spool else {})}
+        self._proc.stdin.write(json.dumps(request).encode("utf-8") + b"\n")
+        self._proc.stdin.flush()
+
+    def execute(self, code: str, timeout: float | None = None, monitor=None) -> KernelResult:
+        """
+        Run `code` in the kernel's namespace.
+
+        Args:
+            code: Python source to execute
+            timeout: Seconds before the execution is interrupted (default: self.timeout)
+            monitor: Receives output lines while the code runs and may abort it (see _Spool)
+
+        Returns:
+            KernelResult with the captured stdout/stderr; stderr holds the traceback on failure
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            restarted = False
+            if not self.alive:
+                restarted = self._started_once
+                if self._proc is not None:
+                    self._kill()
+                self._start()
+
+            started = time.monotonic()
+            spool = _Spool(monitor) if monitor is not None else None
+            try:
+                self._request(code, timeout, spool)
+                reply, aborted = self._read_reply(started + timeout, spool)
+                if reply is None:
+                    # 인터럽트로 네임스페이스를 유지한 채 중단 시도, 응답이 없으면 강제 종료
+                    os.killpg(self._proc.pid, signal.SIGINT)
+                    reply, _ = self._read_reply(time.monotonic() + INTERRUPT_GRACE)
+                    message = f"Execution aborted ({aborted})" if aborted else f"Execution timed out after {timeout:g} seconds"
+                    if reply is None:
+                        self._kill()
+                        message += " and the kernel was restarted; variables from earlier calls are gone"
+                        if spool:
+                            spool.drain()
+                        reply = {"stdout": spool.output("stdout") if spool else "", "stderr": ""}
+                    return KernelResult(False, reply["stdout"], f"{reply['stderr']}\n{message}".lstrip("\n"),
+                                        restarted=restarted, timed_out=not aborted, aborted=aborted,
+                                        elapsed=time.monotonic() - started)
+            except (OSError, EOFError, ValueError) as e:
+                self._kill()
+                return KernelResult(False, stderr=f"The Python kernel crashed ({e}); it will be restarted on the next call "
+                                                  "and variables from earlier calls are gone",
+                                    restarted=restarted, elapsed=time.monotonic() - started)
+            finally:
+                if spool:
+                    spool.close()
+
+            self.executions += 1
+            return KernelResult(reply["ok"], reply["stdout"], reply["stderr"], restarted=restarted,
+                                elapsed=time.monotonic() - started)
+
+    def start(self) -> None:
+        """Start the kernel process now instead of on the first call."""
+        with self._lock:
+            if not self.alive:
+                if self._proc is not None:
+                    self._kill()
+                self._start()
+                self._started_once = False  # 미리 시작한 커널은 재시작 알림 대상이 아님
+
+    def reset(self) -> None:
+        """Discard the namespace; the next call starts a fresh kernel."""
+        with self._lock:
+            self._kill()
+            self._started_once = False
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._kill()
+
+
+class KernelSessions:
+    """One PythonKernel per session (agent instance), started lazily on first use."""
+
+    def __init__(self, timeout: float = 600, cwd: str | None = None, limits: dict | None = None):
+        self.timeout = timeout
+        self.cwd = cwd
+        self.limits = limits
+        self._kernels: dict[str, PythonKernel] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session: str) -> PythonKernel:
+        with self._lock:
+            kernel = self._kernels.get(session)
+            if kernel is None:
+                kernel = self._kernels[session] = PythonKernel(timeout=self.timeout, cwd=self.cwd, limits=self.limits)
+            return kernel
+
+    def reset(self, session: str) -> None:
+        with self._lock:
+            kernel = self._kernels.get(session)
+        if kernel is not None:
+            kernel.reset()
+
+    def release(self, session: str) -> None:
+        """Shut down and forget one session's kernel (no-op if it was never started)."""
+        with self._lock:
+            kernel = self._kernels.pop(session, None)
+        if kernel is not None:
+            kernel.shutdown()
+
+    def shutdown_all(self) -> None:
+        with self._lock:
+            kernels, self._kernels = list(self._kernels.values()), {}
+        for kernel in kernels:
+            kernel.shutdown()
+
+
+class ForkingKernel(PythonKernel):
+    """
+    A template process that imports `preload` once and forks a fresh child per execution.
+
+    Every execution starts from the template's clean state (nothing persists between
+    calls, as with a new interpreter) but skips interpreter startup and the preloaded
+    imports. The template enforces the timeout by killing the child's process group;
+    the template itself is only restarted if it stops answering or dies.
+    """
+
+    def __init__(self, preload: list[str] | tuple[str, ...] = (), timeout: float = 600, cwd: str | None = None,
+                 limits: dict | None = None):
+        """
+        Args:
+            preload: Modules imported by the template before forking (missing ones are skipped)
+            timeout: Default per-call timeout in seconds (default: 600)
+            cwd: Working directory of the template (default: current directory)
+            limits: Resource limits applied to each fork (see PythonKernel)
+        """
+        super().__init__(timeout=timeout, cwd=cwd, limits=limits)
+        self.preload = list(preload)
+        self._child_pid = None
+
+    def _command(self) -> list[str]:
+        return super()._command() + ["--fork", ",".join(self.preload)]
+
+    def _on_message(self, message: dict) -> None:
+        self._child_pid = message.get("pid")  # 템플릿이 알려주는 이번 실행의 자식 프로세스
+
+    def _kill_child(self) -> None:
+        if not self._child_pid:
+            return
+        try:
+            os.killpg(self._child_pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+    def execute(self, code: str, timeout: float | None = None, monitor=None) -> KernelResult:
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            if not self.alive:
+                if self._proc is not None:
+                    self._kill()
+                self._start()
+
+            started = time.monotonic()
+            self._child_pid = None
+            spool = _Spool(monitor) if monitor is not None else None
+            try:
+                self._request(code, timeout, spool)
+                # 첫 호출은 템플릿의 사전 import가 끝날 때까지 기다리므로 여유를 둠
+                reply, aborted = self._read_reply(started + timeout + INTERRUPT_GRACE + 60, spool)
+                if aborted:
+                    # 자식 프로세스만 종료하고 템플릿은 계속 사용
+                    self._kill_child()
+                    if self._read_reply(time.monotonic() + INTERRUPT_GRACE)[0] is None:
+                        self._kill()
+                    spool.drain()
+                    return KernelResult(False, spool.output("stdout"), f"Execution aborted ({aborted})",
+                                        aborted=aborted, elapsed=time.monotonic() - started)
+                if reply is None:
+                    self._kill()
+                    return KernelResult(False, stderr=f"Execution timed out after {timeout:g} seconds",
+                                        timed_out=True, elapsed=time.monotonic() - started)
+                if reply.get("timed_out") and spool:
+                    spool.drain()
+                    reply["stdout"] = spool.output("stdout")  # 종료된 자식의 출력 중 전달된 부분
+            except (OSError, EOFError, ValueError) as e:
+                self._kill()
+                return KernelResult(False, stderr=f"The Python worker crashed ({e}) and will be restarted",
+                                    elapsed=time.monotonic() - started)
+            finally:
+                if spool:
+                    spool.close()
+
+            self.executions += 1
+            return KernelResult(reply["ok"], reply["stdout"], reply["stderr"], timed_out=reply.get("timed_out", False),
+                                elapsed=time.monotonic() - started, fork_ms=reply.get("fork_ms"))
+
+
+class KernelPool:
+    """
+    Pool of warm ForkingKernel templates; each execution forks from an idle template.
+
+    Executions beyond the pool size wait for a template. stats() reports the pool
+    utilization (busy template time over available template time since the last
+    reset_stats()), the peak number of busy templates, queueing delay and fork latency.
+    """
+
+    def __init__(self, size: int = 2, preload: list[str] | tuple[str, ...] = (), timeout: float = 600,
+                 cwd: str | None = None, limits: dict | None = None):
+        """
+        Args:
+            size: Number of template processes (default: 2)
+            preload: Modules each template imports once
+            timeout: Default per-call timeout in seconds (default: 600)
+            cwd: Working directory of the templates (default: current directory)
+            limits: Resource limits applied to each fork (see PythonKernel)
+        """
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.templates = [ForkingKernel(preload, timeout=timeout, cwd=cwd, limits=limits) for _ in range(self.size)]
+        self._idle: queue.Queue[ForkingKernel] = queue.Queue()
+        for template in self.templates:
+            self._idle.put(template)
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def start(self) -> None:
+        """Start every template now so the preloaded imports happen before the first call."""
+        for template in self.templates:
+            template.start()
+
+    def execute(self, code: str, timeout: float | None = None, monitor=None) -> KernelResult:
+        queued = time.monotonic()
+        template = self._idle.get()
+        acquired = time.monotonic()
+        with self._stats_lock:
+            self._busy += 1
+            self._stats["peak_busy"] = max(self._stats["peak_busy"], self._busy)
+            self._stats["wait_seconds"] += acquired - queued
+        try:
+            result = template.execute(code, timeout, monitor)
+        finally:
+            self._idle.put(template)
+            with self._stats_lock:
+                self._busy -= 1
+                self._stats["busy_seconds"] += time.monotonic() - acquired
+        with self._stats_lock:
+            self._stats["executions"] += 1
+            if result.fork_ms is not None:
+                self._stats["forks"] += 1
+                self._stats["fork_ms_total"] += result.fork_ms
+                self._stats["fork_ms_max"] = max(self._stats["fork_ms_max"], result.fork_ms)
+        return result
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._since = time.monotonic()
+            self._busy = 0
+            self._stats = {"executions": 0, "forks": 0, "peak_busy": 0, "busy_seconds": 0.0, "wait_seconds": 0.0,
+                           "fork_ms_total": 0.0, "fork_ms_max": 0.0}
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            executions, utilization (0-1), peak_busy, avg_wait_ms, avg_fork_ms and max_fork_ms
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+            elapsed = time.monotonic() - self._since
+        executions, forks = stats["executions"], stats["forks"]
+        return {
+            "executions": executions,
+            "utilization": stats["busy_seconds"] / (self.size * elapsed) if elapsed > 0 else 0.0,
+            "peak_busy": stats["peak_busy"],
+            "avg_wait_ms": stats["wait_seconds"] * 1000 / executions if executions else 0.0,
+            "avg_fork_ms": stats["fork_ms_total"] / forks if forks else 0.0,
+            "max_fork_ms": stats["fork_ms_max"],
+        }
+
+    def shutdown(self) -> None:
+        for template in self.templates:
+            template.shutdown()
+
+
+# ---------------------------------------------------------------------------
+# 커널 프로세스 측 (스크립트로 실행됨)
+# ---------------------------------------------------------------------------
+
+def _read_output(f) -> str:
+    f.seek(0)
+    return f.read().decode("utf-8", errors="replace")
+
+
+def _output_file(path: str | None):
+    # 부모가 실시간으로 읽는 파일이 주어지면 그곳에, 아니면 임시 파일에 기록
+    return open(path, "w+b") if path else tempfile.TemporaryFile()
+
+
+def _cpu_limit_exceeded(signum, frame):
+    raise TimeoutError("CPU time limit of this execution exceeded")
+
+
+def _set_soft_limit(limit: int, value) -> None:
+    import resource
+
+    _, hard = resource.getrlimit(limit)
+    if value is None or (hard != resource.RLIM_INFINITY and value > hard):
+        value = hard
+    resource.setrlimit(limit, (value, hard))
+
+
+def _apply_limits(limits: dict | None) -> None:
+    """Memory (RLIMIT_DATA) and CPU time (RLIMIT_CPU, counted from now) limits for one execution"""
+    import resource
+
+    limits = limits or {}
+    if limits.get("memory_mb"):
+        _set_soft_limit(resource.RLIMIT_DATA, limits["memory_mb"] * 1024 * 1024)
+    if limits.get("cpu_seconds"):
+        # 상주 커널은 CPU 시간이 누적되므로 지금까지 사용량에 더해서 설정 (초과 시 SIGXCPU → TimeoutError)
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        _set_soft_limit(resource.RLIMIT_CPU, int(usage.ru_utime + usage.ru_stime) + 1 + limits["cpu_seconds"])
+
+
+def _clear_limits(limits: dict | None) -> None:
+    import resource
+
+    limits = limits or {}
+    if limits.get("memory_mb"):
+        _set_soft_limit(resource.RLIMIT_DATA, None)
+    if limits.get("cpu_seconds"):
+        _set_soft_limit(resource.RLIMIT_CPU, None)
+
+
+def _execute(code: str, namespace: dict, devnull: int, stdout_path: str | None = None,
+             stderr_path: str | None = None, limits: dict | None = None) -> dict:
+    import traceback
+
+    with _output_file(stdout_path) as out, _output_file(stderr_path) as err:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        ok = True
+        try:
+            _apply_limits(limits)
+            exec(compile(code, "<string>", "exec"), namespace)
+        except SystemExit as e:
+            # python -c 와 동일하게 exit(0)/exit()는 성공, 그 외는 실패
+            ok = e.code in (None, 0)
+            if isinstance(e.code, str):
+                print(e.code, file=sys.stderr)
+        except BaseException as e:
+            ok = False
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next)  # 커널 자체 프레임은 제외
+        finally:
+            _clear_limits(limits)
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            except BaseException:
+                pass
+            os.dup2(devnull, 1)
+            os.dup2(devnull, 2)
+
+        # 매 호출마다 새 프로세스였을 때처럼 열린 matplotlib 그림은 호출 사이에 유지하지 않음
+        pyplot = sys.modules.get("matplotlib.pyplot")
+        if pyplot is not None:
+            try:
+                pyplot.close("all")
+            except Exception:
+                pass
+        return {"ok": ok, "stdout": _read_output(out), "stderr": _read_output(err)}
+
+
+def _preload(modules: list[str]) -> None:
+    import importlib
+
+    os.environ.setdefault("MPLBACKEND", "Agg")  # 화면 없는 환경의 matplotlib 백엔드
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # 설치되지 않은 라이브러리는 건너뜀 (실행 시 코드가 직접 import하다 실패)
+
+
+def _run_forked(code: str, timeout: float, devnull: int, replies, stdout_path: str | None = None,
+                stderr_path: str | None = None, limits: dict | None = None) -> dict:
+    """Execute `code` in a fresh fork of this process and collect its reply."""
+    import builtins
+
+    read_fd, write_fd = os.pipe()
+    forked_at = time.monotonic()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            os.setpgid(0, 0)  # 타임아웃 시 자식이 띄운 프로세스까지 함께 종료
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            fork_ms = (time.monotonic() - forked_at) * 1000
+            reply = _execute(code, {"__name__": "__main__", "__builtins__": builtins}, devnull, stdout_path, stderr_path,
+                             limits)
+            reply["fork_ms"] = fork_ms
+            with os.fdopen(write_fd, "wb") as f:
+                f.write(json.dumps(reply).encode("utf-8"))
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    try:
+        os.setpgid(pid, pid)
+    except OSError:
+        pass
+    # 부모가 실행을 중단할 수 있도록 자식 프로세스 알림
+    replies.write(json.dumps({"pid": pid}).encode("utf-8") + b"\n")
+    replies.flush()
+    chunks, timed_out = [], False
+    deadline = forked_at + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        ready, _, _ = select.select([read_fd], [], [], max(remaining, 0))
+        if not ready:
+            timed_out = True
+            for kill in (lambda: os.killpg(pid, signal.SIGKILL), lambda: os.kill(pid, signal.SIGKILL)):
+                try:
+                    kill()
+                    break
+                except OSError:
+                    pass
+            break
+        chunk = os.read(read_fd, 1 << 20)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    os.close(read_fd)
+    _, status = os.waitpid(pid, 0)
+
+    if timed_out:
+        return {"ok": False, "stdout": "", "stderr": f"Execution timed out after {timeout:g} seconds", "timed_out": True}
+    try:
+        return json.loads(b"".join(chunks))
+    except ValueError:
+        return {"ok": False, "stdout": "",
+                "stderr": f"The execution process died (exit status {os.waitstatus_to_exitcode(status)}) without a result"}
+
+
+def _serve(preload: list[str] | None = None) -> None:
+    """
+    Kernel main loop: execute JSON requests from stdin, reply on stdout.
+
+    With `preload` (forking mode) the modules are imported once and each request runs in a
+    fresh fork; otherwise requests share one persistent namespace.
+    """
+    import builtins
+
+    sys.path[0] = ""  # python -c 와 같이 작업 디렉터리 기준 import
+    requests = os.fdopen(os.dup(0), "rb")
+    replies = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    signal.signal(signal.SIGXCPU, _cpu_limit_exceeded)
+    forking = preload is not None
+    if forking:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        _preload(preload)
+    namespace = {"__name__": "__main__", "__builtins__": builtins}
+    while True:
+        try:
+            line = requests.readline()
+            if not line:
+                break
+            request = json.loads(line)
+            paths = (request.get("stdout_path"), request.get("stderr_path"))
+            if forking:
+                reply = _run_forked(request["code"], request["timeout"], devnull, replies, *paths, request.get("limits"))
+            else:
+                reply = _execute(request["code"], namespace, devnull, *paths, request.get("limits"))
+            replies.write(json.dumps(reply).encode("utf-8") + b"\n")
+            replies.flush()
+        except KeyboardInterrupt:
+            continue  # 실행 사이에 도착한 늦은 인터럽트는 무시
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--fork":
+        _serve(preload=[name for name in sys.argv[2].split(",") if name])
+    else:
+        _serve()
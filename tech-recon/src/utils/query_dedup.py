@@ -0,0 +1,88 @@
+"""
+Near-duplicate search query detection.
+Compares a new query with the queries the current agent already searched using TF-IDF
+character n-grams (local, no embedding service) so rephrased searches can reuse
+earlier results.
+"""
+
+import re
+import threading
+from typing import Any
+
+from src.utils.search_cache import normalize_query
+
+_NUMBER = re.compile(r"\d+")
+_WORD = re.compile(r"\w+")
+STOPWORDS = {"a", "an", "and", "by", "for", "in", "of", "on", "the", "to", "vs", "with"}
+MIN_PREFIX_CHARS = 4  # startup/startups, pharma/pharmaceutical 처럼 접두어가 같으면 같은 단어로 취급
+
+def _words_covered(query: str, earlier: str) -> bool:
+    """True if every content word of `query` also appears in `earlier` (the new query adds no qualifier)"""
+    words, earlier_words = set(_WORD.findall(query)) - STOPWORDS, set(_WORD.findall(earlier)) - STOPWORDS
+    return all(any(word == other or (min(len(word), len(other)) >= MIN_PREFIX_CHARS
+                                     and (word.startswith(other) or other.startswith(word)))
+                   for other in earlier_words)
+               for word in words)
+
+class SimilarQueryIndex:
+    """
+    Queries searched by the current agent and their results.
+
+    A query matches an earlier one when the cosine similarity of their character 2-4 gram
+    TF-IDF vectors is at least `threshold`, both mention the same numbers and every content
+    word of the new query appears in the earlier one, so "edge AI market size 2025" matches
+    an earlier "Edge AI market size forecast 2025" but not "edge AI market size 2024", a
+    narrower "edge AI chips market size 2025" does not reuse an earlier "edge AI market size
+    2025", and "quantum computing startups funding" does not match "quantum sensing startups
+    funding".
+    """
+
+    def __init__(self, threshold: float = 0.75):
+        """
+        Args:
+            threshold: Minimum cosine similarity to reuse an earlier query's results (default: 0.75)
+        """
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget this run's queries (called at the start of every run)"""
+        with self._lock:
+            self._queries: list[str] = []
+            self._results: list[Any] = []
+            self.searches_saved = 0
+
+    def new_scope(self) -> None:
+        """Forget the queries for a new agent (the run's count of saved searches is kept)"""
+        with self._lock:
+            self._queries = []
+            self._results = []
+
+    def add(self, query: str, results: Any) -> None:
+        with self._lock:
+            self._queries.append(normalize_query(query))
+            self._results.append(results)
+
+    def find(self, query: str) -> tuple[str, Any, float] | None:
+        """
+        Return (earlier query, its results, similarity) for the most similar earlier query
+        above the threshold, or None. A match is counted as a saved search.
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer  # 무거운 import는 사용할 때만
+
+        query = normalize_query(query)
+        numbers = set(_NUMBER.findall(query))
+        with self._lock:
+            candidates = [i for i, earlier in enumerate(self._queries)
+                          if set(_NUMBER.findall(earlier)) == numbers and _words_covered(query, earlier)]
+            if not candidates:
+                return None
+            vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), sublinear_tf=True)
+            matrix = vectorizer.fit_transform(self._queries + [query])
+            similarities = (matrix[:-1] @ matrix[-1].T).toarray().ravel()
+            best = max(candidates, key=lambda i: similarities[i])
+            if similarities[best] < self.threshold:
+                return None
+            self.searches_saved += 1
+            return self._queries[best], self._results[best], float(similarities[best])
@@ -0,0 +1,56 @@
+"""
+Run lifecycle hooks.
+Allows tools to reset per-run state and report per-run statistics when
+graph_streaming_execution in main.py starts and finishes a run, and to scope state
+(e.g. which pages were already returned) to one sub-agent invocation.
+"""
+
+import logging
+import threading
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+_start_hooks: List[Callable[[], None]] = []
+_end_hooks: List[Callable[[], None]] = []
+_agent_start_hooks: List[Callable[[], None]] = []
+_hooks_lock = threading.Lock()
+
+def on_run_start(func: Callable[[], None]) -> Callable[[], None]:
+    """Register a callback to run at the start of every run (usable as a decorator)"""
+    with _hooks_lock:
+        _start_hooks.append(func)
+    return func
+
+def on_run_end(func: Callable[[], None]) -> Callable[[], None]:
+    """Register a callback to run at the end of every run (usable as a decorator)"""
+    with _hooks_lock:
+        _end_hooks.append(func)
+    return func
+
+def on_agent_start(func: Callable[[], None]) -> Callable[[], None]:
+    """Register a callback to run whenever a new sub-agent (e.g. a researcher step) is built (usable as a decorator)"""
+    with _hooks_lock:
+        _agent_start_hooks.append(func)
+    return func
+
+def _run_hooks(hooks: List[Callable[[], None]]) -> None:
+    with _hooks_lock:
+        callbacks = list(hooks)
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            logger.warning(f"Run hook {getattr(callback, '__name__', callback)} failed: {e}")
+
+def start_run() -> None:
+    """Call all registered start hooks"""
+    _run_hooks(_start_hooks)
+
+def end_run() -> None:
+    """Call all registered end hooks"""
+    _run_hooks(_end_hooks)
+
+def start_agent() -> None:
+    """Call all registered agent start hooks (the new agent has received no tool results yet)"""
+    _run_hooks(_agent_start_hooks)
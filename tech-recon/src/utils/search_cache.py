@@ -0,0 +1,193 @@
+"""
+Persistent search result cache.
+Caches web search results in SQLite keyed by the normalized query and the search
+parameters, and coalesces concurrent identical searches into one request.
+"""
+
+import os
+import re
+import json
+import asyncio
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+import unicodedata
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# 크롤러 HTTP 캐시와 같은 위치 (./artifacts 정리와 무관하게 실행 간 유지)
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "tech-recon", "search", "search.db")
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so trivially different spellings share a cache entry"""
+    query = unicodedata.normalize("NFKC", query).lower()
+    query = re.sub(r"\s+", " ", query).strip()
+    return query.rstrip(" ?.!")
+
+class SearchCache:
+    """
+    SQLite-backed cache of search results with single-flight request coalescing.
+
+    Entries are keyed by the normalized query plus the search parameters (e.g. max_results,
+    search_depth) and expire after `ttl` seconds. While a search is in flight, identical
+    requests from other threads wait for its result instead of calling the API again.
+    Failed searches are never cached.
+    """
+
+    def __init__(self, path: str | None = None, ttl: int = 86400):
+        """
+        Initialize SearchCache.
+
+        Args:
+            path: SQLite database file (default: ~/.cache/tech-recon/search/search.db)
+            ttl: Seconds a cached result stays valid (default: 1 day)
+        """
+        self.path = path or DEFAULT_CACHE_PATH
+        self.ttl = ttl
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future] = {}
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                query TEXT NOT NULL,
+                params TEXT NOT NULL,
+                results TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )"""
+        )
+        self._db.execute("DELETE FROM results WHERE expires_at < ?", (time.time(),))
+        self._db.commit()
+        self.reset_stats()
+
+    @staticmethod
+    def make_key(query: str, params: dict[str, Any]) -> str:
+        payload = json.dumps([normalize_query(query), params], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def reset_stats(self) -> None:
+        """Reset the per-run counters"""
+        with self._lock:
+            self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "errors": 0}
+
+    def stats(self) -> dict[str, float]:
+        """Per-run counters plus hit_rate (cache hits and coalesced waits over all lookups)"""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = (stats["hits"] + stats["coalesced"]) / lookups if lookups else 0.0
+        return stats
+
+    def get(self, query: str, params: dict[str, Any]) -> Any | None:
+        """Return the unexpired cached results, or None"""
+        with self._lock:
+            return self._get(self.make_key(query, params))
+
+    def _get(self, key: str) -> Any | None:
+        row = self._db.execute(
+            "SELECT results FROM results WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, query: str, params: dict[str, Any], results: Any) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (self.make_key(query, params), normalize_query(query), json.dumps(params, sort_keys=True),
+                 json.dumps(results, ensure_ascii=False), now, now + self.ttl),
+            )
+            self._db.commit()
+
+    def get_or_fetch(self, query: str, params: dict[str, Any], fetch: Callable[[], Any]) -> Any:
+        """
+        Return cached results, or run `fetch` once for all concurrent identical requests.
+
+        Args:
+            query: Search query
+            params: Search parameters that change the results (part of the cache key)
+            fetch: Performs the actual search; exceptions are propagated to every waiter
+
+        Returns:
+            The search results (JSON-serializable)
+        """
+        key = self.make_key(query, params)
+        cached, future, leader = self._lookup(key)
+        if cached is not None:
+            return cached
+        if not leader:
+            return future.result()
+
+        try:
+            results = fetch()
+        except BaseException as e:
+            self._fail(key, future, e)
+            raise
+        self._complete(query, params, key, future, results)
+        return results
+
+    async def aget_or_fetch(self, query: str, params: dict[str, Any], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async variant of get_or_fetch; coalesces with sync and async requests alike.
+
+        Args:
+            query: Search query
+            params: Search parameters that change the results (part of the cache key)
+            fetch: Coroutine function performing the actual search
+
+        Returns:
+            The search results (JSON-serializable)
+        """
+        key = self.make_key(query, params)
+        cached, future, leader = self._lookup(key)
+        if cached is not None:
+            return cached
+        if not leader:
+            return await asyncio.wrap_future(future)
+
+        try:
+            results = await fetch()
+        except BaseException as e:
+            self._fail(key, future, e)
+            raise
+        self._complete(query, params, key, future, results)
+        return results
+
+    def _lookup(self, key: str) -> tuple[Any | None, Future | None, bool]:
+        """(cached results, in-flight future, whether the caller must fetch)"""
+        with self._lock:
+            cached = self._get(key)
+            if cached is not None:
+                self._stats["hits"] += 1
+                return cached, None, False
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._in_flight[key] = Future()
+                self._stats["misses"] += 1
+                return None, future, True
+            self._stats["coalesced"] += 1
+            return None, future, False
+
+    def _complete(self, query: str, params: dict[str, Any], key: str, future: Future, results: Any) -> None:
+        try:
+            self.put(query, params, results)
+        except Exception as e:
+            # 캐시 저장 실패(SQLite 잠금, 디스크 부족 등)는 검색 결과 전달을 막지 않음
+            logger.warning(f"Search cache write failed: {e}")
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_result(results)
+
+    def _fail(self, key: str, future: Future, error: BaseException) -> None:
+        with self._lock:
+            self._stats["errors"] += 1
+            del self._in_flight[key]
+        future.set_exception(error)
@@ -0,0 +1,65 @@
+"""
+Registry of URLs already shown to the current agent.
+Search and crawl tools record the URLs whose content they returned, so a repeat can be
+sent as a short "already seen" marker instead of resending the same content. The registry
+is cleared for every new researcher agent, which has not received any earlier results.
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+from src.utils.run_hooks import on_run_start, on_agent_start
+
+# 출처별 우선순위 - 크롤링된 URL은 이후 검색 결과로 다시 나와도 "crawled"로 유지
+SOURCE_PRIORITY = {"search": 0, "crawled": 1}
+
+def normalize_url(url: str) -> str:
+    """Key for URL comparison (scheme, case of the host, fragment and trailing slash ignored)"""
+    parts = urlsplit(url)
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}{'?' + parts.query if parts.query else ''}"
+
+class SeenUrlRegistry:
+    """Thread-safe set of URLs seen by the current agent, with where each was seen"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all URLs (called at the start of every run)"""
+        with self._lock:
+            self._seen: dict[str, str] = {}
+            self.repeats = 0
+
+    def new_scope(self) -> None:
+        """Forget the seen URLs for a new agent (the run's repeat count is kept)"""
+        with self._lock:
+            self._seen = {}
+
+    def mark(self, url: str, source: str) -> None:
+        key = normalize_url(url)
+        with self._lock:
+            previous = self._seen.get(key)
+            if previous is None or SOURCE_PRIORITY[source] > SOURCE_PRIORITY[previous]:
+                self._seen[key] = source
+
+    def check_and_mark(self, url: str, source: str) -> str | None:
+        """
+        Return where `url` was already seen by the current agent, or record it and return None.
+
+        Args:
+            url: URL about to be returned to the agent
+            source: "search" or "crawled"
+        """
+        key = normalize_url(url)
+        with self._lock:
+            previous = self._seen.get(key)
+            if previous is not None:
+                self.repeats += 1
+                return previous
+            self._seen[key] = source
+            return None
+
+seen_urls = SeenUrlRegistry()
+on_run_start(seen_urls.reset)
+on_agent_start(seen_urls.new_scope)
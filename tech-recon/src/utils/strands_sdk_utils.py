@@ -154,6 +154,7 @@ class strands_utils():
         llm.config["streaming"] = streaming
 
         agent = Agent(
+            name=agent_name, # python_repl_tool 커널 세션 구분에 사용
             model=llm,
             system_prompt=system_prompts,
             tools=tools,
@@ -409,6 +410,12 @@ class strands_utils():
             elif event.get("event_type") == "tool_use": 
                 pass
 
+            elif event.get("event_type") == "tool_progress":
+                # 코드 실행 툴의 실시간 출력 (stdout/stderr 줄, heartbeat, 시작/종료 상태)
+                stream = event.get("stream", "stdout")
+                if stream in ("stdout", "stderr"): callback_tool.on_llm_new_token(f"  | {event.get('line', '')}\n")
+                else: callback_reasoning.on_llm_new_token(f"  [{event.get('tool_name', 'tool')} {stream}] {event.get('line', '')}\n")
+
             elif event.get("event_type") == "tool_result":
                 tool_name = event.get("tool_name", "unknown")
                 output = event.get("output", "")
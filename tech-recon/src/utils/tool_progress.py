@@ -0,0 +1,215 @@
+"""
+Live progress of code execution tools.
+python_repl_tool and bash_tool register each execution here while it runs. Output lines
+and heartbeats for silent jobs are sent to the event queue as "tool_progress" events, and
+the web UI (or the silence watchdog) can abort a running execution through this registry.
+"""
+
+import os
+import uuid
+import time
+import signal
+import threading
+import subprocess
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.utils.event_queue import put_event
+
+# 출력 스트리밍 사용 여부
+TOOL_PROGRESS_ENABLED = os.getenv("TOOL_PROGRESS_ENABLED", "true").lower() == "true"
+
+# Seconds without output before a heartbeat event is sent
+TOOL_HEARTBEAT_INTERVAL = float(os.getenv("TOOL_HEARTBEAT_INTERVAL", "15"))
+
+# Seconds without output before the watchdog aborts an execution (0 disables the watchdog)
+TOOL_WATCHDOG_SILENCE = float(os.getenv("TOOL_WATCHDOG_SILENCE", "0"))
+
+# Maximum output lines streamed per execution and characters per line (the tool result is not affected)
+TOOL_PROGRESS_MAX_LINES = int(os.getenv("TOOL_PROGRESS_MAX_LINES", "500"))
+TOOL_PROGRESS_LINE_CHARS = 1000
+
+POLL_INTERVAL = 0.2  # 실행 대기 중 출력/중단 요청을 확인하는 간격(초)
+
+_executions: Dict[str, "Execution"] = {}
+_executions_lock = threading.Lock()
+
+
+class Execution:
+    """A running tool execution: streams its output as events and carries abort requests."""
+
+    def __init__(self, tool_name: str, label: str, agent_name: Optional[str] = None, tool_id: Optional[str] = None):
+        """
+        Args:
+            tool_name: Tool running the execution (e.g. "bash_tool")
+            label: Short description shown in the UI (command or first code line)
+            agent_name: Agent that called the tool
+            tool_id: toolUseId of the call, to match progress with tool_use/tool_result events
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.tool_name = tool_name
+        self.label = label
+        self.agent_name = agent_name
+        self.tool_id = tool_id
+        self.started = time.monotonic()
+        self.last_activity = self.started
+        self.last_heartbeat = self.started
+        self.lines = 0
+        self.abort_reason: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def _emit(self, stream: str, line: str) -> None:
+        if not TOOL_PROGRESS_ENABLED:
+            return
+        put_event({
+            "timestamp": datetime.now().isoformat(),
+            "agent_name": self.agent_name,
+            "source": self.tool_name,
+            "type": "agent_tool_stream",
+            "event_type": "tool_progress",
+            "tool_name": self.tool_name,
+            "tool_id": self.tool_id,
+            "execution_id": self.id,
+            "stream": stream,  # stdout, stderr, heartbeat, status
+            "line": line,
+            "elapsed": round(self.elapsed, 1),
+        })
+
+    def on_output(self, stream: str, text: str) -> None:
+        """Stream output text (one or more complete lines) from stdout or stderr"""
+        with self._lock:
+            self.last_activity = time.monotonic()
+            for line in text.splitlines():
+                self.lines += 1
+                if self.lines <= TOOL_PROGRESS_MAX_LINES:
+                    self._emit(stream, line[:TOOL_PROGRESS_LINE_CHARS])
+                elif self.lines == TOOL_PROGRESS_MAX_LINES + 1:
+                    self._emit("status", f"(more than {TOOL_PROGRESS_MAX_LINES} lines; live output stopped)")
+
+    def poll(self) -> Optional[str]:
+        """
+        Called periodically while the execution runs: sends heartbeats and applies the watchdog.
+
+        Returns:
+            The abort reason if the execution should be stopped, else None
+        """
+        now = time.monotonic()
+        with self._lock:
+            silence = now - self.last_activity
+            if self.abort_reason is None and TOOL_WATCHDOG_SILENCE > 0 and silence >= TOOL_WATCHDOG_SILENCE:
+                self.abort_reason = f"no output for {silence:.0f} seconds (watchdog)"
+            if silence >= TOOL_HEARTBEAT_INTERVAL and now - self.last_heartbeat >= TOOL_HEARTBEAT_INTERVAL:
+                self.last_heartbeat = now
+                self._emit("heartbeat", f"still running ({self.elapsed:.0f}s, no output for {silence:.0f}s)")
+            return self.abort_reason
+
+    def abort(self, reason: str = "aborted by user") -> None:
+        with self._lock:
+            if self.abort_reason is None:
+                self.abort_reason = reason
+
+    def info(self) -> Dict[str, Any]:
+        return {"execution_id": self.id, "tool_name": self.tool_name, "agent_name": self.agent_name,
+                "label": self.label, "elapsed": round(self.elapsed, 1), "aborting": self.abort_reason is not None}
+
+
+class track_execution:
+    """Context manager registering an Execution for its duration (start/end status events included)."""
+
+    def __init__(self, tool_name: str, label: str, agent_name: Optional[str] = None, tool_id: Optional[str] = None):
+        self.execution = Execution(tool_name, label, agent_name, tool_id)
+
+    def __enter__(self) -> Execution:
+        with _executions_lock:
+            _executions[self.execution.id] = self.execution
+        self.execution._emit("status", f"started: {self.execution.label}")
+        return self.execution
+
+    def __exit__(self, *exc_info) -> None:
+        with _executions_lock:
+            _executions.pop(self.execution.id, None)
+        status = f"aborted: {self.execution.abort_reason}" if self.execution.abort_reason else "finished"
+        self.execution._emit("status", f"{status} ({self.execution.elapsed:.1f}s)")
+
+
+def running_executions() -> List[Dict[str, Any]]:
+    with _executions_lock:
+        return [execution.info() for execution in _executions.values()]
+
+
+def abort_execution(execution_id: Optional[str] = None, reason: str = "aborted by user") -> int:
+    """
+    Ask running executions to stop (all of them if no id is given).
+
+    Returns:
+        Number of executions asked to stop
+    """
+    with _executions_lock:
+        targets = [e for e in _executions.values() if execution_id is None or e.id == execution_id]
+    for execution in targets:
+        execution.abort(reason)
+    return len(targets)
+
+
+class ProcessOutput:
+    """Result of stream_process()."""
+
+    def __init__(self, returncode: Optional[int], stdout: str, stderr: str, timed_out: bool = False,
+                 aborted: Optional[str] = None):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.timed_out = timed_out
+        self.aborted = aborted
+
+
+def _kill_group(proc: subprocess.Popen) -> None:
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        proc.kill()
+
+
+def stream_process(args, execution: Execution, timeout: Optional[float] = None, **popen_kwargs) -> ProcessOutput:
+    """
+    Run a command like subprocess.run(capture_output=True), streaming its output line by line.
+
+    The process (and anything it started) is killed when `timeout` passes or the execution
+    is aborted.
+    """
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors="replace",
+                            start_new_session=True, **popen_kwargs)
+    captured = {"stdout": [], "stderr": []}
+
+    def _reader(pipe, stream):
+        for line in pipe:
+            captured[stream].append(line)
+            execution.on_output(stream, line)
+        pipe.close()
+
+    readers = [threading.Thread(target=_reader, args=(proc.stdout, "stdout"), daemon=True),
+               threading.Thread(target=_reader, args=(proc.stderr, "stderr"), daemon=True)]
+    for reader in readers:
+        reader.start()
+
+    timed_out, aborted = False, None
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        try:
+            proc.wait(timeout=POLL_INTERVAL)
+            break
+        except subprocess.TimeoutExpired:
+            pass
+        aborted = execution.poll()
+        timed_out = deadline is not None and time.monotonic() >= deadline
+        if aborted or timed_out:
+            _kill_group(proc)
+            proc.wait()
+            break
+    for reader in readers:
+        reader.join(timeout=5)  # 종료된 프로세스의 자식이 파이프를 잡고 있어도 무한 대기하지 않음
+    return ProcessOutput(proc.returncode, "".join(captured["stdout"]), "".join(captured["stderr"]), timed_out, aborted)
@@ -22,6 +22,7 @@ load_dotenv()
 # Import from main.py
 from main import graph_streaming_execution
 from src.utils.strands_sdk_utils import strands_utils
+from src.utils.tool_progress import running_executions, abort_execution
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'tech-recon-secret-key-2025'
@@ -107,6 +108,7 @@ def process_event_for_web(event, socketio_instance):
     - Reasoning events (buffered and sent on sentence boundaries)
     - Tool use events
     - Tool result events
+    - Tool progress events (live output of python_repl_tool / bash_tool)
     All other events are ignored.
     """
     if not event:
@@ -148,6 +150,19 @@ def process_event_for_web(event, socketio_instance):
         # Skip tool_use events - don't display them
         pass
 
+    elif event.get("event_type") == "tool_progress":
+        # Live output lines, heartbeats and start/end status of running code
+        log_data = {
+            'timestamp': event.get('timestamp', datetime.now().isoformat()),
+            'message': f"[{event.get('tool_name', 'tool')} {event.get('stream', 'stdout')}] {event.get('line', '')}",
+            'type': 'event',
+            'category': 'tool_progress',
+            'execution_id': event.get('execution_id'),
+            'stream': event.get('stream')
+        }
+        execution_state['logs'].append(log_data)
+        socketio_instance.emit('log', log_data)
+
     elif event.get("event_type") == "tool_result":
         tool_name = event.get("tool_name", "unknown")
 
@@ -204,8 +219,8 @@ async def run_graph_execution(user_query, socketio_instance):
             if event:
                 event_type = event.get("event_type")
 
-                # Process reasoning, tool_use, tool_result, and text_chunk
-                if event_type in ["reasoning", "tool_use", "tool_result", "text_chunk"]:
+                # Process reasoning, tool_use, tool_result, tool_progress, and text_chunk
+                if event_type in ["reasoning", "tool_use", "tool_result", "tool_progress", "text_chunk"]:
                     process_event_for_web(event, socketio_instance)
 
             await asyncio.sleep(0.001)  # Much faster processing for quicker response
@@ -292,6 +307,20 @@ def get_status():
     })
 
 
+@app.route('/api/executions')
+def get_executions():
+    """Query code executions (python_repl_tool / bash_tool) that are running now"""
+    return jsonify({'executions': running_executions()})
+
+
+@app.route('/api/abort', methods=['POST'])
+def abort_running_execution():
+    """API to abort a running code execution (all running executions if no execution_id is given)"""
+    data = request.get_json(silent=True) or {}
+    count = abort_execution(data.get('execution_id'), reason='aborted from the web UI')
+    return jsonify({'status': 'aborting' if count else 'idle', 'count': count})
+
+
 @app.route('/api/logs')
 def get_logs():
     """Query logs"""